@@ -0,0 +1,54 @@
+"""
+FFT_solid.py 的长时间版本: 同一个受驱单摆, 用辛积分器 (Yoshida 4 阶) 代替显式欧拉和 list.append
+模拟一个小时, 每 10 步记录一次, 能量有界, 不会漂移
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from physics_core.kernels import driven_pendulum_accel
+from physics_core.symplectic import integrate, pendulum_energy
+
+# 参数设置 (same as FFT_solid.py)
+L = 1.0  # 绳子长度，单位m
+g = 9.8  # 重力加速度，单位m/s²
+omega_drive = 0.05 * np.pi  # 驱动力频率，单位rad/s
+amplitude = 0.1  # 驱动力幅值，单位m
+time_step = 0.001  # 时间步长，单位s
+total_time = 3600.0  # 总时间，单位s
+num_steps = int(total_time / time_step)  # 总时间步数
+decimate = 10  # 每 10 步记录一次
+
+# 初始条件
+theta0 = np.pi / 4  # 初始角度，单位rad
+omega0 = 0.0  # 初始角速度，单位rad/s
+
+start = time.perf_counter()
+t, theta, omega = integrate(driven_pendulum_accel, (g, L, amplitude, omega_drive), theta0, omega0,
+                            time_step, num_steps, method='yoshida4', decimate=decimate)
+print(f"{num_steps} steps in {time.perf_counter() - start:.2f} s")
+
+fig, axs = plt.subplots(2, 1, figsize=(8, 8))
+
+# 图1: 角度变化 (最后 60 秒)
+last = t > total_time - 60
+axs[0].plot(t[last], theta[last, 0], label=r"$\theta$ (Angle)")
+axs[0].set_xlabel("Time (s)")
+axs[0].set_ylabel("Angle (rad)")
+axs[0].legend()
+axs[0].grid()
+
+# 图2: 能量 (驱动力使其在一个范围内摆动, 但没有长期漂移)
+axs[1].plot(t, pendulum_energy(theta[:, 0], omega[:, 0], g, L), label="Energy / (m L^2)")
+axs[1].set_xlabel("Time (s)")
+axs[1].set_ylabel("Energy")
+axs[1].legend()
+axs[1].grid()
+
+plt.tight_layout()
+plt.show()
@@ -0,0 +1,31 @@
+"""
+两球碰撞改为事件驱动: 碰撞时刻由 solve_ivp 的 terminal event 找到, 不再像 prac_lato6.py / WRONG2.py 那样事后修补, 也不会穿模
+模型和碰撞处理在 physics_core 里; 结果存在 ResultCache 中, 参数不变时再次运行直接读缓存
+"""
+
+import os
+import sys
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from physics_core import LatoPivotModel, Integrator, CollisionHandler, Renderer, ResultCache
+
+# Same constants and initial conditions as prac_lato6.py
+model = LatoPivotModel()
+integrator = Integrator(rtol=1e-8, atol=1e-10)
+
+# A sparse output grid is enough, contacts are found by the event function
+t_span = (0, 10)
+t_eval = np.linspace(t_span[0], t_span[1], 200)
+
+t, y, t_collisions = ResultCache().simulate(CollisionHandler(model), integrator, t_span, t_eval=t_eval)
+print(f"{len(t_collisions)} collisions")
+
+renderer = Renderer(model)
+fig = renderer.plot_states(t, y[[0, 2]], labels=["Ball 1 Angle (theta1)", "Ball 2 Angle (theta2)"],
+                           title="Two-Ball Pendulum with Event-Driven Collisions")
+for t_hit in t_collisions:
+    fig.axes[0].axvline(t_hit, color='gray', lw=0.5)
+plt.show()
@@ -0,0 +1,46 @@
+"""
+prac_lato3.py 的实时版本: 两个球挂在同一个振动支点上 (0.2 m, 2 Hz), 积分在后台线程里按真实时间推进,
+窗口只 blit 最新的一帧 (physics_core.live); 画得慢只会跳帧, 模拟时间照常前进
+    python live_viewer.py            # 后台线程
+    python live_viewer.py process    # 后台进程 (共享内存环形缓冲区)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from physics_core.chain import PendulumChain
+from physics_core.live import LiveSimulation, LiveViewer, StateRing
+
+mode = sys.argv[1] if len(sys.argv) > 1 else 'thread'
+
+# Constants of prac_lato3.py; both strings hang from the same point
+pivot_amp = 0.2
+pivot_freq = 2.0
+chain = PendulumChain(n_balls=2, L=1.0, m=0.1, r_ball=0.05, e=1.0, spacing=0.0,
+                      A=pivot_amp, omega_p=2 * np.pi * pivot_freq)
+theta = np.radians([10.0, -10.0])
+z = np.zeros(2)
+a = chain.accel(0.0, theta, np.empty(2))
+
+
+def step(t, state, dt):
+    chain.step(t, state[0], state[1], dt, a)
+    return state
+
+
+def positions(t, theta):
+    anchors, balls = chain.positions(t, theta[None])
+    return anchors[0], balls[0]
+
+
+ring = StateRing(2, shared=(mode == 'process'))
+simulation = LiveSimulation(step, np.stack([theta, z]), ring, dt=1e-4, publish_every=50,
+                            publish=lambda state: state[0], mode=mode)
+with simulation:
+    viewer = LiveViewer(chain, ring, fps=60, positions=positions)
+    viewer.show()
+print(f"{viewer.frames} frames shown, {viewer.skipped} simulation states skipped")
+ring.close()
@@ -0,0 +1,34 @@
+"""
+频率扫描: simul.py / simulConst.py / NewRevise.py 只差 F0, 这里一次算出多个 F0 的频率响应曲线
+计算分给所有 CPU 核心, 见 physics_core/ensemble.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from physics_core.ensemble import frequency_response
+
+# Parameters
+k = 10.0                               # Spring constant (N/m)
+F0_values = [1.0, 10.0, 100.0]         # External force amplitudes of NewRevise.py, simulConst.py, simul.py (N)
+omegas = np.linspace(0.2, 8.0, 120)    # Forcing frequencies (rad/s)
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    amplitude = frequency_response(omegas, k=k, F0=F0_values)
+    print(f"{amplitude.size} solves in {time.perf_counter() - start:.2f} s")
+
+    plt.figure(figsize=(10, 6))
+    for F0, curve in zip(F0_values, amplitude):
+        plt.semilogy(omegas, curve, label=f"F0 = {F0:g} N")
+    plt.xlabel("Forcing frequency omega (rad/s)")
+    plt.ylabel("Steady-state amplitude of y (m)")
+    plt.title("Frequency Response of the V-Spring System")
+    plt.grid(True)
+    plt.legend()
+    plt.show()
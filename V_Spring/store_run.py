@@ -0,0 +1,36 @@
+"""
+simul.py 的运动方程解一次, 存进 physics_core.store; 之后画图直接读存储, 不用再 odeint
+    python store_run.py          # 解一次并保存
+    python store_run.py plot     # 只读 5-10 s 的 x, y
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from physics_core import VSpringModel, Integrator
+from physics_core.store import TrajectoryStore, save_solution
+
+path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runs", "v_spring.traj")
+
+if sys.argv[1:] == ["plot"]:
+    import matplotlib.pyplot as plt
+
+    store = TrajectoryStore(path)
+    print(f"{store.attrs['model']} {store.attrs['params']}")
+    t, x = store.window('x', 5.0, 10.0)
+    _, y = store.window('y', 5.0, 10.0)
+    plt.plot(x, y)
+    plt.xlabel("x (m)")
+    plt.ylabel("y (m)")
+    plt.title("V_Spring trajectory, 5-10 s")
+    plt.show()
+else:
+    # Same constants and time grid as simul.py
+    model = VSpringModel()
+    t = np.arange(0, 20, 0.01)
+    sol = Integrator(rtol=1e-6, atol=1e-8).solve(model, (t[0], t[-1]), t_eval=t)
+    store = save_solution(path, model, sol.t, sol.y, overwrite=True)
+    print(f"{len(store)} samples of {', '.join(store.variables)} written to {path}")
@@ -0,0 +1,9 @@
+"""
+基准测试: 每个模型和每个流水线环节 (右端函数, 碰撞, odeint, 水面波动, FFT, GIF 导出) 各有计时用例
+用例的写法借用 asv 的约定 (bench_*.py 里的 time_* 函数或带 setup / params 的类), 但仓库没有 asv 的配置,
+由 run.py 运行 (只用标准库), 结果追加到 results/history.jsonl, 和上一次的结果比较
+
+    python -m benchmarks.run                  # 全部用例, 结果记入历史
+    python -m benchmarks.run -k bowl --quick  # 只跑名字里有 bowl 的, 少重复几次
+    python -m benchmarks.run --compare        # 和历史里上一次的结果比较, 变慢的标出来
+"""
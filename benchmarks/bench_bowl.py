@@ -0,0 +1,33 @@
+"""
+碗中水面 (bowlSound/simul_1.py 的 wave_equation, 包里是 WaveSolver): 不同网格大小和精度下的时间步
+"""
+
+import numpy as np
+
+from physics_core import BowlGrid, WaveSolver
+
+
+class WaveStep:
+    """
+    Ten leapfrog steps on an n x n grid; the cost per step should grow with n^2.
+    """
+    params = ([100, 250, 500, 1000], ['float32', 'float64'])
+    param_names = ['grid_points', 'dtype']
+
+    def setup(self, grid_points, dtype):
+        self.solver = WaveSolver(BowlGrid(grid_points=grid_points), dtype=getattr(np, dtype))
+        self.solver.step()
+
+    def time_step(self, grid_points, dtype):
+        self.solver.step(10)
+
+
+class WaveSetup:
+    """
+    Building the grid, the forcing field and the solver buffers.
+    """
+    params = [250, 1000]
+    param_names = ['grid_points']
+
+    def time_setup(self, grid_points):
+        WaveSolver(BowlGrid(grid_points=grid_points))
@@ -0,0 +1,102 @@
+"""
+碰撞: 两球模型的 gap / handle_collision (apply_impulse) 和整段事件驱动积分, 批量冲量, 多球的宽相和接触
+"""
+
+import numpy as np
+
+from physics_core import CollisionHandler, ImpulseSolver2D, Integrator, LatoPivotModel, PendulumChain, \
+    PendulumCloud, SpatialHash
+
+
+class TwoBall:
+    """
+    The per-contact work of CollisionHandler: the event function and the impulse.
+    """
+
+    def setup(self):
+        self.handler = CollisionHandler(LatoPivotModel(e=0.9))
+        self.y = np.array([0.05, 1.0, -0.05, -1.0])
+
+    def time_gap(self):
+        self.handler.gap(0.0, self.y)
+
+    def time_handle_collision(self):
+        self.handler.apply_impulse(self.y)
+
+
+class EventSimulation:
+    """
+    CollisionHandler.simulate over 10 s with a vibrating pivot, restarting at every impact.
+    """
+
+    def setup(self):
+        self.handler = CollisionHandler(LatoPivotModel(e=0.9, A=0.2))
+        self.t_eval = np.linspace(0, 10, 1000)
+
+    def time_simulate(self):
+        self.handler.simulate(Integrator(rtol=1e-8, atol=1e-10), (0, 10), t_eval=self.t_eval)
+
+
+class Impulses:
+    """
+    ImpulseSolver2D.resolve on n ball pairs, about half of them in approaching contact.
+    """
+    params = [1000, 100000]
+    param_names = ['n_pairs']
+
+    def setup(self, n):
+        rng = np.random.default_rng(0)
+        self.solver = ImpulseSolver2D(n, m1=0.1, m2=0.1, e=0.9, radius=0.05)
+        self.x1, self.y1 = rng.uniform(-1, 1, n), rng.uniform(-1, 1, n)
+        angle = rng.uniform(0, 2 * np.pi, n)
+        self.x2, self.y2 = self.x1 + 0.12 * np.cos(angle), self.y1 + 0.12 * np.sin(angle)
+        self.v = rng.normal(size=(4, n))
+
+    def time_resolve(self, n):
+        # Velocities change in place; the contacts stay, only their number drifts between calls
+        self.solver.resolve(self.x1, self.y1, self.v[0], self.v[1], self.x2, self.y2, self.v[2], self.v[3])
+
+
+class BroadPhase:
+    """
+    SpatialHash.pairs on a moving cloud of n balls (the order from the previous call is reused).
+    """
+    params = [1000, 10000]
+    param_names = ['n_balls']
+
+    def setup(self, n):
+        rng = np.random.default_rng(0)
+        side = np.sqrt(n) * 0.15
+        self.x, self.y = rng.uniform(0, side, n), rng.uniform(0, side, n)
+        self.dx = rng.normal(scale=1e-3, size=n)
+        self.grid = SpatialHash(0.1)
+        self.grid.pairs(self.x, self.y)
+
+    def time_pairs(self, n):
+        self.x += self.dx
+        self.grid.pairs(self.x, self.y)
+
+
+class Chains:
+    """
+    One velocity Verlet step with contacts: Newton's cradle of 5 balls and a cloud of n pendulums.
+    """
+    params = [5, 1000]
+    param_names = ['n_balls']
+
+    def setup(self, n):
+        if n <= 5:
+            self.chain = PendulumChain(n_balls=n, e=1.0)
+            self.theta = np.zeros(n)
+            self.theta[0] = -0.5
+        else:
+            rng = np.random.default_rng(0)
+            side = int(np.ceil(np.sqrt(n)))
+            pivots = np.stack(np.divmod(np.arange(n), side), axis=1) * np.array([0.12, 0.5])
+            self.chain = PendulumCloud(pivots, L=rng.uniform(0.2, 0.4, n), e=0.9)
+            self.theta = rng.uniform(-0.3, 0.3, n)
+        self.z = np.zeros(n)
+        self.a = self.chain.accel(0.0, self.theta, np.empty(n))
+
+    def time_step(self, n):
+        self.chain.step(0.0, self.theta, self.z, 1e-4, self.a)
@@ -0,0 +1,47 @@
+"""
+动画导出: 150 帧的 GIF, 直接光栅化 (Renderer.export) 和 matplotlib Agg (Renderer.export_agg), 出图和编码分开计时
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from physics_core import FrameRasterizer, Integrator, LatoPivotModel, Renderer, render_frames
+from physics_core.raster import save_gif
+
+
+class GifExport:
+    """
+    5 s of the two-ball Lato at 30 fps in a single process (workers=1), so the numbers do not
+    depend on the core count; parallel speed-ups are the business of the demos.
+    """
+    timeout = 300
+
+    def setup(self):
+        self.directory = tempfile.mkdtemp(prefix='physics_core_bench_')
+        self.model = LatoPivotModel()
+        self.t = np.linspace(0, 5, 150)
+        self.y = Integrator().solve(self.model, (0, 5), t_eval=self.t).y
+        anchors, balls = self.model.positions(self.t, self.y)
+        self.anchors, self.balls = anchors, balls
+        self.rasterizer = FrameRasterizer(self.model.extent(), size=400)
+        self.frames = list(render_frames(self.rasterizer, anchors, balls, workers=1))
+
+    def teardown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_rasterize(self):
+        for _ in render_frames(self.rasterizer, self.anchors, self.balls, workers=1):
+            pass
+
+    def time_encode_gif(self):
+        save_gif(self.frames, os.path.join(self.directory, 'encode.gif'))
+
+    def time_export(self):
+        Renderer(self.model).export(self.t, self.y, os.path.join(self.directory, 'raster.gif'), workers=1)
+
+    def time_export_agg(self):
+        Renderer(self.model).export_agg(self.t, self.y, os.path.join(self.directory, 'agg.gif'), dpi=60,
+                                        workers=1)
@@ -0,0 +1,90 @@
+"""
+模型右端函数和积分: Lato 各模型的 rhs, 批量 rhs, V_Spring 的 odeint (和 simul.py 同样的设置)
+"""
+
+import numpy as np
+
+from physics_core import Integrator, get_model
+
+
+class ModelRHS:
+    """
+    One right-hand side call, as solve_ivp makes it (new array) and as fixed-step loops do (into out).
+    """
+    params = ['lato_pivot', 'lato_rigid', 'lato_polar', 'v_spring']
+    param_names = ['model']
+
+    def setup(self, name):
+        self.model = get_model(name)
+        self.y = self.model.y0()
+        self.out = np.empty(self.model.n_state)
+        # First call compiles the kernel when numba is there, keep that out of the timings
+        self.model.rhs(0.0, self.y)
+
+    def time_rhs(self, name):
+        self.model.rhs(0.1, self.y)
+
+    def time_rhs_into(self, name):
+        self.model.rhs_into(0.1, self.y, self.out)
+
+
+class BatchRHS:
+    """
+    Right-hand side of a (n_state, N) stack of runs, the inner loop of Integrator.solve_batch.
+    """
+    params = (['lato_pivot', 'lato_rigid'], [100, 10000])
+    param_names = ['model', 'n_runs']
+
+    def setup(self, name, n_runs):
+        model = get_model(name)
+        self.rhs = model.batch_rhs()
+        self.Y = np.repeat(model.y0()[:, None], n_runs, axis=1)
+        self.out = np.empty_like(self.Y)
+        self.rhs(0.0, self.Y, self.out)
+
+    def time_batch_rhs(self, name, n_runs):
+        self.rhs(0.1, self.Y, self.out)
+
+
+class VSpringOdeint:
+    """
+    V_Spring/simul.py: odeint over t = 0 .. 20 s every 0.01 s, rtol 1e-6, atol 1e-8.
+    """
+
+    def setup(self):
+        from scipy.integrate import odeint
+
+        self.odeint = odeint
+        self.model = get_model('v_spring')
+        self.y0 = self.model.y0()
+        self.t = np.arange(0, 20, 0.01)
+        self.model.rhs(0.0, self.y0)
+
+    def time_odeint(self):
+        self.odeint(self.model.rhs, self.y0, self.t, rtol=1e-6, atol=1e-8, tfirst=True)
+
+    def time_solve_ivp(self):
+        Integrator(method='auto', rtol=1e-6, atol=1e-8).solve(self.model, (0, 20), t_eval=self.t)
+
+
+class LatoSolve:
+    """
+    One adaptive solve of every Lato model over 10 s at solve_ivp's default tolerances, as the Lato
+    scripts do (lato_polar runs into its singularity before 10 s at tight ones).
+    """
+    params = ['lato_pivot', 'lato_rigid', 'lato_polar']
+    param_names = ['model']
+
+    def setup(self, name):
+        self.model = get_model(name)
+        self.t_eval = np.linspace(0, 10, 1000)
+        self.model.rhs(0.0, self.model.y0())
+
+    def time_solve(self, name):
+        Integrator().solve(self.model, (0, 10), t_eval=self.t_eval)
+
+
+def time_solve_batch_100_runs():
+    # Fixed-step RK4 over an omega_drive sweep, as in Lato/batch_sweep.py
+    model = get_model('lato_rigid')
+    Integrator().solve_batch(model, np.linspace(0, 10, 1000), omega_drive=np.linspace(0.5, 6.0, 100))
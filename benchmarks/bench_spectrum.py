@@ -0,0 +1,63 @@
+"""
+频谱分析: Lato/FFT_*.py 那样对整段信号做 FFT, 分块的 StreamingSpectrum, 扫频结果的共振峰表
+"""
+
+import numpy as np
+
+from physics_core import StreamingSpectrum, peak_table
+
+
+def _signal(n, fs=1000.0):
+    t = np.arange(n) / fs
+    rng = np.random.default_rng(0)
+    return np.sin(2 * np.pi * 3.0 * t) + 0.3 * np.sin(2 * np.pi * 7.5 * t) + 0.05 * rng.normal(size=n)
+
+
+class FullFFT:
+    """
+    Spectrum of one whole trajectory component, as in FFT_compare.py.
+    """
+    params = [2**14, 10**5, 2**20]
+    param_names = ['n_samples']
+
+    def setup(self, n):
+        self.x = _signal(n)
+
+    def time_fft(self, n):
+        np.abs(np.fft.fft(self.x))
+
+    def time_rfft(self, n):
+        np.abs(np.fft.rfft(self.x))
+
+
+class Streaming:
+    """
+    StreamingSpectrum fed 100 s at 1 kHz in blocks of 1000 samples.
+    """
+    params = [1024, 4096]
+    param_names = ['nperseg']
+
+    def setup(self, nperseg):
+        self.blocks = _signal(100000).reshape(-1, 1000)
+        self.nperseg = nperseg
+
+    def time_feed(self, nperseg):
+        analyzer = StreamingSpectrum(fs=1000.0, nperseg=nperseg)
+        for block in self.blocks:
+            analyzer.feed(block)
+        analyzer.welch()
+
+
+class Peaks:
+    """
+    peak_table over a sweep of N runs of 20 000 samples each.
+    """
+    params = [10, 200]
+    param_names = ['n_runs']
+
+    def setup(self, n_runs):
+        self.signals = np.tile(_signal(20000), (n_runs, 1))
+        self.sweep = np.linspace(0.5, 6.0, n_runs)
+
+    def time_peak_table(self, n_runs):
+        peak_table(self.signals, 1000.0, params=self.sweep)
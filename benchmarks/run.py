@@ -0,0 +1,304 @@
+"""
+基准测试的运行器, 只用标准库: 找出 benchmarks/bench_*.py 里的用例, 计时, 把结果连同 commit 和机器信息
+追加成 results/history.jsonl 的一行; 同一台机器上按 commit 对比就能看出哪次提交变慢了
+全程离线, 只用 CPU; 图形后端固定为 Agg, 导出用例只写临时目录
+
+    python -m benchmarks.run                        # 全部用例
+    python -m benchmarks.run -k WaveStep --quick    # 名字过滤, 少计几次
+    python -m benchmarks.run --compare              # 再和这台机器上一次的结果比较
+    python -m benchmarks.run --compare 9ad9daa      # 和某个 commit 的结果比较
+    python -m benchmarks.run --no-run --compare     # 不计时, 比较历史里最近两次
+    python -m benchmarks.run --list
+
+每行是一个 JSON 对象: commit, dirty, date, machine (Python / 库版本, CPU 数, 有没有 numba),
+results (每个用例每次调用的 min / median / stdev 秒数, 调用次数, 出错时是 error)
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from datetime import datetime, timezone
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+HISTORY = os.path.join(ROOT, 'benchmarks', 'results', 'history.jsonl')
+# (seconds per sample, samples, budget per case) of a full and a quick run
+SETTINGS = {'full': (0.2, 7, 20.0), 'quick': (0.05, 3, 3.0)}
+
+
+class Case:
+    """
+    One timed function with one combination of parameters, asv style: a module-level time_*
+    function, or a time_* method of a class with optional setup / teardown / params / param_names.
+    """
+
+    def __init__(self, module, cls, method, params, names):
+        self.module, self.cls, self.method = module, cls, method
+        self.params = params
+        self.names = names
+        owner = module.__name__.rsplit('.', 1)[-1]
+        base = f"{owner}.{cls.__name__}.{method}" if cls else f"{owner}.{method}"
+        self.name = f"{base}[{'-'.join(map(str, params))}]" if params else base
+
+    def prepare(self):
+        """
+        Runs setup; returns (function to time, teardown).
+        """
+        if self.cls is None:
+            return getattr(self.module, self.method), lambda: None
+        instance = self.cls()
+        if hasattr(instance, 'setup'):
+            instance.setup(*self.params)
+        function = getattr(instance, self.method)
+        teardown = getattr(instance, 'teardown', lambda *params: None)
+        return lambda: function(*self.params), lambda: teardown(*self.params)
+
+
+def _param_grid(cls):
+    names = list(getattr(cls, 'param_names', []))
+    params = getattr(cls, 'params', [])
+    if not names and not params:
+        return names, [()]
+    # A single parameter may be given as a plain list, several as a list of lists
+    lists = [params] if len(names) == 1 else list(params)
+    names = names or [f"param{k + 1}" for k in range(len(lists))]
+    return names, list(itertools.product(*lists))
+
+
+def discover(pattern=None):
+    """
+    All cases of benchmarks/bench_*.py whose name contains `pattern`, in file order.
+    """
+    directory = os.path.join(ROOT, 'benchmarks')
+    cases = []
+    for filename in sorted(os.listdir(directory)):
+        if not (filename.startswith('bench_') and filename.endswith('.py')):
+            continue
+        module = importlib.import_module(f"benchmarks.{filename[:-3]}")
+        for attribute, value in vars(module).items():
+            if attribute.startswith('time_') and callable(value):
+                cases.append(Case(module, None, attribute, (), []))
+            elif isinstance(value, type) and value.__module__ == module.__name__:
+                methods = [name for name in vars(value) if name.startswith('time_')]
+                names, grid = _param_grid(value)
+                for method in methods:
+                    cases.extend(Case(module, value, method, params, names) for params in grid)
+    return [case for case in cases if pattern is None or pattern in case.name]
+
+
+def measure(function, sample_time, samples, budget):
+    """
+    Seconds per call: calls are grouped so that one sample lasts about `sample_time`, like
+    timeit's autorange; sampling stops early (after two samples) once `budget` is spent.
+    """
+    function()  # warm-up: lazy imports, JIT compilation, caches
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= sample_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(sample_time / elapsed) + 1))
+    timings = [elapsed / number]
+    spent = elapsed
+    while len(timings) < samples and (len(timings) < 2 or spent < budget):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed / number)
+        spent += elapsed
+    return timings, number
+
+
+def run(cases, mode='full', stream=sys.stderr):
+    sample_time, samples, budget = SETTINGS[mode]
+    results = []
+    for case in cases:
+        record = {'name': case.name, 'params': dict(zip(case.names, case.params))}
+        try:
+            function, teardown = case.prepare()
+        except NotImplementedError:
+            # asv convention: setup raising NotImplementedError skips the case
+            continue
+        except Exception:
+            record['error'] = traceback.format_exc(limit=3)
+            print(f"{case.name:<60} setup failed", file=stream)
+            results.append(record)
+            continue
+        try:
+            timings, number = measure(function, sample_time, samples, budget)
+        except Exception:
+            record['error'] = traceback.format_exc(limit=3)
+            print(f"{case.name:<60} failed", file=stream)
+        else:
+            record.update(min=min(timings), median=statistics.median(timings),
+                          stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                          number=number, repeat=len(timings))
+            print(f"{case.name:<60} {format_time(record['median']):>10}  (min {format_time(record['min'])})",
+                  file=stream)
+        finally:
+            teardown()
+        results.append(record)
+    return results
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _git(*args):
+    try:
+        done = subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return done.stdout.strip() if done.returncode == 0 else None
+
+
+def _version(module):
+    try:
+        return importlib.import_module(module).__version__
+    except Exception:
+        return None
+
+
+def environment():
+    """
+    Commit and machine description stored with every run.
+    """
+    from physics_core import kernels
+
+    status = _git('status', '--porcelain', '--untracked-files=no')
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'dirty': None if status is None else bool(status),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'machine': {
+            'node': platform.node(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'python': platform.python_version(),
+            'numpy': _version('numpy'),
+            'scipy': _version('scipy'),
+            'matplotlib': _version('matplotlib'),
+            'PIL': _version('PIL'),
+            'numba': _version('numba') if kernels.HAVE_NUMBA else None,
+            'jit': kernels.HAVE_NUMBA and kernels.JIT_ENABLED,
+        },
+    }
+
+
+def load_history(path=HISTORY):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(entry, path=HISTORY):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def find_baseline(history, entry, ref=None):
+    """
+    The latest earlier run on the same machine, or the latest one of commit `ref` (a prefix).
+    """
+    for candidate in reversed(history):
+        if candidate is entry:
+            continue
+        if ref is not None:
+            if (candidate.get('commit') or '').startswith(ref):
+                return candidate
+        elif candidate['machine'].get('node') == entry['machine'].get('node'):
+            return candidate
+    return None
+
+
+def compare(baseline, entry, threshold=1.2, stream=sys.stdout):
+    """
+    Prints the median time ratio of every case both runs have; returns the names of the cases
+    slower by more than `threshold`.
+    """
+    before = {record['name']: record for record in baseline['results'] if 'median' in record}
+    print(f"baseline {(baseline.get('commit') or '?')[:10]} ({baseline['date']})  ->  "
+          f"{(entry.get('commit') or '?')[:10]}{' (dirty)' if entry.get('dirty') else ''} ({entry['date']})",
+          file=stream)
+    slower = []
+    for record in entry['results']:
+        old = before.get(record['name'])
+        if old is None or 'median' not in record:
+            continue
+        ratio = record['median'] / old['median']
+        flag = ''
+        if ratio > threshold:
+            flag = 'slower'
+            slower.append(record['name'])
+        elif ratio < 1 / threshold:
+            flag = 'faster'
+        print(f"{record['name']:<60} {format_time(old['median']):>10} {format_time(record['median']):>10} "
+              f"{ratio:6.2f}x {flag}", file=stream)
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='pattern', help="only cases whose name contains this")
+    parser.add_argument('--quick', action='store_true', help="fewer, shorter samples")
+    parser.add_argument('--list', action='store_true', help="list the cases and exit")
+    parser.add_argument('--compare', nargs='?', const='', metavar='COMMIT',
+                        help="compare with the previous run on this machine, or with the run of COMMIT")
+    parser.add_argument('--threshold', type=float, default=1.2, help="ratio flagged as a slowdown (default 1.2)")
+    parser.add_argument('--no-run', action='store_true', help="compare the newest stored run instead of timing")
+    parser.add_argument('--no-save', action='store_true', help="do not append to the history")
+    parser.add_argument('--strict', action='store_true', help="exit with status 1 when a case got slower")
+    parser.add_argument('--history', default=HISTORY, help=f"history file (default {os.path.relpath(HISTORY)})")
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    if args.no_run:
+        if not history:
+            parser.error(f"no runs in {args.history}")
+        entry = history[-1]
+    else:
+        cases = discover(args.pattern)
+        if args.list:
+            print('\n'.join(case.name for case in cases))
+            return 0
+        entry = environment()
+        entry['mode'] = 'quick' if args.quick else 'full'
+        entry['results'] = run(cases, entry['mode'])
+        if not args.no_save:
+            append_history(entry, args.history)
+
+    if args.compare is None:
+        return 0
+    baseline = find_baseline(history, entry, args.compare or None)
+    if baseline is None:
+        print("no earlier run to compare with", file=sys.stderr)
+        return 0
+    slower = compare(baseline, entry, args.threshold)
+    return 1 if args.strict and slower else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""
+在 simul_1.py 的基础上加入水面的空间耦合: 真正的二维波动方程, 碗壁反射
+求解器在 physics_core/bowl.py; 每一帧由生成器直接交给编码器, 不再把整个解存下来, 内存不随帧数增长
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from physics_core.bowl import BowlGrid, WaveSolver, surface_frames
+from physics_core.raster import field_frames, field_palette, save_frames
+
+# Parameters
+bowl_radius = 1.0      # Radius of the bowl
+grid_points = 1000     # Number of points for simulation grid
+time_steps = 20        # Frames for animation
+dt = 0.005             # Time step for animation
+image_size = 500       # Pixels of the output frames
+
+grid = BowlGrid(bowl_radius, grid_points)
+solver = WaveSolver(grid, wave_speed=0.5, damping=0.1, nonlinearity=0.2, forcing_amplitude=10.0)
+
+# solver -> surface field -> palette frame -> GIF, one frame at a time
+surfaces = surface_frames(solver, time_steps, dt)
+frames = field_frames(surfaces, size=image_size, vmin=-1, vmax=1)
+save_frames(frames, "bowl_water_simulation.gif", palette=field_palette('viridis'), fps=50)
@@ -0,0 +1,75 @@
+"""
+Lato / V_Spring / bowlSound 脚本共用的物理部分: 模型, 积分器, 碰撞, 绘图, 碗中水面
+导入时不会创建图形, 也不会导入 matplotlib; 各子模块在第一次用到时才导入, 批量任务只加载数值部分
+
+    from physics_core import LatoPivotModel, Integrator, CollisionHandler
+    model = LatoPivotModel(e=0.9)
+    t, y, t_collisions = CollisionHandler(model).simulate(Integrator(rtol=1e-8, atol=1e-10), (0, 10))
+"""
+
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first access (PEP 562), so
+# `import physics_core` costs next to nothing and a numeric run never loads the plotting,
+# multiprocessing or storage code it does not use
+_EXPORTS = {
+    'get_dtype': ('precision', 'get_dtype'),
+    'set_precision': ('precision', 'set_precision'),
+    'using_precision': ('precision', 'using_precision'),
+    'Model': ('models', 'Model'),
+    'LatoPivotModel': ('models', 'LatoPivotModel'),
+    'LatoRigidModel': ('models', 'LatoRigidModel'),
+    'LatoPolarModel': ('models', 'LatoPolarModel'),
+    'VSpringModel': ('models', 'VSpringModel'),
+    'MODELS': ('models', 'MODELS'),
+    'get_model': ('models', 'get_model'),
+    'Integrator': ('integrators', 'Integrator'),
+    'DenseTrajectory': ('dense', 'DenseTrajectory'),
+    'rk4_batch': ('integrators', 'rk4_batch'),
+    'integrate_symplectic': ('symplectic', 'integrate'),
+    'integrate_symplectic_model': ('symplectic', 'integrate_model'),
+    'StreamingSpectrum': ('spectrum', 'StreamingSpectrum'),
+    'peak_table': ('spectrum', 'peak_table'),
+    'format_peak_table': ('spectrum', 'format_peak_table'),
+    'CollisionHandler': ('collisions', 'CollisionHandler'),
+    'PendulumChain': ('chain', 'PendulumChain'),
+    'PendulumCloud': ('chain', 'PendulumCloud'),
+    'sweep_and_prune': ('contacts', 'sweep_and_prune'),
+    'ImpulseSolver2D': ('contacts', 'ImpulseSolver2D'),
+    'SpatialHash': ('contacts', 'SpatialHash'),
+    'Renderer': ('renderer', 'Renderer'),
+    'FrameRasterizer': ('raster', 'FrameRasterizer'),
+    'render_frames': ('raster', 'render_frames'),
+    'render_agg': ('agg', 'render_agg'),
+    'StateRing': ('live', 'StateRing'),
+    'LiveSimulation': ('live', 'LiveSimulation'),
+    'LiveViewer': ('live', 'LiveViewer'),
+    'save_frames': ('raster', 'save_frames'),
+    'run_ensemble': ('ensemble', 'run_ensemble'),
+    'frequency_response': ('ensemble', 'frequency_response'),
+    'EnsembleResult': ('ensemble', 'EnsembleResult'),
+    'TrajectoryStore': ('store', 'TrajectoryStore'),
+    'save_solution': ('store', 'save_solution'),
+    'ResultCache': ('cache', 'ResultCache'),
+    'BowlGrid': ('bowl', 'BowlGrid'),
+    'WaveSolver': ('bowl', 'WaveSolver'),
+    'FieldSource': ('bowl', 'FieldSource'),
+    'FieldSources': ('bowl', 'FieldSources'),
+    'bowl_vibration': ('bowl', 'bowl_vibration'),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
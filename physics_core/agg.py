@@ -0,0 +1,192 @@
+"""
+并行 matplotlib 出图: 轨迹 (支点和小球的位置) 放进 multiprocessing.shared_memory, 每个工作进程有自己的 Agg 画布,
+按帧区间分工画图, 主进程按顺序收回帧交给编码器 (GIF 用 Pillow, MP4 用 ffmpeg)
+画面和 Renderer.animate (FuncAnimation) 一样, 但不再由一个核一帧一帧地画
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import shared_memory
+
+import numpy as np
+
+COLORS = ('r', 'b', 'g', 'm', 'c', 'y')
+
+# State of a worker process, set up once by _init_worker
+_worker = {}
+
+
+def _share(array):
+    """
+    Copies an array into a new shared memory block; returns (block, (name, shape, dtype)).
+    """
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach(spec):
+    name, shape, dtype = spec
+    # Pool workers share the parent's resource tracker, the parent unlinks the block when done
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+class _Scene:
+    """
+    One Agg figure with a line per body, redrawn by blitting the lines onto a cached background.
+    """
+
+    def __init__(self, n_bodies, extent, figsize=(6, 6), dpi=100, colors=COLORS, legend=True):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot()
+        xmin, xmax, ymin, ymax = extent
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+        ax.set_aspect('equal')
+        self.lines = []
+        for i in range(n_bodies):
+            line, = ax.plot([], [], 'o-', color=colors[i % len(colors)], lw=2, label=f"Ball {i + 1}",
+                            animated=True)
+            self.lines.append(line)
+        if legend and n_bodies <= len(colors):
+            ax.legend()
+        self.ax = ax
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def draw(self, anchors, balls):
+        """
+        Draws one frame (anchors and balls are (n_bodies, 2)); returns the canvas as an RGBA view
+        (H, W, 4), valid until the next draw.
+        """
+        self.canvas.restore_region(self.background)
+        for i, line in enumerate(self.lines):
+            line.set_data([anchors[i, 0], balls[i, 0]], [anchors[i, 1], balls[i, 1]])
+            self.ax.draw_artist(line)
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def frame(self, anchors, balls, palette=None):
+        """
+        One frame as palette indices (H, W), or as an RGB copy (H, W, 3) without a palette.
+        """
+        rgba = self.draw(anchors, balls)
+        return rgba[..., :3].copy() if palette is None else palette(rgba)
+
+
+class _Palette:
+    """
+    One 256-color palette for a whole animation, built from a few reference frames (RGBA) so
+    that every process derives the same one and the GIF frames do not flicker.
+    """
+
+    def __init__(self, frames):
+        from PIL import Image
+
+        reference = Image.fromarray(np.ascontiguousarray(np.concatenate(frames, axis=0)[..., :3]))
+        self.image = reference.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+        colors = np.asarray(self.image.getpalette(), dtype=np.uint8).reshape(-1, 3)[:256]
+        self.colors = np.zeros((256, 3), dtype=np.uint8)
+        self.colors[:len(colors)] = colors
+
+    def __call__(self, frame):
+        """
+        (H, W) palette indices of a contiguous RGBA frame (the Agg buffer), nearest colors.
+        """
+        from PIL import Image
+
+        height, width = frame.shape[:2]
+        image = Image.frombuffer('RGBA', (width, height), frame, 'raw', 'RGBA', 0, 1).convert('RGB')
+        return np.asarray(image.quantize(palette=self.image, dither=Image.Dither.NONE))
+
+
+def _reference_frames(scene, anchors, balls):
+    return [scene.draw(anchors[k], balls[k]).copy() for k in np.linspace(0, len(balls) - 1, 4).astype(int)]
+
+
+def _init_worker(specs, scene_args, quantize):
+    blocks, arrays = zip(*(_attach(spec) for spec in specs))
+    _worker['blocks'] = blocks  # the arrays are views into these
+    _worker['anchors'], _worker['balls'] = arrays
+    _worker['scene'] = _Scene(arrays[1].shape[1], **scene_args)
+    _worker['palette'] = _Palette(_reference_frames(_worker['scene'], *arrays)) if quantize else None
+
+
+def _render_range(start, stop):
+    scene, anchors, balls, palette = _worker['scene'], _worker['anchors'], _worker['balls'], _worker['palette']
+    return [scene.frame(anchors[k], balls[k], palette) for k in range(start, stop)]
+
+
+def _worker_palette():
+    return _worker['palette'].colors
+
+
+def render_agg(anchors, balls, extent, workers=None, chunk_size=16, quantize=False, **scene_args):
+    """
+    Yields the frames of (T, n_bodies, 2) anchor / ball positions in order as RGB (H, W, 3)
+    arrays. With quantize=True it yields (H, W) indices into the (256, 3) palette that is yielded
+    first; the quantization then also runs in the workers.
+
+    The positions are copied once into shared memory; every worker process attaches to it, builds
+    its own Agg figure and renders ranges of `chunk_size` frames. At most two ranges per worker
+    are in flight, so memory stays bounded however long the animation is.
+    scene_args go to the figure: figsize, dpi, colors, legend. workers=1 renders in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    n_frames = len(balls)
+    ranges = [(start, min(start + chunk_size, n_frames)) for start in range(0, n_frames, chunk_size)]
+
+    if workers <= 1 or len(ranges) <= 1:
+        scene = _Scene(balls.shape[1], extent, **scene_args)
+        palette = _Palette(_reference_frames(scene, anchors, balls)) if quantize else None
+        if quantize:
+            yield palette.colors
+        for k in range(n_frames):
+            yield scene.frame(anchors[k], balls[k], palette)
+        return
+
+    scene_args = dict(scene_args, extent=extent)
+    blocks = []
+    try:
+        specs = []
+        for array in (anchors, balls):
+            block, spec = _share(np.asarray(array, dtype=float))
+            blocks.append(block)
+            specs.append(spec)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(specs, scene_args, quantize)) as pool:
+            if quantize:
+                # Every worker derives the same palette, any of them can hand it out
+                yield pool.submit(_worker_palette).result()
+            queued = iter(ranges)
+            pending = [pool.submit(_render_range, *frame_range) for frame_range in islice(queued, 2 * workers)]
+            while pending:
+                frames = pending.pop(0).result()
+                following = next(queued, None)
+                if following is not None:
+                    pending.append(pool.submit(_render_range, *following))
+                yield from frames
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def save_agg(frames, filename, fps=30):
+    """
+    Writes the frames of render_agg: MP4 from RGB frames, GIF from quantized ones.
+    """
+    from .raster import save_gif, save_mp4
+
+    if filename.lower().endswith(".mp4"):
+        save_mp4(frames, filename, palette=None, fps=fps)
+    else:
+        frames = iter(frames)
+        save_gif(frames, filename, palette=next(frames), fps=fps)
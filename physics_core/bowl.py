@@ -0,0 +1,263 @@
+"""
+碗中水面的二维波动方程: 五点差分拉普拉斯算子, 碗壁 (R > bowl_radius) 处为反射边界
+用 leapfrog 格式原地更新; 求解器自己只有四张网格大小的数组 (两层位移, 一张工作数组, 对角项),
+网格上另有水面掩码, R 和缓存的振动包络, 都不随帧数增长
+"""
+
+import numpy as np
+
+from .precision import get_dtype
+
+
+class BowlGrid:
+    """
+    Square grid over the bowl with the circular water mask R <= bowl_radius.
+    """
+
+    def __init__(self, bowl_radius=1.0, grid_points=1000):
+        self.bowl_radius = bowl_radius
+        self.grid_points = grid_points
+        self.x = np.linspace(-bowl_radius, bowl_radius, grid_points)
+        self.y = np.linspace(-bowl_radius, bowl_radius, grid_points)
+        self.spacing = self.x[1] - self.x[0]
+        X, Y = np.meshgrid(self.x, self.y, sparse=True)
+        self.R = np.sqrt(X**2 + Y**2)
+        self.mask = self.R <= bowl_radius
+        self._envelopes = {}
+
+    def envelope(self, kind='gaussian', dtype=np.float32, **params):
+        """
+        Spatial envelope of a vibration mode, computed once per grid and shared by all sources.
+        gaussian: exp(-(R / width)^2), built from its two separable 1D factors;
+        radial: cos(pi * k * R / (2 * bowl_radius)), k odd gives zero slope at the centre.
+        """
+        key = (kind, np.dtype(dtype).str, tuple(sorted(params.items())))
+        envelope = self._envelopes.get(key)
+        if envelope is None:
+            if kind == 'gaussian':
+                width = params.get('width', 1.0)
+                fx = np.exp(-(self.x / width)**2).astype(dtype)
+                fy = np.exp(-(self.y / width)**2).astype(dtype)
+                envelope = np.multiply.outer(fy, fx)
+            elif kind == 'radial':
+                k = params.get('k', 1)
+                envelope = np.cos(np.pi * k * self.R / (2 * self.bowl_radius)).astype(dtype)
+            else:
+                raise ValueError(f"unknown envelope {kind!r}")
+            self._envelopes[key] = envelope
+        return envelope
+
+    @property
+    def shape(self):
+        return (self.grid_points, self.grid_points)
+
+    def extent(self):
+        return (-self.bowl_radius, self.bowl_radius, -self.bowl_radius, self.bowl_radius)
+
+
+class FieldSource:
+    """
+    One vibration mode: amplitude * sin(2 pi frequency t + phase) * envelope(x, y).
+    """
+
+    def __init__(self, frequency, amplitude=1.0, phase=0.0, envelope='gaussian', **envelope_params):
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.phase = phase
+        self.envelope = envelope
+        self.envelope_params = envelope_params
+
+    def coefficient(self, t):
+        return self.amplitude * np.sin(2 * np.pi * self.frequency * t + self.phase)
+
+
+class FieldSources:
+    """
+    Sum of vibration modes on a grid.
+    Sources that share an envelope are merged, so evaluating a frame costs one scaled copy
+    (and, when accumulating, one add) per distinct envelope: out = sum_k c_k(t) * E_k, with the
+    E_k cached on the grid.
+    """
+
+    def __init__(self, grid, sources, dtype=np.float32):
+        self.grid = grid
+        self.sources = list(sources)
+        groups = {}
+        for source in self.sources:
+            envelope = grid.envelope(source.envelope, dtype=dtype, **source.envelope_params)
+            groups.setdefault(id(envelope), (envelope, []))[1].append(source)
+        self._groups = list(groups.values())
+        self._scratch = None
+
+    def evaluate(self, t, out=None, scale=1.0, add=False, scratch=None):
+        """
+        Writes (or with add=True, adds) scale * field(t) into out.
+
+        The first term of a write goes straight into out. Every term that is added costs two
+        passes, a scaled copy into `scratch` and the add, since numpy has no fused multiply-add
+        ufunc; `scratch` (a grid array of out's dtype, default: one kept here) makes it
+        allocation-free. A caller with a free buffer at hand, like WaveSolver, passes that.
+        """
+        if out is None:
+            out = np.empty(self.grid.shape, dtype=self._groups[0][0].dtype)
+        for i, (envelope, sources) in enumerate(self._groups):
+            c = scale * sum(source.coefficient(t) for source in sources)
+            if i == 0 and not add:
+                np.multiply(envelope, c, out=out)
+                continue
+            if scratch is None:
+                if self._scratch is None or self._scratch.dtype != out.dtype:
+                    self._scratch = np.empty(self.grid.shape, dtype=out.dtype)
+                scratch = self._scratch
+            np.multiply(envelope, c, out=scratch)
+            out += scratch
+        return out
+
+
+# Modes of simul_1.py: (sin(2 pi 3 t) + 0.5 sin(2 pi 5 t)) * exp(-R^2)
+BOWL_MODES = (FieldSource(3.0, 1.0), FieldSource(5.0, 0.5))
+
+
+def bowl_sources(grid):
+    """
+    The bowl vibration of simul_1.py as FieldSources, built once per grid.
+    """
+    sources = getattr(grid, '_bowl_sources', None)
+    if sources is None:
+        sources = grid._bowl_sources = FieldSources(grid, BOWL_MODES)
+    return sources
+
+
+# Function for bowl vibration
+def bowl_vibration(grid, t, out=None):
+    """
+    Simulates multi-frequency bowl vibration with spatial decay (same as bowlSound/simul_1.py).
+    The envelope is cached on the grid, each call is a single scaled copy.
+    """
+    return bowl_sources(grid).evaluate(t, out=out)
+
+
+def _neighbor_sum(u, out):
+    # out = u[i-1, j] + u[i+1, j] + u[i, j-1] + u[i, j+1], zero outside the array
+    out[0] = 0.0
+    out[1:] = u[:-1]
+    out[:-1] += u[1:]
+    out[:, 1:] += u[:, :-1]
+    out[:, :-1] += u[:, 1:]
+    return out
+
+
+class WaveSolver:
+    """
+    Damped, weakly nonlinear wave equation on the water surface
+
+        u_tt = c^2 lap(u) - omega0^2 u - damping u_t - nonlinearity u^3 + forcing(t)
+
+    The Laplacian only couples cells inside the bowl, which makes the wall reflecting.
+    Leapfrog/Verlet in time; the state is two displacement buffers (now and one step ago)
+    plus one work buffer, all updated in place, in `dtype` (default: the global precision).
+    The only other grid array of the solver is the diagonal term `_center`; the grid adds its
+    bool mask, R and the cached forcing envelope, so about seven grid-sized arrays in all.
+    """
+
+    def __init__(self, grid, wave_speed=0.5, damping=0.1, nonlinearity=0.2, omega0=2 * np.pi,
+                 forcing_amplitude=1.0, sources=None, dt=None, cfl=0.5, dtype=None):
+        self.grid = grid
+        self.dtype = get_dtype() if dtype is None else np.dtype(dtype).type
+        # Forcing field, the bowl vibration unless other FieldSources are given
+        self.sources = bowl_sources(grid) if sources is None else sources
+        self.wave_speed = wave_speed
+        self.damping = damping
+        self.nonlinearity = nonlinearity
+        self.omega0 = omega0
+        self.forcing_amplitude = forcing_amplitude
+
+        h = grid.spacing
+        dt_max = cfl * h / (wave_speed * np.sqrt(2))
+        self.dt = dt_max if dt is None else dt
+        if self.dt > dt_max / cfl:
+            raise ValueError(f"dt={self.dt} is above the CFL limit {dt_max / cfl:.3g}")
+
+        inside = grid.mask.astype(self.dtype)
+        # Number of wet neighbours of every cell, so the wall acts as a mirror
+        n_wet = _neighbor_sum(inside, np.empty(grid.shape, dtype=self.dtype))
+        dt2 = self.dt**2
+        self._coupling = dt2 * wave_speed**2 / h**2
+        # dt^2 * (c^2 n_wet / h^2 + omega0^2), the diagonal part of the update without the 2 u
+        # (kept apart so float32 does not round the small terms away against 2)
+        self._center = ((self._coupling * n_wet + dt2 * omega0**2) * inside).astype(self.dtype)
+        self._prev_factor = 1.0 - 0.5 * damping * self.dt
+        self._next_factor = 1.0 / (1.0 + 0.5 * damping * self.dt)
+
+        # Still water
+        self.t = 0.0
+        self.u = np.zeros(grid.shape, dtype=self.dtype)
+        self.u_prev = np.zeros(grid.shape, dtype=self.dtype)
+        self._work = np.empty(grid.shape, dtype=self.dtype)
+
+    def step(self, n=1):
+        """
+        Advances n leapfrog steps of size dt.
+        """
+        dt2 = self.dt**2
+        for _ in range(n):
+            u, u_prev, acc = self.u, self.u_prev, self._work
+
+            # acc = dt^2 c^2 / h^2 * (sum of neighbours) + 2 u - (1 - damping dt / 2) u_prev
+            _neighbor_sum(u, acc)
+            acc *= self._coupling
+            acc += u
+            acc += u
+            u_prev *= self._prev_factor
+            acc -= u_prev
+
+            # u_prev is free now: acc -= (center + dt^2 nonlinearity u^2) u
+            np.multiply(u, u, out=u_prev)
+            u_prev *= dt2 * self.nonlinearity
+            u_prev += self._center
+            u_prev *= u
+            acc -= u_prev
+
+            # Bowl vibration drives the water (outside the bowl it is masked below); u_prev is free
+            # again and serves as the scratch buffer
+            self.sources.evaluate(self.t, out=acc, scale=dt2 * self.forcing_amplitude, add=True, scratch=u_prev)
+
+            acc *= self._next_factor
+            acc *= self.grid.mask
+
+            # Rotate buffers: acc holds the new displacement
+            self.u_prev, self.u, self._work = u, acc, u_prev
+            self.t += self.dt
+        return self.u
+
+    def frames(self, n_frames, frame_dt):
+        """
+        Generator of (t, displacement), one per animation frame, starting at the current time.
+        The displacement is the solver's live buffer: use it before asking for the next frame,
+        copy it if it must be kept. Memory does not grow with the number of frames.
+        """
+        t0 = self.t
+        for frame in range(n_frames):
+            t = t0 + frame * frame_dt
+            yield t, self.advance_to(t)
+
+    def advance_to(self, t):
+        """
+        Steps until the solver time reaches t (to within half a step), returns the displacement.
+        """
+        n = int(round((t - self.t) / self.dt))
+        if n > 0:
+            self.step(n)
+        return self.u
+
+
+def surface_frames(solver, n_frames, frame_dt):
+    """
+    Generator of the visible surface, bowl vibration + water displacement, one field per frame.
+    A single output buffer is reused for every frame.
+    """
+    out = np.empty(solver.grid.shape, dtype=solver.dtype)
+    for t, displacement in solver.frames(n_frames, frame_dt):
+        bowl_vibration(solver.grid, t, out=out)
+        out += displacement
+        yield out
@@ -0,0 +1,203 @@
+"""
+结果缓存: 模型, 参数, 初始条件, t_eval, 求解器设置相同时直接从磁盘读上次的轨迹 (memory-map), 不再重新积分
+改了画图代码反复运行时就不用每次都等 solve_ivp; 目录总大小超过上限时删掉最久没用的结果
+
+    python -m physics_core.cache          # 缓存目录, 条目数, 大小
+    python -m physics_core.cache clear    # 清空
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from .store import TrajectoryStore, _jsonable
+
+# Part of every key; bump it when a change to the models or solvers alters results
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 1 << 30
+
+
+def default_directory():
+    return os.environ.get('PHYSICS_CORE_CACHE') or os.path.join(os.path.expanduser('~'), '.cache', 'physics_core')
+
+
+def _entry_bytes(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+class ResultCache:
+    """
+    Content-addressed cache of trajectories.
+
+        cache = ResultCache()
+        t, y = cache.solve(Integrator(), VSpringModel(), (0, 20), t_eval=np.arange(0, 20, 0.01))
+
+    The key is a SHA-256 of the model name and parameters, the initial state, the time span,
+    the exact bytes of t_eval and the integrator settings. Every entry is an uncompressed
+    TrajectoryStore in one chunk, so a hit returns memory maps without reading the data.
+    An entry's directory mtime is its last use; when the cache grows past max_bytes the least
+    recently used entries are removed.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, kind, model, t_span, y0, t_eval, settings):
+        """
+        Hex digest identifying one run.
+        """
+        description = {
+            'version': CACHE_VERSION,
+            'kind': kind,
+            'model': model.name,
+            'params': model.params,
+            'y0': np.asarray(y0, dtype=float).tolist(),
+            't_span': [float(t) for t in t_span],
+            'settings': settings,
+        }
+        digest = hashlib.sha256(json.dumps(description, sort_keys=True, default=_jsonable).encode())
+        if t_eval is not None:
+            digest.update(np.ascontiguousarray(t_eval, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key):
+        """
+        TrajectoryStore of a cached run, or None.
+        """
+        path = self._path(key)
+        try:
+            store = TrajectoryStore(path)
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return store
+
+    def put(self, key, t, y, attrs=None):
+        """
+        Stores t (T,) and y (n_state, T); returns the stored entry.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written next to the final place and renamed, so readers never see half an entry
+        tmp = tempfile.mkdtemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            store = TrajectoryStore.create(os.path.join(tmp, 'entry'), chunk_len=max(1, len(t)),
+                                           compression=None, attrs=attrs or {})
+            with store:
+                store.append(t=np.asarray(t, dtype=float), y=np.asarray(y).T)
+            try:
+                os.rename(os.path.join(tmp, 'entry'), path)
+            except OSError:
+                # Another process stored the same run first
+                if not os.path.isdir(path):
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict(keep=path)
+        return TrajectoryStore(path)
+
+    def _cached(self, kind, model, t_span, y0, t_eval, settings, compute):
+        if y0 is None:
+            y0 = model.y0()
+        key = self.key(kind, model, t_span, y0, t_eval, settings)
+        store = self.get(key)
+        if store is None:
+            self.misses += 1
+            t, y, attrs = compute(y0)
+            store = self.put(key, t, y, attrs)
+        else:
+            self.hits += 1
+        return store['t'], store['y'].T, store.attrs
+
+    @staticmethod
+    def _settings(integrator, kwargs):
+        settings = {name: getattr(integrator, name) for name in
+                    ('method', 'rtol', 'atol', 'stiff_method', 'stiffness_threshold')}
+        for name, value in kwargs.items():
+            if callable(value):
+                raise TypeError(f"cannot cache a run with a callable {name!r}")
+            settings[name] = value
+        return settings
+
+    def solve(self, integrator, model, t_span, y0=None, t_eval=None, **kwargs):
+        """
+        Cached Integrator.solve: returns (t, y), y of shape (n_state, T) like sol.y.
+        """
+        def compute(y0):
+            sol = integrator.solve(model, t_span, y0, t_eval=t_eval, **kwargs)
+            return sol.t, sol.y, {}
+
+        t, y, _ = self._cached('solve', model, t_span, y0, t_eval, self._settings(integrator, kwargs), compute)
+        return t, y
+
+    def simulate(self, handler, integrator, t_span, y0=None, t_eval=None):
+        """
+        Cached CollisionHandler.simulate: returns (t, y, t_collisions).
+        """
+        def compute(y0):
+            t, y, t_collisions = handler.simulate(integrator, t_span, y0, t_eval=t_eval)
+            return t, y, {'t_collisions': t_collisions.tolist()}
+
+        settings = self._settings(integrator, {})
+        settings['max_collisions'] = handler.max_collisions
+        t, y, attrs = self._cached('collisions', handler.model, t_span, y0, t_eval, settings, compute)
+        return t, y, np.array(attrs['t_collisions'])
+
+    def entries(self):
+        """
+        (path, bytes, last use) of every entry, least recently used first.
+        """
+        found = []
+        for prefix in os.listdir(self.directory):
+            folder = os.path.join(self.directory, prefix)
+            if not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                if not name.startswith('.tmp-'):
+                    found.append((path, _entry_bytes(path), os.path.getmtime(path)))
+        return sorted(found, key=lambda entry: entry[2])
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used entries until the cache fits into max_bytes
+        (never `keep`, the entry just written).
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import sys
+
+    cache = ResultCache()
+    if sys.argv[1:] == ['clear']:
+        cache.clear()
+    entries = cache.entries()
+    print(f"{cache.directory}: {len(entries)} entries, {sum(e[1] for e in entries) / 1e6:.1f} MB "
+          f"(limit {cache.max_bytes / 1e6:.0f} MB)")
@@ -0,0 +1,223 @@
+"""
+N 个球的 Lato 模型: 每个球挂在自己的支点上, 支点沿 x 排成一排 (间距 2 r_ball 时就是牛顿摆)
+支点可以像 prac_lato6.py 一样上下振动; 碰撞用 CollisionHandler 里同样的恢复系数公式,
+宽相用沿 x 的 sweep-and-prune, 窄相对所有候选球对一次向量化计算
+PendulumCloud: 支点任意摆放, 绳长各不相同的一大群摆 (许多根绳的 Lato-Lato, 挂在同一个振动手柄上的球),
+宽相换成二维均匀网格 (spatial hash)
+"""
+
+import numpy as np
+
+from .contacts import SpatialHash, independent_pairs, sweep_and_prune
+
+
+class PendulumChain:
+    """
+    n_balls pendulums with pivots at x = (i - (n - 1) / 2) * spacing, all moving with
+    the pivot height A cos(omega_p t). State: angles theta (N,) and angular velocities z (N,).
+    `m` may be an (N,) array of masses.
+    """
+
+    def __init__(self, n_balls=5, L=1.0, m=0.1, r_ball=0.05, e=1.0, g=9.81, spacing=None, A=0.0, omega_p=2.0,
+                 max_passes=None):
+        self.n_balls = n_balls
+        self.L, self.g, self.e = L, g, e
+        self.A, self.omega_p = A, omega_p
+        self.r_ball = r_ball
+        self.spacing = 2 * r_ball if spacing is None else spacing
+        self.m = np.broadcast_to(np.asarray(m, dtype=float), (n_balls,)).copy()
+        self.pivot_x = (np.arange(n_balls) - (n_balls - 1) / 2) * self.spacing
+        # Impulses travel one ball per pass, a cradle needs as many passes as balls
+        self.max_passes = n_balls if max_passes is None else max_passes
+        self.params = {'L': L, 'r_ball': r_ball, 'e': e, 'g': g, 'A': A, 'omega_p': omega_p,
+                       'spacing': self.spacing, 'n_balls': n_balls}
+        self._order = None
+        self.n_impulses = 0
+
+    def pivot_y(self, t):
+        return self.A * np.cos(self.omega_p * t)
+
+    def accel(self, t, theta, out):
+        # Same equation as lato_pivot_kernel, for every ball at once
+        pivot_force = self.A * self.omega_p**2 * np.cos(self.omega_p * t)
+        np.sin(theta, out=out)
+        out *= -self.g / self.L
+        out -= pivot_force / self.L * np.cos(theta)
+        return out
+
+    def resolve_contacts(self, theta, z):
+        """
+        Applies restitution impulses to every approaching pair in contact (z is updated in place).
+        Returns the number of impulses.
+        """
+        L = self.L
+        bx = self.pivot_x + L * np.sin(theta)
+        i, j, self._order = sweep_and_prune(bx, 2 * self.r_ball, self._order)
+        if len(i) == 0:
+            return 0
+        # Narrow phase; all pivots are at the same height, so it cancels in dy
+        by = -L * np.cos(theta)
+        dx, dy = bx[j] - bx[i], by[j] - by[i]
+        touching = dx**2 + dy**2 <= (2 * self.r_ball)**2 * (1 + 1e-9)
+        i, j, dx, dy = i[touching], j[touching], dx[touching], dy[touching]
+
+        count = 0
+        for _ in range(self.max_passes):
+            v = L * z  # tangential velocities
+            # Approaching: relative velocity (along the swing direction) against the separation
+            vx, vy = v * np.cos(theta), v * np.sin(theta)
+            approaching = (vx[j] - vx[i]) * dx + (vy[j] - vy[i]) * dy < 0
+            if not approaching.any():
+                break
+            a, b = i[approaching], j[approaching]
+            pick = independent_pairs(a, b, self.n_balls)
+            a, b = a[pick], b[pick]
+            m1, m2, v1, v2 = self.m[a], self.m[b], v[a], v[b]
+            # Coefficient of restitution, as in CollisionHandler.apply_impulse
+            v1_new = (m1 * v1 + m2 * v2 + m2 * self.e * (v2 - v1)) / (m1 + m2)
+            v2_new = (m1 * v1 + m2 * v2 + m1 * self.e * (v1 - v2)) / (m1 + m2)
+            z[a] = v1_new / L
+            z[b] = v2_new / L
+            count += len(a)
+        self.n_impulses += count
+        return count
+
+    def step(self, t, theta, z, dt, a):
+        """
+        One velocity Verlet step from t, in place; `a` holds the acceleration at t on entry
+        and at t + dt on return.
+        """
+        z += 0.5 * dt * a
+        theta += dt * z
+        self.resolve_contacts(theta, z)
+        self.accel(t + dt, theta, a)
+        z += 0.5 * dt * a
+
+    def run(self, t_end, dt=1e-4, theta0=None, z0=None, record_every=100, t0=0.0):
+        """
+        Velocity Verlet with contact resolution after every drift.
+        Returns t (T,), theta (T, N), z (T, N), sampled every `record_every` steps.
+        """
+        theta = np.zeros(self.n_balls) if theta0 is None else np.array(theta0, dtype=float)
+        z = np.zeros(self.n_balls) if z0 is None else np.array(z0, dtype=float)
+        n_steps = int(round((t_end - t0) / dt))
+        n_out = n_steps // record_every + 1
+        t_out = np.empty(n_out)
+        theta_out = np.empty((n_out, self.n_balls))
+        z_out = np.empty((n_out, self.n_balls))
+        t_out[0], theta_out[0], z_out[0] = t0, theta, z
+
+        a = self.accel(t0, theta, np.empty(self.n_balls))
+        for step in range(1, n_steps + 1):
+            t = t0 + step * dt
+            self.step(t - dt, theta, z, dt, a)
+            if step % record_every == 0:
+                k = step // record_every
+                t_out[k], theta_out[k], z_out[k] = t, theta, z
+        return t_out, theta_out, z_out
+
+    def positions(self, t, theta):
+        """
+        Anchor and ball positions (T, N, 2) for the renderers; theta is (T, N).
+        """
+        t = np.atleast_1d(t)
+        theta = np.atleast_2d(theta)
+        anchors = np.empty(theta.shape + (2,))
+        anchors[..., 0] = self.pivot_x
+        anchors[..., 1] = self.pivot_y(t)[:, None]
+        balls = np.empty_like(anchors)
+        balls[..., 0] = anchors[..., 0] + self.L * np.sin(theta)
+        balls[..., 1] = anchors[..., 1] - self.L * np.cos(theta)
+        return anchors, balls
+
+    def extent(self):
+        # Square, so the rasterizer scale fits the whole chain
+        half = abs(self.pivot_x[0]) + 1.2 * self.L
+        top = self.A + 0.3 * self.L
+        return (-half, half, top - 2 * half, top)
+
+
+class PendulumCloud(PendulumChain):
+    """
+    Pendulums with arbitrary pivots (N, 2) and string lengths L (scalar or (N,)), all pivots
+    moving together by A cos(omega_p t) vertically. Balls can meet at any angle; the impulse acts
+    along the line of centres and only its component along each swing direction changes the
+    angular velocities (the strings take the rest), so e = 1 keeps the energy.
+    run(), accel() and pivot_y() are those of PendulumChain.
+    """
+
+    def __init__(self, pivots, L=1.0, m=0.1, r_ball=0.05, e=1.0, g=9.81, A=0.0, omega_p=2.0, max_passes=8):
+        pivots = np.asarray(pivots, dtype=float)
+        self.n_balls = len(pivots)
+        self.pivots = pivots
+        self.pivot_x = pivots[:, 0]
+        self.L = np.broadcast_to(np.asarray(L, dtype=float), (self.n_balls,)).copy()
+        self.g, self.e = g, e
+        self.A, self.omega_p = A, omega_p
+        self.r_ball = r_ball
+        self.m = np.broadcast_to(np.asarray(m, dtype=float), (self.n_balls,)).copy()
+        self.max_passes = max_passes
+        self.params = {'r_ball': r_ball, 'e': e, 'g': g, 'A': A, 'omega_p': omega_p, 'n_balls': self.n_balls}
+        self.grid = SpatialHash(2 * r_ball * (1 + 1e-9))
+        self.n_impulses = 0
+
+    def resolve_contacts(self, theta, z):
+        """
+        Applies restitution impulses to every approaching pair in contact (z is updated in place).
+        Returns the number of impulses.
+        """
+        L = self.L
+        sin, cos = np.sin(theta), np.cos(theta)
+        # The common pivot motion cancels in every relative position and velocity
+        bx = self.pivots[:, 0] + L * sin
+        by = self.pivots[:, 1] - L * cos
+        i, j = self.grid.pairs(bx, by)
+        if len(i) == 0:
+            return 0
+        dist = np.hypot(bx[j] - bx[i], by[j] - by[i])
+        nx, ny = (bx[j] - bx[i]) / dist, (by[j] - by[i]) / dist
+        # Swing directions projected on the normal
+        ti = cos[i] * nx + sin[i] * ny
+        tj = cos[j] * nx + sin[j] * ny
+        # Impulse needed to change the normal relative velocity by one unit
+        stiffness = ti**2 / self.m[i] + tj**2 / self.m[j]
+        movable = stiffness > 1e-12
+
+        count = 0
+        for _ in range(self.max_passes):
+            vn = L[j] * z[j] * tj - L[i] * z[i] * ti
+            # Below the threshold is round-off between resting balls
+            approaching = movable & (vn < -1e-12)
+            if not approaching.any():
+                break
+            k = np.flatnonzero(approaching)
+            k = k[independent_pairs(i[k], j[k], self.n_balls)]
+            a, b = i[k], j[k]
+            impulse = -(1 + self.e) * vn[k] / stiffness[k]
+            z[a] -= impulse * ti[k] / (self.m[a] * L[a])
+            z[b] += impulse * tj[k] / (self.m[b] * L[b])
+            count += len(k)
+        self.n_impulses += count
+        return count
+
+    def positions(self, t, theta):
+        """
+        Anchor and ball positions (T, N, 2) for the renderers; theta is (T, N).
+        """
+        t = np.atleast_1d(t)
+        theta = np.atleast_2d(theta)
+        anchors = np.empty(theta.shape + (2,))
+        anchors[..., 0] = self.pivots[:, 0]
+        anchors[..., 1] = self.pivots[:, 1] + self.pivot_y(t)[:, None]
+        balls = np.empty_like(anchors)
+        balls[..., 0] = anchors[..., 0] + self.L * np.sin(theta)
+        balls[..., 1] = anchors[..., 1] - self.L * np.cos(theta)
+        return anchors, balls
+
+    def extent(self):
+        reach = self.L.max() + self.r_ball
+        xmin, xmax = self.pivots[:, 0].min() - reach, self.pivots[:, 0].max() + reach
+        ymin, ymax = self.pivots[:, 1].min() - reach, self.pivots[:, 1].max() + reach + abs(self.A)
+        half = max(xmax - xmin, ymax - ymin) / 2
+        cx, cy = (xmin + xmax) / 2, (ymin + ymax) / 2
+        return (cx - half, cx + half, cy - half, cy + half)
@@ -0,0 +1,412 @@
+"""
+命令行入口, 不开窗口 (Agg), 只导入这次运行用得到的部分 (SciPy 只在 solve_ivp / 碰撞时导入)
+
+    python -m physics_core lato_rigid --t-end 20 -p omega_drive=3.0 -o rigid.npz -o rigid.gif
+    python -m physics_core v_spring --solver auto -p k=50 -o spectrum.png
+    python -m physics_core lato_collisions -p A=0.2 -o peaks.txt
+    python -m physics_core bowl --t-end 0.1 -p grid_points=400 -o surface.gif
+    python -m physics_core --config batch.toml        # 一个进程跑很多组参数
+
+输出按扩展名: .npz 数组, .gif / .mp4 动画, .png / .pdf / .svg 频谱图, .txt / .csv 共振峰表
+配置文件 (TOML 或 JSON), 每个 run 可以覆盖 defaults; 输出文件名里可以用 {name}:
+
+    [defaults]
+    model = "lato_rigid"
+    t_end = 30
+    outputs = ["out/{name}.npz", "out/{name}.png"]
+
+    [[runs]]
+    name = "slow"
+    params = {omega_drive = 2.0}
+
+    [[runs]]
+    name = "fast"
+    params = {omega_drive = 4.0}
+
+启动时间 (解释器 + 导入, 到开始积分为止) 和每个 run 的时间打印到 stderr
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+MODEL_NAMES = ('lato_pivot', 'lato_rigid', 'lato_polar', 'v_spring', 'bowl', 'lato_collisions')
+# Shorthands: name -> (model, extra run settings)
+ALIASES = {'lato_collisions': ('lato_pivot', {'collisions': True})}
+RUN_KEYS = ('name', 'model', 'params', 't_end', 'dt', 'solver', 'collisions', 'outputs', 'size', 'fps')
+ANIMATION_FORMATS = ('.gif', '.mp4')
+SPECTRUM_PLOT_FORMATS = ('.png', '.pdf', '.svg')
+PEAK_TABLE_FORMATS = ('.txt', '.csv')
+OUTPUT_FORMATS = ('.npz',) + ANIMATION_FORMATS + SPECTRUM_PLOT_FORMATS + PEAK_TABLE_FORMATS
+SOLVERS = ('rk4', 'symplectic', 'auto', 'RK45', 'RK23', 'DOP853', 'Radau', 'BDF', 'LSODA')
+# Bowl parameters that belong to the grid; the rest go to WaveSolver
+GRID_PARAMS = ('bowl_radius', 'grid_points')
+# Default (t_end, dt) of a run
+DEFAULT_TIMES = {'bowl': (0.1, 0.005)}
+ODE_TIMES = (10.0, 0.01)
+# Models CollisionHandler can handle (it needs the two balls' r_ball, e and m)
+COLLISION_MODELS = ('lato_pivot',)
+
+
+def _parse_value(text):
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_params(items):
+    """
+    ['k=10', 'F0=1.5'] -> {'k': 10, 'F0': 1.5}
+    """
+    params = {}
+    for item in items or ():
+        name, sep, value = item.partition('=')
+        if not sep or not name:
+            raise ValueError(f"parameter {item!r} is not of the form name=value")
+        params[name.strip()] = _parse_value(value.strip())
+    return params
+
+
+def simulate(model_name, params=None, t_end=None, dt=None, solver='rk4', collisions=False, keep_frames=True):
+    """
+    One run; returns a dict of arrays: t and y (n_state, T) for the ODE models,
+    t, centre, max_abs and u (frames, ny, nx) for the bowl (see _simulate_bowl for keep_frames).
+    """
+    params = dict(params or {})
+    default_t_end, default_dt = DEFAULT_TIMES.get(model_name, ODE_TIMES)
+    t_end = default_t_end if t_end is None else t_end
+    dt = default_dt if dt is None else dt
+    if model_name == 'bowl':
+        return _simulate_bowl(params, t_end, dt, keep_frames)
+
+    from .integrators import Integrator
+    from .models import get_model
+
+    model = get_model(model_name, **params)
+    t_eval = np.linspace(0.0, t_end, int(round(t_end / dt)) + 1)
+
+    if collisions:
+        from .collisions import CollisionHandler
+        method = 'auto' if solver in ('rk4', 'symplectic') else solver
+        t, y, t_collisions = CollisionHandler(model).simulate(Integrator(method=method, rtol=1e-8, atol=1e-10),
+                                                              (0.0, t_end), t_eval=t_eval)
+        return {'t': t, 'y': y, 't_collisions': t_collisions}
+    if solver == 'rk4':
+        return {'t': t_eval, 'y': Integrator().solve_batch(model, t_eval)[0].T}
+    if solver == 'symplectic':
+        from .symplectic import integrate_model
+        # Ten steps per output sample
+        n_out = len(t_eval) - 1
+        t, y = integrate_model(model, dt / 10, 10 * n_out, method='yoshida4', decimate=10)
+        return {'t': t, 'y': y}
+    sol = Integrator(method=solver).solve(model, (0.0, t_end), t_eval=t_eval)
+    return {'t': sol.t, 'y': sol.y}
+
+
+def _simulate_bowl(params, t_end, dt, keep_frames=True):
+    """
+    Surface frames every dt, plus the centre trace (for the spectra) and max |u|.
+
+    With keep_frames=False nothing is stored per frame beyond the centre value: 'frames' is a
+    one-pass generator of the surfaces that does the actual solving (give it to one animation
+    writer; 'centre' and 'max_abs' fill in as it is consumed), and 'replay' starts the solver
+    afresh for any further animation. Memory then stays at the solver's own buffers.
+    """
+    from .bowl import BowlGrid, WaveSolver, surface_frames
+
+    grid_args = {name: params.pop(name) for name in GRID_PARAMS if name in params}
+    n_frames = int(round(t_end / dt)) + 1
+    centre = np.full(n_frames, np.nan)
+    max_abs = np.zeros(())
+
+    def replay():
+        grid = BowlGrid(**grid_args)
+        return surface_frames(WaveSolver(grid, **params), n_frames, dt)
+
+    # Built here, so bad parameters fail before any output is started
+    surfaces = replay()
+
+    def frames():
+        for i, surface in enumerate(surfaces):
+            centre[i] = surface[surface.shape[0] // 2, surface.shape[1] // 2]
+            max_abs[...] = max(max_abs, surface.max(), -surface.min())
+            yield surface
+
+    result = {'t': np.arange(n_frames) * dt, 'centre': centre, 'max_abs': max_abs}
+    if not keep_frames:
+        return {**result, 'frames': frames(), 'replay': replay}
+    stack = None
+    for i, surface in enumerate(frames()):
+        if stack is None:
+            stack = np.empty((n_frames,) + surface.shape, dtype=surface.dtype)
+        stack[i] = surface
+    return {**result, 'u': stack}
+
+
+def _finish(result):
+    # Runs a streamed bowl simulation to the end if no animation has consumed it
+    for _ in result.pop('frames', ()):
+        pass
+    return result
+
+
+def summary(result):
+    t = result['t']
+    lines = [f"{len(t)} samples, t = {t[0]:g} .. {t[-1]:g}"]
+    if 'y' in result:
+        lines.append(f"final state {np.array2string(result['y'][:, -1], precision=4)}")
+    if 'max_abs' in result:
+        lines.append(f"surface frames: {len(t)}, max |u| = {float(result['max_abs']):.4g}")
+    if 't_collisions' in result:
+        lines.append(f"{len(result['t_collisions'])} collisions")
+    return "\n".join(lines)
+
+
+def load_config(path):
+    """
+    Reads a TOML or JSON config and returns the list of runs, each merged with `defaults`.
+    A config without `runs` is a single run.
+    """
+    if path.endswith('.toml'):
+        import tomllib
+        with open(path, 'rb') as f:
+            config = tomllib.load(f)
+    else:
+        with open(path) as f:
+            config = json.load(f)
+    defaults = config.get('defaults', {})
+    runs = config.get('runs')
+    if runs is None:
+        runs = [{k: v for k, v in config.items() if k != 'defaults'}]
+    merged = []
+    for run in runs:
+        run = {**defaults, **run, 'params': {**defaults.get('params', {}), **run.get('params', {})}}
+        unknown = set(run) - set(RUN_KEYS)
+        if unknown:
+            raise ValueError(f"unknown run settings: {', '.join(sorted(unknown))}")
+        merged.append(run)
+    return merged
+
+
+def _resolve(run, index):
+    # Fills in the alias, a name and defaults; returns a new dict
+    run = {'params': {}, 'solver': 'rk4', 'collisions': False, 'outputs': [], **run}
+    if 'model' not in run:
+        raise ValueError("a run needs a model")
+    if run['model'] in ALIASES:
+        model, extra = ALIASES[run['model']]
+        run = {**run, **extra, 'model': model}
+    if run['model'] not in MODEL_NAMES:
+        raise ValueError(f"unknown model {run['model']!r}, choose from {', '.join(MODEL_NAMES)}")
+    run.setdefault('name', f"{run['model']}-{index}")
+    if run['collisions'] and run['model'] not in COLLISION_MODELS:
+        raise ValueError(f"collisions need the model {' or '.join(COLLISION_MODELS)}, not {run['model']!r}")
+    default_t_end, default_dt = DEFAULT_TIMES.get(run['model'], ODE_TIMES)
+    t_end = default_t_end if run.get('t_end') is None else run['t_end']
+    dt = default_dt if run.get('dt') is None else run['dt']
+    if not dt > 0:
+        raise ValueError(f"dt must be positive, got {dt}")
+    if not t_end >= 2 * dt:
+        # Spectra and animations need at least three samples
+        raise ValueError(f"t_end must be at least 2 * dt = {2 * dt:g}, got {t_end}")
+    for output in run['outputs']:
+        # Checked before anything is simulated
+        if os.path.splitext(output)[1].lower() not in OUTPUT_FORMATS:
+            raise ValueError(f"unknown output format {output!r}, use one of {', '.join(OUTPUT_FORMATS)}")
+    return run
+
+
+def _spectrum_signals(run, result):
+    # (labels, (n, T) signals, sample rate) for the spectrum outputs
+    t = result['t']
+    fs = 1.0 / (t[1] - t[0])
+    if 'centre' in result:
+        return ["surface centre"], _finish(result)['centre'][None], fs
+    from .models import MODELS
+    names = MODELS[run['model']].state_names
+    return list(names), result['y'], fs
+
+
+def write_spectrum_plot(run, result, filename):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from .spectrum import StreamingSpectrum
+
+    labels, signals, fs = _spectrum_signals(run, result)
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for label, signal in zip(labels, signals):
+        analyzer = StreamingSpectrum(fs, nperseg=min(1024, len(signal)))
+        analyzer.feed(signal)
+        freqs, psd = analyzer.welch()
+        ax.semilogy(freqs[1:], psd[1:], label=label)
+    ax.set_xlabel("Frequency (Hz)")
+    ax.set_ylabel("PSD")
+    ax.set_title(f"{run['name']}: {run['model']}")
+    ax.grid()
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(filename)
+    plt.close(fig)
+
+
+def write_peak_table(run, result, filename):
+    """
+    Resonance peaks of every state component: aligned columns for .txt, comma-separated for .csv.
+    """
+    from .spectrum import peak_table, format_peak_table
+
+    labels, signals, fs = _spectrum_signals(run, result)
+    table = peak_table(signals, fs, params=np.arange(len(labels)))
+    if filename.lower().endswith('.csv'):
+        _write_peak_csv(table, labels, filename)
+        return
+    with open(filename, 'w') as f:
+        f.write(f"# {run['name']}: {run['model']} {run['params']}\n")
+        f.write("# component: " + ", ".join(f"{i} = {label}" for i, label in enumerate(labels)) + "\n")
+        f.write(format_peak_table(table, param_name="component") + "\n")
+
+
+def _write_peak_csv(table, labels, filename):
+    # One row per component, every peak and harmonic in its own column
+    import csv
+
+    n_peaks, n_harmonics = table['freq'].shape[1], table['harmonics'].shape[1]
+    header = ['component']
+    for column in ('freq', 'amplitude', 'q'):
+        header += [f"{column}{k + 1}" for k in range(n_peaks)]
+    header += [f"H{h + 1}" for h in range(n_harmonics)]
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for label, row in zip(labels, table):
+            writer.writerow([label, *(f"{value:.6g}" for column in ('freq', 'amplitude', 'q', 'harmonics')
+                                      for value in row[column])])
+
+
+def write_animation(run, result, filename):
+    from .raster import field_frames, field_palette, save_frames
+
+    fps = run.get('fps', 30)
+    size = run.get('size', 400)
+    if 'u' in result:
+        save_frames(field_frames(result['u'], size=size), filename, palette=field_palette('viridis'), fps=fps)
+    elif 'replay' in result:
+        # Streamed bowl run: the first animation drives the solver, later ones run it again
+        surfaces = result.pop('frames', None) or result['replay']()
+        save_frames(field_frames(surfaces, size=size), filename, palette=field_palette('viridis'), fps=fps)
+    else:
+        from .models import get_model
+        from .renderer import Renderer
+        Renderer(get_model(run['model'], **run['params'])).export(result['t'], result['y'], filename,
+                                                                size=size, fps=fps)
+
+
+def write_outputs(run, result):
+    """
+    Writes every file in run['outputs'], chosen by extension; returns the file names.
+    Animations go first, so a streamed bowl run is solved while the first one is encoded.
+    """
+    written = []
+    for template in sorted(run['outputs'], key=lambda name: os.path.splitext(name)[1].lower()
+                           not in ANIMATION_FORMATS):
+        filename = template.format(name=run['name'], model=run['model'])
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        extension = os.path.splitext(filename)[1].lower()
+        if extension == '.npz':
+            np.savez(filename, **{key: value for key, value in result.items() if isinstance(value, np.ndarray)})
+        elif extension in ANIMATION_FORMATS:
+            write_animation(run, result, filename)
+        elif extension in SPECTRUM_PLOT_FORMATS:
+            write_spectrum_plot(run, result, filename)
+        elif extension in PEAK_TABLE_FORMATS:
+            write_peak_table(run, result, filename)
+        else:
+            raise ValueError(f"unknown output format {filename!r}")
+        written.append(filename)
+    _finish(result)
+    return written
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m physics_core", description=__doc__.split("\n")[1],
+                                     epilog=__doc__.split("\n", 2)[2],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('model', nargs='?', choices=MODEL_NAMES, help="model to run (or use --config)")
+    parser.add_argument('-c', '--config', help="TOML or JSON file with one or many runs")
+    parser.add_argument('-p', '--param', action='append', metavar='NAME=VALUE',
+                        help="model parameter, may be repeated; applied on top of every run of a config")
+    parser.add_argument('--t-end', type=float, help="simulated time in s (10, bowl: 0.1)")
+    parser.add_argument('--dt', type=float, help="output step in s (0.01, bowl: 0.005)")
+    parser.add_argument('--solver', choices=SOLVERS,
+                        help="rk4 (default: fixed step, no SciPy), symplectic, or a solve_ivp method")
+    parser.add_argument('--collisions', action='store_true', help="event-driven ball contacts (lato_pivot)")
+    parser.add_argument('--no-jit', action='store_true', help="plain Python kernels, no numba import")
+    parser.add_argument('-o', '--output', action='append', default=[],
+                        help=".npz, .gif/.mp4, .png/.pdf/.svg (spectrum) or .txt/.csv (peak table); may be repeated")
+    return parser
+
+
+def main(argv=None):
+    # No window may ever open, whatever gets imported later
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.no_jit:
+        from . import kernels
+        kernels.JIT_ENABLED = False
+    try:
+        if args.config:
+            runs = load_config(args.config)
+        elif args.model:
+            runs = [{'model': args.model}]
+        else:
+            parser.error("give a model or --config")
+        # Command-line settings override the config
+        overrides = {key: value for key, value in (('t_end', args.t_end), ('dt', args.dt), ('solver', args.solver))
+                     if value is not None}
+        if args.collisions:
+            overrides['collisions'] = True
+        params = parse_params(args.param)
+        runs = [_resolve({**run, **overrides, 'params': {**run.get('params', {}), **params},
+                          'outputs': list(run.get('outputs', [])) + args.output}, i)
+                for i, run in enumerate(runs)]
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    # CPU time of the process so far: interpreter start-up plus every import up to here
+    startup = time.process_time()
+    print(f"startup {startup * 1000:.0f} ms (CPU)", file=sys.stderr)
+    failed = 0
+    for run in runs:
+        start = time.perf_counter()
+        try:
+            # The whole bowl surface history is only kept when it is saved
+            keep_frames = any(os.path.splitext(output)[1].lower() == '.npz' for output in run['outputs'])
+            result = simulate(run['model'], run['params'], run.get('t_end'), run.get('dt'),
+                              run['solver'], run['collisions'], keep_frames)
+            elapsed = time.perf_counter() - start
+            written = write_outputs(run, result)
+        except (OSError, TypeError, ValueError, NotImplementedError, RuntimeError) as error:
+            print(f"{run['name']}: error: {error}", file=sys.stderr)
+            failed += 1
+            continue
+        if not written:
+            print(f"[{run['name']}]\n{summary(result)}")
+        total = time.perf_counter() - start
+        print(f"{run['name']}: run {elapsed * 1000:.0f} ms, outputs {(total - elapsed) * 1000:.0f} ms"
+              f"{' -> ' + ', '.join(written) if written else ''}", file=sys.stderr)
+    loaded = [name for name in ('scipy', 'matplotlib', 'numba') if name in sys.modules]
+    if loaded:
+        print(f"loaded {', '.join(loaded)}", file=sys.stderr)
+    return 1 if failed else 0
@@ -0,0 +1,119 @@
+"""
+两球碰撞: 用 solve_ivp 的 terminal event 找到碰撞时刻, 施加恢复系数为 e 的冲量后从碰撞点继续积分
+"""
+
+import numpy as np
+
+
+class CollisionHandler:
+    """
+    Event-driven contacts between the two balls of a LatoPivotModel.
+    """
+
+    def __init__(self, model, max_collisions=10000):
+        self.model = model
+        self.max_collisions = max_collisions
+
+        # Signed gap as a solve_ivp event: terminal, only while the balls approach each other
+        def event(t, y):
+            return self.gap(t, y)
+        event.terminal = True
+        event.direction = -1
+        self.event = event
+
+    def gap(self, t, y):
+        """
+        Signed gap between the two ball surfaces, |p1 - p2| - 2 * r_ball.
+        """
+        L = self.model.L
+        theta1, theta2 = y[0], y[2]
+        # Both balls hang from the same pivot, so the pivot motion cancels out
+        dx = L * (np.sin(theta1) - np.sin(theta2))
+        dy = -L * (np.cos(theta1) - np.cos(theta2))
+        return np.sqrt(dx**2 + dy**2) - 2 * self.model.r_ball
+
+    def apply_impulse(self, y):
+        """
+        Restitution impulse between the two balls, treated 1D along the swing direction.
+        Returns the post-collision state.
+        """
+        L, m, e = self.model.L, self.model.m, self.model.e
+        theta1, z1, theta2, z2 = y
+        v1 = L * z1  # tangential velocity of ball 1
+        v2 = L * z2  # tangential velocity of ball 2
+
+        # Use the coefficient of restitution to calculate the new velocities
+        v1_new = (m * v1 + m * v2 + m * e * (v2 - v1)) / (m + m)
+        v2_new = (m * v1 + m * v2 + m * e * (v1 - v2)) / (m + m)
+        return np.array([theta1, v1_new / L, theta2, v2_new / L])
+
+    def simulate(self, integrator, t_span, y0=None, t_eval=None):
+        """
+        Integrates the model, restarting at every contact.
+        Returns (t, y, t_collisions); y has shape (4, len(t)) like solve_ivp's sol.y.
+        t_eval may be as sparse as desired, impacts are located by the event function regardless.
+        """
+        t_start, t_end = t_span
+        state = self.model.y0() if y0 is None else np.asarray(y0, dtype=float)
+        if t_eval is not None:
+            t_eval = np.asarray(t_eval, dtype=float)
+        t_out = []
+        y_out = []
+        t_collisions = []
+
+        while t_start < t_end:
+            if t_eval is None:
+                segment_eval = None
+            else:
+                # Output points that fall into this segment (the contact point itself is left out)
+                segment_eval = t_eval[(t_eval >= t_start) & (t_eval <= t_end)]
+
+            sol = integrator.solve(self.model, (t_start, t_end), state, t_eval=segment_eval,
+                                   events=self.event)
+            # solve_ivp returns plain lists when no output point falls into the segment
+            sol.t = np.asarray(sol.t, dtype=float)
+            sol.y = np.asarray(sol.y, dtype=float).reshape(len(state), -1)
+
+            if sol.status == 1:  # a contact ended this segment
+                t_hit = sol.t_events[0][0]
+                keep = sol.t < t_hit
+                t_out.append(sol.t[keep])
+                y_out.append(sol.y[:, keep])
+
+                t_collisions.append(t_hit)
+                if len(t_collisions) > self.max_collisions:
+                    raise RuntimeError("too many collisions (balls resting in contact?)")
+                state = self.apply_impulse(sol.y_events[0][0])
+                t_start = t_hit
+            else:
+                t_out.append(sol.t)
+                y_out.append(sol.y)
+                break
+
+        return np.concatenate(t_out), np.hstack(y_out), np.array(t_collisions)
+
+    def simulate_dense(self, integrator, t_span, y0=None, dtype=np.float64):
+        """
+        Like simulate(), but keeps the solver's dense output of every segment instead of samples.
+        Returns (DenseTrajectory, t_collisions); at a collision time it gives the post-impact state.
+        """
+        from .dense import DenseTrajectory
+
+        t_start, t_end = t_span
+        state = self.model.y0() if y0 is None else np.asarray(y0, dtype=float)
+        segments = []
+        t_collisions = []
+
+        while t_start < t_end:
+            sol = integrator.solve(self.model, (t_start, t_end), state, events=self.event, dense_output=True)
+            segments.append(DenseTrajectory.from_solution(sol, dtype=dtype))
+            if sol.status != 1:
+                break
+            t_hit = sol.t_events[0][0]
+            t_collisions.append(t_hit)
+            if len(t_collisions) > self.max_collisions:
+                raise RuntimeError("too many collisions (balls resting in contact?)")
+            state = self.apply_impulse(sol.y_events[0][0])
+            t_start = t_hit
+
+        return DenseTrajectory.concatenate(segments), np.array(t_collisions)
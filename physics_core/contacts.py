@@ -0,0 +1,203 @@
+"""
+多球接触的宽相 / 窄相工具: 先用廉价的方法挑出可能接触的球对, 再只对这些球对算距离和冲量
+不用再像 prac_lato6.py / WRONG2.py 那样把每一对都比较一遍
+"""
+
+import numpy as np
+
+
+def sweep_and_prune(x, reach, order=None):
+    """
+    Broad phase along one axis: all pairs (i, j) with |x_i - x_j| < reach.
+
+    Sorting dominates the cost; pass the `order` returned by the previous call back in, the
+    nearly sorted sequence is then re-sorted by a stable (run-detecting) sort in close to linear
+    time. Returns (i, j, order) with i, j index arrays of the candidate pairs.
+    """
+    x = np.asarray(x)
+    n = len(x)
+    if order is None:
+        order = np.argsort(x, kind='stable')
+    else:
+        order = order[np.argsort(x[order], kind='stable')]
+    xs = x[order]
+    # For each sorted ball, the first ball to its right that is out of reach
+    end = np.searchsorted(xs, xs + reach, side='left')
+    counts = end - np.arange(n) - 1
+    total = int(counts.sum())
+    first = np.repeat(np.arange(n), counts)
+    starts = np.cumsum(counts) - counts
+    second = first + 1 + np.arange(total) - np.repeat(starts, counts)
+    return order[first], order[second], order
+
+
+def independent_pairs(i, j, n):
+    """
+    Mask of a set of pairs in which every ball appears at most once, earlier pairs first.
+    Resolving such a set in one vectorized pass gives the same result as resolving its pairs
+    one by one; repeating passes propagates impulses along chains (Newton's cradle).
+    """
+    index = np.arange(len(i))
+    first = np.full(n, len(i))
+    np.minimum.at(first, i, index)
+    np.minimum.at(first, j, index)
+    return (first[i] == index) & (first[j] == index)
+
+
+class ImpulseSolver2D:
+    """
+    Restitution impulses for many ball pairs at once, e.g. the two balls of every member of
+    an ensemble, or the candidate pairs of a broad phase.
+
+        solver = ImpulseSolver2D(capacity=N, m1=0.1, m2=0.1, e=e_values, radius=0.05)
+        hits = solver.resolve(x1, y1, vx1, vy1, x2, y2, vx2, vy2)   # velocities updated in place
+
+    Positions and velocities are (n,) arrays, n <= capacity, one entry per pair (component-major,
+    like rk4_batch). A pair gets an impulse when its balls overlap and approach each other;
+    everything else is masked out arithmetically. All work arrays are allocated here, so
+    resolve() itself allocates nothing.
+    m1, m2 and e may be scalars or (capacity,) arrays.
+    """
+
+    def __init__(self, capacity, m1=1.0, m2=1.0, e=1.0, radius=0.05):
+        self.capacity = capacity
+        self.contact_distance = 2 * radius
+        m1 = np.broadcast_to(np.asarray(m1, dtype=float), (capacity,))
+        m2 = np.broadcast_to(np.asarray(m2, dtype=float), (capacity,))
+        e = np.broadcast_to(np.asarray(e, dtype=float), (capacity,))
+        self._inv_m1 = 1.0 / m1
+        self._inv_m2 = 1.0 / m2
+        # J = -(1 + e) v_n / (1/m1 + 1/m2), v_n the normal component of the relative velocity
+        self._factor = -(1.0 + e) / (self._inv_m1 + self._inv_m2)
+        self._nx = np.empty(capacity)
+        self._ny = np.empty(capacity)
+        self._dist = np.empty(capacity)
+        self._vn = np.empty(capacity)
+        self._tmp = np.empty(capacity)
+        self._hit = np.empty(capacity, dtype=bool)
+        self._approach = np.empty(capacity, dtype=bool)
+
+    def resolve(self, x1, y1, vx1, vy1, x2, y2, vx2, vy2):
+        """
+        Updates vx1, vy1, vx2, vy2 in place; returns the number of pairs that got an impulse.
+        """
+        n = len(x1)
+        if n > self.capacity:
+            raise ValueError(f"{n} pairs, capacity is {self.capacity}")
+        nx, ny, dist, vn, tmp = self._nx[:n], self._ny[:n], self._dist[:n], self._vn[:n], self._tmp[:n]
+        hit, approach = self._hit[:n], self._approach[:n]
+
+        np.subtract(x2, x1, out=nx)
+        np.subtract(y2, y1, out=ny)
+        np.hypot(nx, ny, out=dist)
+        np.less(dist, self.contact_distance, out=hit)
+        np.maximum(dist, 1e-300, out=dist)
+        nx /= dist
+        ny /= dist
+
+        np.subtract(vx2, vx1, out=vn)
+        vn *= nx
+        np.subtract(vy2, vy1, out=tmp)
+        tmp *= ny
+        vn += tmp
+        np.less(vn, 0.0, out=approach)
+        np.logical_and(hit, approach, out=hit)
+
+        # Impulse magnitude, zero where there is no approaching contact
+        vn *= self._factor[:n]
+        vn *= hit
+        np.multiply(vn, nx, out=tmp)
+        np.multiply(tmp, self._inv_m2[:n], out=dist)
+        vx2 += dist
+        np.multiply(tmp, self._inv_m1[:n], out=dist)
+        vx1 -= dist
+        np.multiply(vn, ny, out=tmp)
+        np.multiply(tmp, self._inv_m2[:n], out=dist)
+        vy2 += dist
+        np.multiply(tmp, self._inv_m1[:n], out=dist)
+        vy1 -= dist
+        return int(np.count_nonzero(hit))
+
+
+def _expand(starts, ends):
+    # Concatenation of the ranges [starts[k], ends[k]) and the k each entry came from
+    counts = np.maximum(ends - starts, 0)
+    owner = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.cumsum(counts) - counts
+    return owner, starts[owner] + np.arange(owner.size) - offsets[owner]
+
+
+class SpatialHash:
+    """
+    Uniform-grid broad phase in 2D: all pairs of points closer than `reach`.
+
+        grid = SpatialHash(2 * r_ball)
+        i, j = grid.pairs(x, y)        # call again every step
+
+    The cell size equals the reach, so partners of a point sit in its own cell or one of the
+    eight around it. Points are kept sorted by cell; like sweep_and_prune, the order from the
+    previous call is re-sorted, which is close to linear while points move less than a cell
+    per step. Neighbour cells are looked up among the occupied cells only, so empty space costs
+    nothing. Each point is compared with the later points of its own cell and with the points
+    of four neighbour cells: every pair is found once, and the work is linear in the number of
+    points at bounded density.
+    """
+
+    def __init__(self, reach):
+        self.reach = reach
+        self._order = None
+        self.n_candidates = 0
+
+    def cells(self, x, y):
+        """
+        Integer cell coordinates of the points (origin fixed at a multiple of the cell size).
+        """
+        cx = np.floor(np.asarray(x) / self.reach).astype(np.int64)
+        cy = np.floor(np.asarray(y) / self.reach).astype(np.int64)
+        return cx - cx.min(), cy - cy.min()
+
+    def pairs(self, x, y):
+        """
+        Index arrays (i, j), i != j, of all pairs with distance < reach.
+        """
+        x, y = np.asarray(x), np.asarray(y)
+        n = len(x)
+        if n < 2:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+        cx, cy = self.cells(x, y)
+        # Row-major cell key; the spare row keeps the (+1, -1) neighbour from wrapping into this column
+        rows = int(cy.max()) + 2
+        key = cx * rows + cy
+        if self._order is None or len(self._order) != n:
+            order = np.argsort(key, kind='stable')
+        else:
+            order = self._order[np.argsort(key[self._order], kind='stable')]
+        self._order = order
+        sorted_key = key[order]
+
+        # Occupied cells: their keys and the range of sorted points in each
+        start = np.flatnonzero(np.diff(sorted_key)) + 1
+        cell_start = np.concatenate(([0], start))
+        cell_end = np.concatenate((start, [n]))
+        cell_key = sorted_key[cell_start]
+        cell_of = np.repeat(np.arange(len(cell_key)), cell_end - cell_start)
+
+        # Own cell: the points after this one; neighbours: right column (three rows) and the row above
+        first, second = _expand(np.arange(1, n + 1), cell_end[cell_of])
+        found_i, found_j = [first], [second]
+        for shift in (rows - 1, rows, rows + 1, 1):
+            target = cell_key + shift
+            index = np.minimum(np.searchsorted(cell_key, target), len(cell_key) - 1)
+            occupied = cell_key[index] == target
+            lo = np.where(occupied, cell_start[index], 0)[cell_of]
+            hi = np.where(occupied, cell_end[index], 0)[cell_of]
+            owner, other = _expand(lo, hi)
+            found_i.append(owner)
+            found_j.append(other)
+        i = order[np.concatenate(found_i)]
+        j = order[np.concatenate(found_j)]
+        self.n_candidates = len(i)
+
+        close = (x[j] - x[i])**2 + (y[j] - y[i])**2 < self.reach**2
+        return i[close], j[close]
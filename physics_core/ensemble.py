@@ -0,0 +1,136 @@
+"""
+V_Spring 的系综计算: 一组 (k, F0, omega, x0, y0) 参数分块交给进程池, 每个进程用 odeint 求解,
+结果直接写进同一块共享内存, 用来画频率响应曲线
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import kernels
+from .models import VSpringModel
+
+# Columns of the parameter grid
+ENSEMBLE_PARAMS = ('k', 'F0', 'omega', 'x0', 'y0')
+
+
+def _solve_chunk(args):
+    # Worker: solve rows [start, stop) and write them into the shared result array
+    from scipy.integrate import odeint
+
+    shm_name, shape, start, params, t, fixed, rtol, atol = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        states = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for i, (k, F0, omega, x0, y0) in enumerate(params):
+            constants = (fixed['m'], k, fixed['L0'], fixed['g'], F0, omega, fixed['c'])
+            rhs = kernels.make_rhs(kernels.v_spring_kernel, 4, *constants, reuse_out=True)
+            # odeint (LSODA) switches to BDF by itself on stiff members, the analytic
+            # Jacobian saves it the finite-difference RHS calls there
+            jac = kernels.make_jac(kernels.v_spring_jac_kernel, 4, *constants)
+            states[start + i] = odeint(rhs, [x0, y0, 0.0, 0.0], t, Dfun=jac, tfirst=True, rtol=rtol, atol=atol)
+        del states
+    finally:
+        shm.close()
+    return start, len(params)
+
+
+class EnsembleResult:
+    """
+    Trajectories of an ensemble run.
+    `states` is (N, T, 4) = (x, y, vx, vy) and lives in the shared memory block the workers wrote;
+    call close() (or drop the result) when done with it.
+    """
+
+    def __init__(self, params, t, shm):
+        self.params = params
+        self.t = t
+        # states before _shm: on garbage collection the view is released before the block
+        self.states = np.ndarray((len(params), len(t), 4), dtype=np.float64, buffer=shm.buf)
+        self._shm = shm
+
+    def __len__(self):
+        return len(self.params)
+
+    def amplitude(self, component=1, settle=0.5):
+        """
+        Steady-state amplitude (max - min) / 2 of one state component for every member,
+        measured after the first `settle` fraction of the run.
+        """
+        start = int(len(self.t) * settle)
+        window = self.states[:, start:, component]
+        return 0.5 * (window.max(axis=1) - window.min(axis=1))
+
+    def close(self):
+        if self._shm is not None:
+            self.states = None
+            self._shm.close()
+            self._shm = None
+
+
+def run_ensemble(params, t, model=None, workers=None, chunk_size=None, rtol=1e-6, atol=1e-8):
+    """
+    Solves equations_of_motion of V_Spring for every row of `params`, an (N, 5) array of
+    (k, F0, omega, x0, y0) (initial velocities are zero). The other constants come from `model`.
+    Rows are split into chunks over a ProcessPoolExecutor; workers=1 runs in this process.
+    """
+    params = np.atleast_2d(np.asarray(params, dtype=float))
+    if params.shape[1] != len(ENSEMBLE_PARAMS):
+        raise ValueError(f"params must have columns {ENSEMBLE_PARAMS}, got shape {params.shape}")
+    t = np.asarray(t, dtype=float)
+    if model is None:
+        model = VSpringModel()
+    fixed = {name: model.params[name] for name in ('m', 'L0', 'g', 'c')}
+
+    n = len(params)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker keeps the pool busy when run times differ
+        chunk_size = max(1, -(-n // (4 * workers)))
+
+    shape = (n, len(t), 4)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+    try:
+        chunks = [(shm.name, shape, start, params[start:start + chunk_size], t, fixed, rtol, atol)
+                  for start in range(0, n, chunk_size)]
+        if workers <= 1:
+            for chunk in chunks:
+                _solve_chunk(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_solve_chunk, chunks))
+        result = EnsembleResult(params, t, shm)
+    except BaseException:
+        shm.close()
+        raise
+    finally:
+        # The name is not needed any more, the mapping stays valid until close()
+        shm.unlink()
+    return result
+
+
+def frequency_response(omegas, k=10.0, F0=1.0, x0=0.0, y0=-1.0, t_max=60.0, dt=0.01, component=1, **kwargs):
+    """
+    Steady-state amplitude against forcing frequency; k and F0 may be arrays too,
+    the result then has shape (len(k or F0), len(omegas)).
+    """
+    omegas = np.asarray(omegas, dtype=float)
+    k, F0 = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(F0, dtype=float))
+    rows = np.atleast_1d(k).size
+    grid = np.empty((rows, len(omegas), 5))
+    grid[..., 0] = np.atleast_1d(k).ravel()[:, None]
+    grid[..., 1] = np.atleast_1d(F0).ravel()[:, None]
+    grid[..., 2] = omegas
+    grid[..., 3] = x0
+    grid[..., 4] = y0
+
+    t = np.arange(0, t_max, dt)
+    result = run_ensemble(grid.reshape(-1, 5), t, **kwargs)
+    try:
+        amplitude = result.amplitude(component).reshape(rows, len(omegas))
+    finally:
+        result.close()
+    return amplitude if k.ndim else amplitude[0]
@@ -0,0 +1,174 @@
+"""
+积分器: solve_ivp 的封装, 以及批量参数扫描用的定步长 RK4
+"""
+
+import numpy as np
+
+from .precision import get_dtype
+
+
+# Fixed-step Runge-Kutta 4 on a stacked state
+def rk4_batch(f, y0, t_eval, substeps=2, dtype=None):
+    """
+    Integrates dY/dt = f(t, Y, out) for all rows of y0 at once.
+    y0 has shape (N, n_state); f works on the transposed (n_state, N) state, so every
+    component row is contiguous.
+    t_eval must be evenly spaced; each output interval is split into `substeps` RK4 steps.
+    Returns an array of shape (N, len(t_eval), n_state) in `dtype` (default: the global precision).
+    """
+    if dtype is None:
+        dtype = get_dtype()
+    t_eval = np.asarray(t_eval, dtype=float)
+    Y = np.array(np.transpose(y0), dtype=dtype, order='C')
+    n_state, N = Y.shape
+    result = np.empty((N, len(t_eval), n_state), dtype=dtype)
+    result[:, 0] = Y.T
+    if len(t_eval) < 2:
+        return result
+
+    h = (t_eval[1] - t_eval[0]) / substeps
+    # Work buffers, reused for every step
+    k1 = np.empty_like(Y)
+    k2 = np.empty_like(Y)
+    k3 = np.empty_like(Y)
+    k4 = np.empty_like(Y)
+    tmp = np.empty_like(Y)
+
+    t = t_eval[0]
+    for i in range(1, len(t_eval)):
+        for _ in range(substeps):
+            f(t, Y, k1)
+            np.multiply(k1, 0.5 * h, out=tmp)
+            tmp += Y
+            f(t + 0.5 * h, tmp, k2)
+            np.multiply(k2, 0.5 * h, out=tmp)
+            tmp += Y
+            f(t + 0.5 * h, tmp, k3)
+            np.multiply(k3, h, out=tmp)
+            tmp += Y
+            f(t + h, tmp, k4)
+
+            # Y += h/6 * (k1 + 2*k2 + 2*k3 + k4)
+            k2 += k3
+            k2 *= 2.0
+            k2 += k1
+            k2 += k4
+            k2 *= h / 6.0
+            Y += k2
+            t += h
+        # Avoid accumulating round-off in t
+        t = t_eval[i]
+        result[:, i] = Y.T
+    return result
+
+
+IMPLICIT_METHODS = ('Radau', 'BDF', 'LSODA')
+
+
+def _finite_difference_jacobian(model, t, y):
+    # Forward differences, used only for the stiffness estimate of models without a Jacobian
+    y = np.asarray(y, dtype=float)
+    f0 = np.asarray(model.rhs(t, y))
+    J = np.empty((len(y), len(y)))
+    for j in range(len(y)):
+        h = 1e-7 * max(1.0, abs(y[j]))
+        y_step = y.copy()
+        y_step[j] += h
+        J[:, j] = (np.asarray(model.rhs(t, y_step)) - f0) / h
+    return J
+
+
+class Integrator:
+    """
+    Solver settings, shared by single runs and batch sweeps.
+    method='auto' picks RK45, or `stiff_method` when the problem looks stiff (see stiffness()).
+    Implicit methods get the model's analytic Jacobian when it has one.
+    """
+
+    def __init__(self, method='auto', rtol=1e-3, atol=1e-6, substeps=2, stiff_method='Radau',
+                 stiffness_threshold=3.0):
+        self.method = method
+        self.rtol = rtol
+        self.atol = atol
+        self.substeps = substeps  # RK4 steps per output interval in solve_batch
+        self.stiff_method = stiff_method
+        self.stiffness_threshold = stiffness_threshold
+
+    def __repr__(self):
+        return (f"Integrator(method={self.method!r}, rtol={self.rtol}, atol={self.atol}, "
+                f"substeps={self.substeps}, stiff_method={self.stiff_method!r})")
+
+    def stiffness(self, model, t_span, y0, t_eval=None):
+        """
+        Fastest decay rate of the Jacobian at the start (largest -Re(eigenvalue)) times the step
+        the output grid asks for. RK45 is only stable for steps below about 3.3 / that rate, so a
+        value above the threshold means an explicit solver would be held back by stability
+        rather than accuracy. Fast undamped oscillations (purely imaginary eigenvalues) do not
+        count: implicit methods do not help there.
+        """
+        J = model.jacobian(t_span[0], y0) if model.has_jacobian else _finite_difference_jacobian(model, t_span[0], y0)
+        radius = max(0.0, -np.linalg.eigvals(J).real.min())
+        if t_eval is not None and len(t_eval) > 1:
+            h_ref = abs(t_eval[1] - t_eval[0])
+        else:
+            h_ref = abs(t_span[1] - t_span[0]) / 100
+        return radius * h_ref
+
+    def choose_method(self, model, t_span, y0, t_eval=None):
+        if self.method != 'auto':
+            return self.method
+        if self.stiffness(model, t_span, y0, t_eval) > self.stiffness_threshold:
+            return self.stiff_method
+        return 'RK45'
+
+    def solve(self, model, t_span, y0=None, t_eval=None, **kwargs):
+        """
+        Single run through solve_ivp, returns its result object.
+        """
+        from scipy.integrate import solve_ivp
+
+        # An array, not a list: the stiffness estimate hands y0 to the compiled Jacobian kernel
+        y0 = model.y0() if y0 is None else np.asarray(y0, dtype=float)
+        if 'method' not in kwargs:
+            kwargs['method'] = self.choose_method(model, t_span, y0, t_eval)
+        if kwargs['method'] in IMPLICIT_METHODS and model.has_jacobian:
+            kwargs.setdefault('jac', model.jacobian)
+        kwargs.setdefault('rtol', self.rtol)
+        kwargs.setdefault('atol', self.atol)
+        sol = solve_ivp(model.rhs, t_span, y0, t_eval=t_eval, **kwargs)
+        if sol.status == -1:
+            raise RuntimeError(sol.message)
+        return sol
+
+    def solve_dense(self, model, t_span, y0=None, dtype=np.float64, **kwargs):
+        """
+        Single run without an output grid; returns a DenseTrajectory of the solver's steps,
+        to be sampled at any times afterwards.
+        """
+        from .dense import DenseTrajectory
+
+        sol = self.solve(model, t_span, y0, dense_output=True, **kwargs)
+        return DenseTrajectory.from_solution(sol, dtype=dtype)
+
+    def solve_batch(self, model, t_eval, y0=None, **sweep):
+        """
+        Integrates many parameter sets at once with rk4_batch, in the global precision.
+        `sweep` holds (N,) arrays of the swept parameters (scalars are broadcast),
+        y0 is (n_state,) or (N, n_state). Returns an (N, T, n_state) array.
+        """
+        dtype = get_dtype()
+        arrays = np.broadcast_arrays(*[np.asarray(v, dtype=dtype) for v in sweep.values()])
+        sweep = {name: a.ravel() for name, a in zip(sweep, arrays)}
+        N = arrays[0].size if arrays else 1
+
+        if y0 is None:
+            y0 = model.y0()
+        y0 = np.asarray(y0, dtype=dtype)
+        if y0.shape[-1:] != (model.n_state,) or y0.ndim > 2:
+            raise ValueError(f"y0 must be ({model.n_state},) or (N, {model.n_state}), got shape {y0.shape}")
+        if y0.ndim == 2 and not arrays:
+            N = y0.shape[0]
+        elif y0.ndim == 2 and y0.shape[0] not in (1, N):
+            raise ValueError(f"y0 has {y0.shape[0]} initial states for a sweep of {N} parameter sets")
+        y0 = np.broadcast_to(y0, (N, model.n_state))
+        return rk4_batch(model.batch_rhs(dtype=dtype, **sweep), y0, t_eval, substeps=self.substeps, dtype=dtype)
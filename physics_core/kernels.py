@@ -0,0 +1,299 @@
+"""
+ODE 右端函数的编译内核: 装了 numba 就用 njit 编译, 没装就退回到普通 Python/NumPy
+内核把结果写进预先分配好的数组里, 不再每次调用都新建 list
+
+    python -m physics_core.kernels    # benchmark, RHS evaluations per second before/after
+"""
+
+import functools
+import importlib.util
+import math
+import os
+
+import numpy as np
+
+HAVE_NUMBA = importlib.util.find_spec('numba') is not None
+# PHYSICS_CORE_JIT=0 keeps the plain Python kernels (short runs, where compiling costs more than it saves)
+JIT_ENABLED = os.environ.get('PHYSICS_CORE_JIT', '1') != '0'
+
+
+class _LazyJit:
+    """
+    A kernel that is compiled on its first call rather than at import: importing numba alone
+    takes about 0.35 s, which a run that never calls a kernel should not pay.
+    """
+
+    def __init__(self, func, options):
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._options = options
+        self._compiled = None
+
+    @property
+    def compiled(self):
+        if self._compiled is None:
+            if HAVE_NUMBA and JIT_ENABLED:
+                from numba import njit as numba_njit
+                self._compiled = numba_njit(**self._options)(self.py_func)
+            else:
+                # No numba: keep the plain Python function
+                self._compiled = self.py_func
+        return self._compiled
+
+    def __call__(self, *args):
+        return self.compiled(*args)
+
+
+def njit(*args, **options):
+    if len(args) == 1 and callable(args[0]):
+        return _LazyJit(args[0], {})
+    return lambda func: _LazyJit(func, options)
+
+
+def compiled(kernel):
+    """
+    The callable behind a kernel, compiling it if needed. Kernels handed to another jitted
+    function (the symplectic loops) must be passed like this, numba only accepts its own dispatchers.
+    """
+    return kernel.compiled if isinstance(kernel, _LazyJit) else kernel
+
+
+# Two balls on strings with a vertically oscillating pivot (equations in Lato/prac_lato6.py)
+@njit(cache=True)
+def lato_pivot_kernel(t, y, out, g, L, A, omega_p):
+    theta1, z1, theta2, z2 = y[0], y[1], y[2], y[3]
+    pivot_force = A * omega_p**2 * math.cos(omega_p * t)
+    out[0] = z1
+    out[1] = -(g / L) * math.sin(theta1) - pivot_force * math.cos(theta1) / L
+    out[2] = z2
+    out[3] = -(g / L) * math.sin(theta2) - pivot_force * math.cos(theta2) / L
+    return out
+
+
+# Two balls on rigid ropes with a sinusoidal driving angle (lato_lato_rigid in Lato/sim_rev_re_r.py)
+@njit(cache=True)
+def lato_rigid_kernel(t, y, out, g, L, A_drive, omega_drive):
+    phi1, dphi1, phi2, dphi2 = y[0], y[1], y[2], y[3]
+    drive_phi = A_drive * math.sin(omega_drive * t)
+    out[0] = dphi1
+    out[1] = -(g / L) * math.sin(phi1 + drive_phi) + (dphi2 - dphi1) * dphi2 / L
+    out[2] = dphi2
+    out[3] = -(g / L) * math.sin(phi2 + drive_phi) - (dphi2 - dphi1) * dphi1 / L
+    return out
+
+
+# Ball on a rotating string in polar coordinates (lato_lato in Lato/sim.py)
+@njit(cache=True)
+def lato_polar_kernel(t, y, out, m, g, omega):
+    r, dr, phi, dphi = y[0], y[1], y[2], y[3]
+    T = m * (omega**2 * r + g * math.sin(phi))
+    out[0] = dr
+    out[1] = T * math.cos(phi) / m - omega**2 * r - g * math.sin(phi)
+    out[2] = dphi
+    out[3] = (T * math.sin(phi) - g * math.cos(phi)) / (m * r) - 2 * dr * omega / r
+    return out
+
+
+# Mass hanging between two springs (equations_of_motion in V_Spring/simul.py)
+@njit(cache=True)
+def v_spring_kernel(t, y, out, m, k, L0, g, F0, omega, c):
+    x, yy, vx, vy = y[0], y[1], y[2], y[3]
+    L1 = math.sqrt((x + 1.0)**2 + (yy + L0)**2)
+    L2 = math.sqrt((x - 1.0)**2 + (yy + L0)**2)
+    # Avoid division by zero
+    if L1 == 0.0:
+        L1 = 1e-6
+    if L2 == 0.0:
+        L2 = 1e-6
+    Fx_spring = -k * (L1 - L0) * ((x + 1.0) / L1) - k * (L2 - L0) * ((x - 1.0) / L2)
+    Fy_spring = -k * (L1 - L0) * ((yy + L0) / L1) - k * (L2 - L0) * ((yy + L0) / L2)
+    F_ext = F0 * math.cos(omega * t)
+    out[0] = vx
+    out[1] = vy
+    # c is an optional viscous damping (0 in the original scripts)
+    out[2] = (Fx_spring - c * vx) / m
+    out[3] = (Fy_spring + F_ext - m * g - c * vy) / m
+    return out
+
+
+# Angular accelerations a(t, q) of the pendulum Hamiltonians, for the symplectic integrators.
+# q holds one angle per ball, out gets one acceleration per ball.
+@njit(cache=True)
+def driven_pendulum_accel(t, q, out, g, L, amplitude, omega_drive):
+    # Horizontal drive of Lato/FFT_solid.py
+    drive_force = amplitude * math.cos(omega_drive * t)
+    for j in range(q.shape[0]):
+        out[j] = -(g / L) * math.sin(q[j]) + (drive_force / L) * math.cos(q[j])
+    return out
+
+
+@njit(cache=True)
+def pivot_pendulum_accel(t, q, out, g, L, A, omega_p):
+    # Vertically oscillating pivot of Lato/prac_lato6.py (same parameters as lato_pivot_kernel)
+    pivot_force = A * omega_p**2 * math.cos(omega_p * t)
+    for j in range(q.shape[0]):
+        out[j] = -(g / L) * math.sin(q[j]) - pivot_force * math.cos(q[j]) / L
+    return out
+
+
+# Analytic Jacobians d f / d y, written into a (4, 4) array
+@njit(cache=True)
+def lato_pivot_jac_kernel(t, y, out, g, L, A, omega_p):
+    theta1, theta2 = y[0], y[2]
+    pivot_force = A * omega_p**2 * math.cos(omega_p * t)
+    out[:, :] = 0.0
+    out[0, 1] = 1.0
+    out[1, 0] = -(g / L) * math.cos(theta1) + pivot_force * math.sin(theta1) / L
+    out[2, 3] = 1.0
+    out[3, 2] = -(g / L) * math.cos(theta2) + pivot_force * math.sin(theta2) / L
+    return out
+
+
+@njit(cache=True)
+def lato_rigid_jac_kernel(t, y, out, g, L, A_drive, omega_drive):
+    phi1, dphi1, phi2, dphi2 = y[0], y[1], y[2], y[3]
+    drive_phi = A_drive * math.sin(omega_drive * t)
+    out[:, :] = 0.0
+    out[0, 1] = 1.0
+    out[1, 0] = -(g / L) * math.cos(phi1 + drive_phi)
+    out[1, 1] = -dphi2 / L
+    out[1, 3] = (2 * dphi2 - dphi1) / L
+    out[2, 3] = 1.0
+    out[3, 1] = (2 * dphi1 - dphi2) / L
+    out[3, 2] = -(g / L) * math.cos(phi2 + drive_phi)
+    out[3, 3] = -dphi1 / L
+    return out
+
+
+@njit(cache=True)
+def v_spring_jac_kernel(t, y, out, m, k, L0, g, F0, omega, c):
+    x, yy = y[0], y[1]
+    out[:, :] = 0.0
+    out[0, 2] = 1.0
+    out[1, 3] = 1.0
+    out[2, 2] = -c / m
+    out[3, 3] = -c / m
+    # Spring force F = -k (d - L0 d / |d|), d = position relative to the anchor;
+    # dF/dd = -k ((1 - L0 / |d|) I + L0 d d^T / |d|^3)
+    for anchor_x in (-1.0, 1.0):
+        dx = x - anchor_x
+        dy = yy + L0
+        length = math.sqrt(dx**2 + dy**2)
+        if length == 0.0:
+            length = 1e-6
+        k3 = L0 / length**3
+        diag = 1.0 - L0 / length
+        out[2, 0] -= k * (diag + k3 * dx * dx) / m
+        out[2, 1] -= k * k3 * dx * dy / m
+        out[3, 0] -= k * k3 * dx * dy / m
+        out[3, 1] -= k * (diag + k3 * dy * dy) / m
+    return out
+
+
+def make_rhs(kernel, n_state, *params, reuse_out=False):
+    """
+    Wraps a kernel as fun(t, y) for solve_ivp / odeint(tfirst=True).
+    With reuse_out=True every call writes into the same preallocated array. That is safe for
+    odeint and our own fixed-step loops, but not for solve_ivp, whose solvers keep the previous
+    f(t, y) around (RK45 steps, finite-difference Jacobians), so there a fresh array is returned.
+    """
+    params = tuple(float(p) for p in params)
+    kernel = compiled(kernel)
+    if reuse_out:
+        out = np.empty(n_state)
+
+        def rhs(t, y):
+            return kernel(t, y, out, *params)
+    else:
+        def rhs(t, y):
+            return kernel(t, y, np.empty(n_state), *params)
+    return rhs
+
+
+def make_jac(jac_kernel, n_state, *params):
+    """
+    Wraps a Jacobian kernel as jac(t, y) for solve_ivp, or odeint(Dfun=..., tfirst=True).
+    """
+    params = tuple(float(p) for p in params)
+    jac_kernel = compiled(jac_kernel)
+
+    def jac(t, y):
+        return jac_kernel(t, y, np.empty((n_state, n_state)), *params)
+    return jac
+
+
+def lato_pivot_rhs(g=9.81, L=1.0, A=0.1, omega_p=2.0, reuse_out=False):
+    return make_rhs(lato_pivot_kernel, 4, g, L, A, omega_p, reuse_out=reuse_out)
+
+
+def lato_rigid_rhs(g=9.81, L=1.0, A_drive=0.1, omega_drive=2.0, reuse_out=False):
+    return make_rhs(lato_rigid_kernel, 4, g, L, A_drive, omega_drive, reuse_out=reuse_out)
+
+
+def lato_polar_rhs(m=1.0, g=9.81, omega=2.0, reuse_out=False):
+    return make_rhs(lato_polar_kernel, 4, m, g, omega, reuse_out=reuse_out)
+
+
+def v_spring_rhs(m=1.0, k=10.0, L0=1.0, g=9.8, F0=100.0, omega=1.0, c=0.0, reuse_out=False):
+    return make_rhs(v_spring_kernel, 4, m, k, L0, g, F0, omega, c, reuse_out=reuse_out)
+
+
+# Reference implementations, written like the original scripts
+def _lato_pivot_reference(t, y, g=9.81, L=1.0, A=0.1, omega_p=2.0):
+    theta1, z1, theta2, z2 = y
+    pivot_force = A * omega_p**2 * np.cos(omega_p * t)
+    dz1 = -(g/L) * np.sin(theta1) - pivot_force * np.cos(theta1) / L
+    dz2 = -(g/L) * np.sin(theta2) - pivot_force * np.cos(theta2) / L
+    return [z1, dz1, z2, dz2]
+
+
+def _lato_polar_reference(t, y, m=1.0, g=9.81, omega=2.0):
+    r, dr, phi, dphi = y
+    T = m * (omega**2 * r + g * np.sin(phi))
+    d2r = T * np.cos(phi) / m - omega**2 * r - g * np.sin(phi)
+    d2phi = (T * np.sin(phi) - g * np.cos(phi)) / (m * r) - 2 * dr * omega / r
+    return [dr, d2r, dphi, d2phi]
+
+
+def _v_spring_reference(t, state, m=1.0, k=10.0, L0=1.0, g=9.8, F0=100.0, omega=1.0):
+    x, y, vx, vy = state
+    L1 = np.sqrt((x + 1.0)**2 + (y + L0)**2)
+    L2 = np.sqrt((x - 1.0)**2 + (y + L0)**2)
+    if L1 == 0:
+        L1 = 1e-6
+    if L2 == 0:
+        L2 = 1e-6
+    Fx_spring = (-k * (L1 - L0) * ((x + 1.0) / L1) - k * (L2 - L0) * ((x - 1.0) / L2))
+    Fy_spring = (-k * (L1 - L0) * ((y + L0) / L1) - k * (L2 - L0) * ((y + L0) / L2))
+    F_ext = F0 * np.cos(omega * t)
+    return [vx, vy, Fx_spring / m, (Fy_spring + F_ext - m * g) / m]
+
+
+def benchmark(n_calls=100000):
+    """
+    Prints RHS evaluations per second for the original-style functions and the kernels.
+    """
+    import time
+
+    cases = [
+        ("lato pivot (prac_lato6)", _lato_pivot_reference, lato_pivot_rhs(reuse_out=True), [0.1, 0.0, -0.1, 0.0]),
+        ("lato polar (sim)", _lato_polar_reference, lato_polar_rhs(reuse_out=True), [1.0, 0.0, 0.1, 0.0]),
+        ("v_spring (simul)", _v_spring_reference, v_spring_rhs(reuse_out=True), [0.0, -1.0, 0.0, 0.0]),
+    ]
+    print(f"numba: {'yes' if HAVE_NUMBA and JIT_ENABLED else 'no (pure Python/NumPy fallback)'}")
+    for name, reference, kernel, y0 in cases:
+        y = np.array(y0)
+        assert np.allclose(reference(0.3, y), kernel(0.3, y))
+        kernel(0.0, y)  # compile outside of the timing
+
+        rates = []
+        for func in (reference, kernel):
+            start = time.perf_counter()
+            for i in range(n_calls):
+                func(i * 1e-4, y)
+            rates.append(n_calls / (time.perf_counter() - start))
+        print(f"{name:26s} before {rates[0]:12,.0f}/s   after {rates[1]:12,.0f}/s   x{rates[1] / rates[0]:.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,292 @@
+"""
+实时显示: 积分器在后台线程 (或进程) 里按真实时间推进, 把最新状态写进环形缓冲区;
+界面只在定时器里取最新的一帧, 用 blit 重画绳子和小球. 画得慢只会跳帧, 不会拖慢模拟,
+也不再像 prac_lato3.py / simulated_3.py 那样在 update 回调里积分, 改全局变量
+
+    ring = StateRing(model.n_state)
+    sim = LiveSimulation(model_stepper(model), model.y0(), ring, dt=1e-3)
+    sim.start()
+    LiveViewer(model, ring).show()
+    sim.stop()
+"""
+
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class StateRing:
+    """
+    Single-producer ring buffer of (t, values) rows, without locks.
+
+    The producer writes the row of slot `count % capacity` and then advances `count` (one aligned
+    int64 store). A reader copies the newest row and checks afterwards that the producer has not
+    come round to that slot again in the meantime, retrying if it has. With shared=True the
+    buffer lives in multiprocessing.shared_memory, so a simulation process can publish into it;
+    the creating process unlinks it in close().
+    """
+
+    def __init__(self, n_values, capacity=64, shared=False, name=None):
+        self.n_values = n_values
+        self.capacity = capacity
+        nbytes = 8 * (1 + capacity * (1 + n_values))
+        self._block = None
+        self._owner = name is None
+        if shared or name is not None:
+            self._block = shared_memory.SharedMemory(name=name, create=name is None, size=nbytes)
+            buffer = self._block.buf
+        else:
+            buffer = bytearray(nbytes)
+        self._count = np.ndarray((1,), dtype=np.int64, buffer=buffer)
+        self._rows = np.ndarray((capacity, 1 + n_values), dtype=np.float64, buffer=buffer, offset=8)
+        if self._owner:
+            self._count[0] = 0
+
+    @property
+    def name(self):
+        """
+        Shared memory name for StateRing(n_values, capacity, name=...) in another process.
+        """
+        return None if self._block is None else self._block.name
+
+    @property
+    def count(self):
+        # Number of rows published so far
+        return int(self._count[0])
+
+    def push(self, t, values):
+        n = int(self._count[0])
+        row = self._rows[n % self.capacity]
+        row[0] = t
+        row[1:] = values
+        self._count[0] = n + 1
+
+    def latest(self):
+        """
+        (count, t, values) of the newest row, or None before the first push.
+        """
+        while True:
+            n = int(self._count[0])
+            if n == 0:
+                return None
+            row = self._rows[(n - 1) % self.capacity].copy()
+            if int(self._count[0]) - (n - 1) < self.capacity:
+                return n, row[0], row[1:]
+
+    def since(self, count):
+        """
+        Rows published after `count` (at most capacity - 1 of them): (new count, t (k,), values (k, n)).
+        """
+        while True:
+            n = int(self._count[0])
+            first = max(count, n - self.capacity + 1)
+            rows = self._rows[np.arange(first, n) % self.capacity].copy()
+            # Row k is rewritten once the producer reaches k + capacity
+            if int(self._count[0]) - first < self.capacity:
+                return n, rows[:, 0], rows[:, 1:]
+
+    def close(self):
+        if self._block is not None:
+            self._block.close()
+            if self._owner:
+                self._block.unlink()
+            self._block = None
+
+
+def model_stepper(model):
+    """
+    Classic RK4 step of a model's equations, step(t, y, dt) -> y, advancing the float array y
+    in place. The stage buffers are allocated once, so a step allocates nothing.
+    """
+    rhs = model.rhs_into
+    k1, k2, k3, k4, stage = (np.empty(model.n_state) for _ in range(5))
+
+    def step(t, y, dt):
+        rhs(t, y, k1)
+        np.multiply(k1, dt / 2, out=stage)
+        np.add(stage, y, out=stage)
+        rhs(t + dt / 2, stage, k2)
+        np.multiply(k2, dt / 2, out=stage)
+        np.add(stage, y, out=stage)
+        rhs(t + dt / 2, stage, k3)
+        np.multiply(k3, dt, out=stage)
+        np.add(stage, y, out=stage)
+        rhs(t + dt, stage, k4)
+        # y += dt / 6 (k1 + 2 k2 + 2 k3 + k4), summed in k2
+        np.add(k2, k3, out=k2)
+        np.multiply(k2, 2.0, out=k2)
+        np.add(k2, k1, out=k2)
+        np.add(k2, k4, out=k2)
+        np.multiply(k2, dt / 6, out=k2)
+        np.add(y, k2, out=y)
+        return y
+
+    return step
+
+
+class LiveSimulation:
+    """
+    Runs step(t, state, dt) -> state in a background thread (or process) and publishes
+    publish(state) into a StateRing every `publish_every` steps.
+
+    speed=1 keeps simulated time in step with wall-clock time (sleeping when ahead; when a step
+    is slower than real time it simply runs flat out); speed=None never waits. mode='process'
+    needs a shared ring, and step / publish must survive fork (they are not pickled).
+
+    After stop(), `state` is the final state in thread mode. A process cannot hand its state
+    back, so in process mode stop() takes it from the newest ring row when there is no
+    `publish` (the row is then the whole state), and leaves `state` as it was otherwise.
+    """
+
+    def __init__(self, step, state, ring, dt, t0=0.0, publish_every=10, speed=1.0, publish=None, mode='thread'):
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"unknown mode {mode!r}")
+        if mode == 'process' and ring.name is None:
+            raise ValueError("mode='process' needs StateRing(..., shared=True)")
+        self.step = step
+        self.state = state
+        self.ring = ring
+        self.dt = dt
+        self.t0 = t0
+        self.publish_every = publish_every
+        self.speed = speed
+        self._publishes_state = publish is None
+        self.publish = publish or (lambda state: state)
+        self.mode = mode
+        self._worker = None
+        self._stop = None
+
+    def _run(self, stop):
+        t, state = self.t0, self.state
+        self.ring.push(t, self.publish(state))
+        start = time.perf_counter()
+        while not stop.is_set():
+            for _ in range(self.publish_every):
+                state = self.step(t, state, self.dt)
+                t += self.dt
+            self.ring.push(t, self.publish(state))
+            if self.speed:
+                ahead = start + (t - self.t0) / self.speed - time.perf_counter()
+                if ahead > 0:
+                    stop.wait(ahead)
+        self.state = state
+
+    def start(self):
+        if self.mode == 'thread':
+            self._stop = threading.Event()
+            self._worker = threading.Thread(target=self._run, args=(self._stop,), daemon=True)
+        else:
+            import multiprocessing
+
+            context = multiprocessing.get_context('fork')
+            self._stop = context.Event()
+            self._worker = context.Process(target=self._run, args=(self._stop,), daemon=True)
+        self._worker.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        if self._worker is not None:
+            self._stop.set()
+            self._worker.join(timeout)
+            if self.mode == 'process' and self._publishes_state:
+                # The child publishes after its last step, the newest row is where it stopped
+                newest = self.ring.latest()
+                if newest is not None:
+                    self.state = newest[2]
+            self._worker = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class LiveViewer:
+    """
+    Matplotlib window showing the newest state of a StateRing, `fps` times per second.
+
+    Strings and balls are animated artists: the static axes are drawn once (and again after a
+    resize) and cached, every tick restores that background and blits the lines on top. Ticks
+    with no new state do nothing. `positions(t, values)` gives (anchors, balls), each
+    (n_bodies, 2); the default uses model.positions on a single state column.
+    """
+    colors = ('r', 'b', 'g', 'm', 'c', 'y')
+
+    def __init__(self, model, ring, fps=60, positions=None, figsize=(6, 6)):
+        self.model = model
+        self.ring = ring
+        self.fps = fps
+        self.figsize = figsize
+        if positions is None:
+            def positions(t, values):
+                anchors, balls = model.positions(np.atleast_1d(t), values[:, None])
+                return anchors[0], balls[0]
+        self.positions = positions
+        self.frames = 0
+        self.skipped = 0
+        self._shown = 0
+        self._background = None
+
+    def _setup(self):
+        import matplotlib.pyplot as plt
+
+        self.figure, self.ax = plt.subplots(figsize=self.figsize)
+        xmin, xmax, ymin, ymax = self.model.extent()
+        self.ax.set_xlim(xmin, xmax)
+        self.ax.set_ylim(ymin, ymax)
+        self.ax.set_aspect('equal')
+        newest = self.ring.latest()
+        n_bodies = len(self.positions(newest[1], newest[2])[1]) if newest else 0
+        self.lines = [self.ax.plot([], [], 'o-', color=self.colors[i % len(self.colors)], lw=2, animated=True)[0]
+                      for i in range(n_bodies)]
+        self.clock = self.ax.text(0.02, 0.95, '', transform=self.ax.transAxes, animated=True)
+        self.canvas = self.figure.canvas
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.timer = self.canvas.new_timer(interval=int(1000 / self.fps))
+        self.timer.add_callback(self.update)
+
+    def _on_draw(self, event):
+        # Full redraws (first show, resize) refresh the cached background
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in (*self.lines, self.clock):
+            self.ax.draw_artist(artist)
+
+    def update(self):
+        """
+        One timer tick: blits the newest state if there is one.
+        """
+        newest = self.ring.latest()
+        if newest is None or newest[0] == self._shown or self._background is None:
+            return
+        count, t, values = newest
+        self.skipped += max(0, count - self._shown - 1)
+        self._shown = count
+        anchors, balls = self.positions(t, values)
+        for line, anchor, ball in zip(self.lines, anchors, balls):
+            line.set_data([anchor[0], ball[0]], [anchor[1], ball[1]])
+        self.clock.set_text(f"t = {t:.2f} s")
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+        self.canvas.flush_events()
+        self.frames += 1
+
+    def show(self):
+        """
+        Opens the window and blocks until it is closed.
+        """
+        import matplotlib.pyplot as plt
+
+        while self.ring.latest() is None:
+            time.sleep(0.01)
+        self._setup()
+        self.canvas.draw()
+        self.timer.start()
+        plt.show()
+        self.timer.stop()
@@ -0,0 +1,263 @@
+"""
+模型: 常数 + 运动方程 + 坐标换算, 原来散落在 Lato / V_Spring 各个脚本里的常数块都收到这里
+"""
+
+import numpy as np
+
+from . import kernels
+
+
+class Model:
+    """
+    Base class of the ODE models.
+    Subclasses list their constants in `defaults`, the kernel from kernels.py and the
+    order in which the constants are passed to it.
+    """
+    name = None
+    n_state = 4
+    defaults = {}
+    initial_state = ()
+    state_names = ()  # one name per state component, used as variable names when saving
+    kernel = None
+    jac_kernel = None  # analytic Jacobian, same parameters as kernel; None means finite differences
+    accel_kernel = None  # a(t, q) for the symplectic integrators, when the model is a separable Hamiltonian
+    kernel_params = ()
+
+    def __init__(self, **params):
+        unknown = set(params) - set(self.defaults)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} got unknown parameters: {', '.join(sorted(unknown))}")
+        self.params = {**self.defaults, **params}
+        self._args = tuple(float(self.params[p]) for p in self.kernel_params)
+
+    def __getattr__(self, item):
+        # Constants are readable as attributes, e.g. model.L
+        params = self.__dict__.get('params', {})
+        if item in params:
+            return params[item]
+        raise AttributeError(item)
+
+    def __repr__(self):
+        args = ", ".join(f"{k}={v!r}" for k, v in self.params.items())
+        return f"{type(self).__name__}({args})"
+
+    def rhs(self, t, y):
+        """
+        Right-hand side for solve_ivp, returns a new array on every call.
+        """
+        return self.kernel(t, y, np.empty(self.n_state), *self._args)
+
+    def rhs_into(self, t, y, out):
+        """
+        Right-hand side written into `out`, for fixed-step loops.
+        """
+        return self.kernel(t, y, out, *self._args)
+
+    def batch_rhs(self, dtype=np.float64, **sweep):
+        """
+        Right-hand side f(t, Y, out) for a (n_state, N) stack, one kernel call per column.
+        Models with a vectorized form (LatoRigidModel) override this; only those can sweep parameters.
+        """
+        if sweep:
+            raise TypeError(f"{type(self).__name__} cannot sweep over {', '.join(sorted(sweep))}")
+        kernel, args = kernels.compiled(self.kernel), self._args
+
+        def rhs(t, Y, out):
+            for i in range(Y.shape[1]):
+                kernel(t, Y[:, i], out[:, i], *args)
+            return out
+        return rhs
+
+    @property
+    def has_jacobian(self):
+        return self.jac_kernel is not None
+
+    def jacobian(self, t, y):
+        """
+        Analytic Jacobian d rhs / d y as a new (n_state, n_state) array.
+        """
+        if self.jac_kernel is None:
+            raise NotImplementedError(f"{type(self).__name__} has no analytic Jacobian")
+        return self.jac_kernel(t, y, np.empty((self.n_state, self.n_state)), *self._args)
+
+    def y0(self):
+        return np.array(self.initial_state, dtype=float)
+
+    def positions(self, t, y):
+        """
+        Cartesian anchor and ball positions, both of shape (T, n_bodies, 2).
+        """
+        raise NotImplementedError
+
+    def extent(self):
+        """
+        (xmin, xmax, ymin, ymax) of the scene.
+        """
+        raise NotImplementedError
+
+
+class LatoPivotModel(Model):
+    """
+    Two balls on strings hanging from a vertically oscillating pivot (Lato/prac_lato6.py).
+    """
+    name = "lato_pivot"
+    defaults = {
+        'g': 9.81,      # gravitational acceleration (m/s^2)
+        'L': 1.0,       # length of each string (m)
+        'm': 0.1,       # mass of each ball (kg)
+        'A': 0.1,       # amplitude of vertical oscillation of the pivot (m)
+        'omega_p': 2.0,  # angular frequency of the pivot's oscillation (rad/s)
+        'r_ball': 0.05,  # radius of each ball (m)
+        'e': 1.0,       # coefficient of restitution (elastic collision)
+    }
+    initial_state = (0.1, 0.0, -0.1, 0.0)
+    state_names = ('theta1', 'z1', 'theta2', 'z2')
+    kernel = staticmethod(kernels.lato_pivot_kernel)
+    jac_kernel = staticmethod(kernels.lato_pivot_jac_kernel)
+    accel_kernel = staticmethod(kernels.pivot_pendulum_accel)
+    kernel_params = ('g', 'L', 'A', 'omega_p')
+
+    def positions(self, t, y):
+        t = np.atleast_1d(t)
+        theta = np.stack([y[0], y[2]], axis=-1)
+        pivot_y = self.A * np.cos(self.omega_p * t)
+        anchors = np.zeros(theta.shape + (2,))
+        anchors[..., 1] = pivot_y[:, None]
+        balls = np.empty_like(anchors)
+        balls[..., 0] = self.L * np.sin(theta)
+        balls[..., 1] = -self.L * np.cos(theta) + pivot_y[:, None]
+        return anchors, balls
+
+    def extent(self):
+        return (-2 * self.L, 2 * self.L, -2 * self.L, 2 * self.L)
+
+
+class LatoRigidModel(Model):
+    """
+    Two balls on rigid ropes with a sinusoidal driving angle (Lato/sim_rev_re_r.py).
+    """
+    name = "lato_rigid"
+    defaults = {
+        'm': 1.0,            # mass of each ball (kg)
+        'L': 1.0,            # length of the rigid rope (m)
+        'g': 9.81,           # gravitational acceleration (m/s^2)
+        'A_drive': 0.1,      # driving amplitude (rad)
+        'omega_drive': 2.0,  # driving angular frequency (rad/s)
+    }
+    initial_state = (0.1, 0.0, -0.1, 0.0)
+    state_names = ('phi1', 'dphi1', 'phi2', 'dphi2')
+    kernel = staticmethod(kernels.lato_rigid_kernel)
+    jac_kernel = staticmethod(kernels.lato_rigid_jac_kernel)
+    kernel_params = ('g', 'L', 'A_drive', 'omega_drive')
+
+    def batch_rhs(self, dtype=np.float64, **sweep):
+        """
+        Vectorized right-hand side f(t, Y, out) for a (4, N) stack of states.
+        `sweep` may hold (N,) arrays for A_drive and omega_drive, the rest comes from params.
+        """
+        unknown = set(sweep) - {'A_drive', 'omega_drive'}
+        if unknown:
+            raise TypeError(f"cannot sweep over {', '.join(sorted(unknown))}")
+        g, L = self.g, self.L
+        A_drive = np.asarray(sweep.get('A_drive', self.A_drive), dtype=dtype)
+        omega_drive = np.asarray(sweep.get('omega_drive', self.omega_drive), dtype=dtype)
+
+        def rhs(t, Y, out):
+            phi1, dphi1, phi2, dphi2 = Y
+            # Driving angle (sinusoidal hand motion)
+            drive_phi = A_drive * np.sin(omega_drive * t)
+            coupling = (dphi2 - dphi1) / L
+            out[0] = dphi1
+            out[1] = -(g / L) * np.sin(phi1 + drive_phi) + coupling * dphi2
+            out[2] = dphi2
+            out[3] = -(g / L) * np.sin(phi2 + drive_phi) - coupling * dphi1
+            return out
+        return rhs
+
+    def positions(self, t, y):
+        theta = np.stack([y[0], y[2]], axis=-1)
+        anchors = np.zeros(theta.shape + (2,))
+        balls = np.empty_like(anchors)
+        # Ball 2 is mirrored, as in sim_rev_re_r.py
+        balls[..., 0, 0] = self.L * np.sin(theta[..., 0])
+        balls[..., 1, 0] = -self.L * np.sin(theta[..., 1])
+        balls[..., 1] = -self.L * np.cos(theta)
+        return anchors, balls
+
+    def extent(self):
+        return (-1.5 * self.L, 1.5 * self.L, -1.5 * self.L, 1.5 * self.L)
+
+
+class LatoPolarModel(Model):
+    """
+    Ball on a rotating string in polar coordinates (Lato/sim.py).
+    """
+    name = "lato_polar"
+    defaults = {
+        'm': 1.0,      # mass of the ball (kg)
+        'g': 9.81,     # gravitational acceleration (m/s^2)
+        'omega': 2.0,  # angular velocity (rad/s)
+    }
+    initial_state = (1.0, 0.0, 0.1, 0.0)
+    state_names = ('r', 'dr', 'phi', 'dphi')
+    kernel = staticmethod(kernels.lato_polar_kernel)
+    kernel_params = ('m', 'g', 'omega')
+
+    def positions(self, t, y):
+        r, phi = np.asarray(y[0]), np.asarray(y[2])
+        anchors = np.zeros(r.shape + (1, 2))
+        balls = np.empty_like(anchors)
+        balls[..., 0, 0] = r * np.cos(phi)
+        balls[..., 0, 1] = r * np.sin(phi)
+        return anchors, balls
+
+    def extent(self):
+        return (-3.0, 3.0, -3.0, 3.0)
+
+
+class VSpringModel(Model):
+    """
+    Mass hanging between two springs anchored at (-1, 0) and (1, 0) (V_Spring/simul.py).
+    """
+    name = "v_spring"
+    defaults = {
+        'm': 1.0,      # mass (kg)
+        'k': 10.0,     # spring constant (N/m)
+        'L0': 1.0,     # natural length of springs (m)
+        'g': 9.8,      # gravity (m/s^2)
+        'F0': 100.0,   # external force amplitude (N)
+        'omega': 1.0,  # frequency of external force (rad/s)
+        'c': 0.0,      # viscous damping (N s/m), none in the original scripts
+    }
+    initial_state = (0.0, -1.0, 0.0, 0.0)
+    state_names = ('x', 'y', 'vx', 'vy')
+    kernel = staticmethod(kernels.v_spring_kernel)
+    jac_kernel = staticmethod(kernels.v_spring_jac_kernel)
+    kernel_params = ('m', 'k', 'L0', 'g', 'F0', 'omega', 'c')
+
+    def positions(self, t, y):
+        x, yy = np.asarray(y[0]), np.asarray(y[1])
+        anchors = np.zeros(x.shape + (2, 2))
+        anchors[..., 0, 0] = -1.0
+        anchors[..., 1, 0] = 1.0
+        balls = np.empty_like(anchors)
+        balls[..., 0] = x[..., None]
+        balls[..., 1] = yy[..., None]
+        return anchors, balls
+
+    def extent(self):
+        return (-2.0, 2.0, -2.0, 2.0)
+
+
+MODELS = {cls.name: cls for cls in (LatoPivotModel, LatoRigidModel, LatoPolarModel, VSpringModel)}
+
+
+def get_model(name, **params):
+    """
+    Builds a model by name, e.g. get_model('v_spring', F0=10.0).
+    """
+    try:
+        cls = MODELS[name]
+    except KeyError:
+        raise ValueError(f"unknown model {name!r}, choose from {', '.join(MODELS)}") from None
+    return cls(**params)
@@ -0,0 +1,228 @@
+"""
+不经过 matplotlib 的快速出图: 直接把支点, 绳子和小球画进 uint8 调色板帧, 再交给 Pillow (GIF) 或 ffmpeg (MP4)
+帧的绘制可以分给多个进程
+"""
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Palette indices of the scene colors
+BACKGROUND, ANCHOR, STRING = 0, 1, 2
+BALL_COLORS = ((220, 40, 40), (40, 70, 220), (30, 160, 60), (200, 60, 200), (0, 170, 190), (230, 170, 0))
+
+SCENE_PALETTE = np.zeros((256, 3), dtype=np.uint8)
+SCENE_PALETTE[BACKGROUND] = (255, 255, 255)
+SCENE_PALETTE[ANCHOR] = (0, 0, 0)
+SCENE_PALETTE[STRING] = (90, 90, 90)
+SCENE_PALETTE[3:3 + len(BALL_COLORS)] = BALL_COLORS
+
+
+def _disk_offsets(radius):
+    # Pixel offsets of a filled disk
+    r = int(np.ceil(radius))
+    dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+    inside = dx**2 + dy**2 <= radius**2
+    return dy[inside], dx[inside]
+
+
+class FrameRasterizer:
+    """
+    Draws anchors, strings and balls of one frame into a (size, size) uint8 palette buffer.
+    """
+
+    def __init__(self, extent, size=400, ball_radius=0.05, line_width=2):
+        self.extent = extent
+        self.size = size
+        xmin, xmax, ymin, ymax = extent
+        self.scale = (size - 1) / max(xmax - xmin, ymax - ymin)
+        self.line_width = line_width
+        self._ball = _disk_offsets(max(ball_radius * self.scale, 2.0))
+        self._anchor = _disk_offsets(2.0)
+
+    def to_pixel(self, xy):
+        """
+        World coordinates (..., 2) to integer (row, col) pixel indices.
+        """
+        xmin, _, _, ymax = self.extent
+        col = np.rint((xy[..., 0] - xmin) * self.scale).astype(np.intp)
+        row = np.rint((ymax - xy[..., 1]) * self.scale).astype(np.intp)
+        return row, col
+
+    def _plot(self, buf, rows, cols, color):
+        keep = (rows >= 0) & (rows < self.size) & (cols >= 0) & (cols < self.size)
+        buf[rows[keep], cols[keep]] = color
+
+    def _line(self, buf, r0, c0, r1, c1, color):
+        n = int(max(abs(r1 - r0), abs(c1 - c0))) + 1
+        s = np.linspace(0.0, 1.0, n)
+        rows = np.rint(r0 + (r1 - r0) * s).astype(np.intp)
+        cols = np.rint(c0 + (c1 - c0) * s).astype(np.intp)
+        for w in range(self.line_width):
+            # Thicken across the dominant direction
+            if abs(c1 - c0) >= abs(r1 - r0):
+                self._plot(buf, rows + w, cols, color)
+            else:
+                self._plot(buf, rows, cols + w, color)
+
+    def _disk(self, buf, r, c, offsets, color):
+        dy, dx = offsets
+        self._plot(buf, r + dy, c + dx, color)
+
+    def draw(self, anchors, balls, out=None):
+        """
+        One frame; anchors and balls are (n_bodies, 2) world positions.
+        """
+        if out is None:
+            out = np.empty((self.size, self.size), dtype=np.uint8)
+        out.fill(BACKGROUND)
+        ar, ac = self.to_pixel(anchors)
+        br, bc = self.to_pixel(balls)
+        for i in range(len(balls)):
+            self._line(out, ar[i], ac[i], br[i], bc[i], STRING)
+        for i in range(len(balls)):
+            self._disk(out, ar[i], ac[i], self._anchor, ANCHOR)
+            self._disk(out, br[i], bc[i], self._ball, 3 + i % len(BALL_COLORS))
+        return out
+
+    def render(self, anchors, balls):
+        """
+        All frames of (T, n_bodies, 2) anchor/ball arrays, returns (T, size, size) uint8.
+        """
+        frames = np.empty((len(balls), self.size, self.size), dtype=np.uint8)
+        for i in range(len(balls)):
+            self.draw(anchors[i], balls[i], out=frames[i])
+        return frames
+
+
+def _render_chunk(args):
+    rasterizer, anchors, balls = args
+    return rasterizer.render(anchors, balls)
+
+
+def render_frames(rasterizer, anchors, balls, workers=None, chunk_size=64):
+    """
+    Renders all frames, spreading chunks of frames over a process pool.
+    workers=1 renders in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    n_frames = len(balls)
+    if workers <= 1 or n_frames <= chunk_size:
+        return rasterizer.render(anchors, balls)
+
+    chunks = [(rasterizer, anchors[i:i + chunk_size], balls[i:i + chunk_size])
+              for i in range(0, n_frames, chunk_size)]
+    frames = np.empty((n_frames, rasterizer.size, rasterizer.size), dtype=np.uint8)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for i, chunk in zip(range(0, n_frames, chunk_size), pool.map(_render_chunk, chunks)):
+            frames[i:i + len(chunk)] = chunk
+    return frames
+
+
+def field_to_indices(field, vmin=-1.0, vmax=1.0, out=None):
+    """
+    Maps a 2D scalar field to palette indices 0..255 (for field_palette).
+    """
+    if out is None:
+        out = np.empty(field.shape, dtype=np.uint8)
+    scaled = (field - vmin) * (255.0 / (vmax - vmin))
+    np.clip(scaled, 0, 255, out=scaled)
+    out[...] = scaled
+    return out
+
+
+def field_frames(fields, size=400, vmin=-1.0, vmax=1.0):
+    """
+    Turns an iterable of 2D fields into (size, size) palette-index frames, one at a time.
+    Fields are subsampled (nearest neighbour) before the color mapping, so a 1000x1000
+    float field never gets copied at full resolution.
+    """
+    rows = cols = None
+    for field in fields:
+        if rows is None:
+            rows = np.linspace(0, field.shape[0] - 1, size).round().astype(np.intp)
+            cols = np.linspace(0, field.shape[1] - 1, size).round().astype(np.intp)
+        # Row 0 of the field is y = -bowl_radius, images start at the top
+        yield field_to_indices(field[rows[::-1, None], cols], vmin, vmax)
+
+
+def field_palette(cmap='viridis'):
+    """
+    (256, 3) uint8 palette of a matplotlib colormap (grayscale when matplotlib is missing).
+    """
+    try:
+        from matplotlib import colormaps
+    except ImportError:
+        return np.repeat(np.arange(256, dtype=np.uint8)[:, None], 3, axis=1)
+    rgba = colormaps[cmap](np.linspace(0.0, 1.0, 256))
+    return (rgba[:, :3] * 255).round().astype(np.uint8)
+
+
+def save_gif(frames, filename, palette=SCENE_PALETTE, fps=30):
+    """
+    Writes palette-index frames (a (T, H, W) array or any iterable of (H, W) arrays,
+    e.g. a generator) as a looping GIF with Pillow.
+    Pillow keeps the 8-bit frames until the file is written; use MP4 for strictly
+    constant memory.
+    """
+    from PIL import Image
+
+    flat_palette = np.asarray(palette, dtype=np.uint8).ravel().tolist()
+
+    def images():
+        for frame in frames:
+            image = Image.fromarray(np.ascontiguousarray(frame), mode='P')
+            image.putpalette(flat_palette)
+            yield image
+
+    images = images()
+    first = next(images)
+    first.save(filename, save_all=True, append_images=images,
+               duration=int(round(1000 / fps)), loop=0, optimize=False)
+
+
+def save_mp4(frames, filename, palette=SCENE_PALETTE, fps=30):
+    """
+    Streams palette-index frames (array or iterable) to an ffmpeg pipe as rgb24 video.
+    palette=None takes (H, W, 3) RGB frames as they are.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg not found on PATH, cannot write MP4")
+    if palette is None:
+        def to_rgb(frame):
+            return np.ascontiguousarray(frame, dtype=np.uint8)
+    else:
+        palette = np.asarray(palette, dtype=np.uint8)
+
+        def to_rgb(frame):
+            return palette[frame]
+    frames = iter(frames)
+    first = next(frames)
+    height, width = first.shape[:2]
+    cmd = [ffmpeg, "-y", "-loglevel", "error",
+           "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+           "-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", filename]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    try:
+        proc.stdin.write(to_rgb(first).tobytes())
+        for frame in frames:
+            proc.stdin.write(to_rgb(frame).tobytes())
+    finally:
+        proc.stdin.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {proc.returncode}")
+
+
+def save_frames(frames, filename, palette=SCENE_PALETTE, fps=30):
+    """
+    GIF or MP4, chosen by the file extension.
+    """
+    if filename.lower().endswith(".mp4"):
+        save_mp4(frames, filename, palette, fps)
+    else:
+        save_gif(frames, filename, palette, fps)
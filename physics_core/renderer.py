@@ -0,0 +1,107 @@
+"""
+绘图和动画, matplotlib 只在真正需要画图的时候才导入
+"""
+
+import numpy as np
+
+
+class Renderer:
+    """
+    Draws a model's trajectory: every body is a line from its anchor to the ball.
+    """
+    colors = ('r', 'b', 'g', 'm', 'c', 'y')
+
+    def __init__(self, model, figsize=(6, 6)):
+        self.model = model
+        self.figsize = figsize
+
+    def animate(self, t, y, filename=None, interval=20, fps=None):
+        """
+        FuncAnimation of the trajectory (t, y as in solve_ivp's sol.t, sol.y).
+        Saves a GIF with Pillow when filename is given and returns the animation.
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+
+        anchors, balls = self.model.positions(t, y)
+        n_bodies = balls.shape[1]
+
+        fig, ax = plt.subplots(figsize=self.figsize)
+        xmin, xmax, ymin, ymax = self.model.extent()
+        ax.set_xlim(xmin, xmax)
+        ax.set_ylim(ymin, ymax)
+        ax.set_aspect('equal')
+        lines = []
+        for i in range(n_bodies):
+            line, = ax.plot([], [], 'o-', color=self.colors[i % len(self.colors)], lw=2, label=f"Ball {i + 1}")
+            lines.append(line)
+        ax.legend()
+
+        def init():
+            for line in lines:
+                line.set_data([], [])
+            return lines
+
+        def update(frame):
+            for i, line in enumerate(lines):
+                line.set_data([anchors[frame, i, 0], balls[frame, i, 0]],
+                              [anchors[frame, i, 1], balls[frame, i, 1]])
+            return lines
+
+        ani = FuncAnimation(fig, update, frames=len(t), init_func=init, blit=True, interval=interval)
+        if filename is not None:
+            if fps is None:
+                fps = 1000.0 / interval
+            ani.save(filename, writer="pillow", fps=fps)
+        return ani
+
+    def export(self, t, y, filename, size=400, fps=30, workers=None):
+        """
+        Headless GIF/MP4 export through the direct rasterizer (no matplotlib involved).
+        Frames are drawn in a process pool, workers=1 keeps everything in this process.
+        """
+        from .raster import FrameRasterizer, render_frames, save_frames
+
+        anchors, balls = self.model.positions(t, y)
+        rasterizer = FrameRasterizer(self.model.extent(), size=size,
+                                     ball_radius=self.model.params.get('r_ball', 0.05))
+        frames = render_frames(rasterizer, anchors, balls, workers=workers)
+        save_frames(frames, filename, fps=fps)
+
+    def export_agg(self, t, y, filename, fps=30, dpi=100, workers=None, chunk_size=16):
+        """
+        GIF/MP4 with the look of animate(), drawn by matplotlib Agg canvases in a process pool
+        that reads the positions from shared memory (see physics_core.agg).
+        workers=1 keeps everything in this process.
+        """
+        from .agg import render_agg, save_agg
+
+        anchors, balls = self.model.positions(t, y)
+        frames = render_agg(anchors, balls, self.model.extent(), workers=workers, chunk_size=chunk_size,
+                            quantize=not filename.lower().endswith(".mp4"),
+                            figsize=self.figsize, dpi=dpi, colors=self.colors)
+        save_agg(frames, filename, fps=fps)
+
+    def plot_states(self, t, y, labels=None, title=None):
+        """
+        Every state component against time, returns the figure.
+        """
+        import matplotlib.pyplot as plt
+
+        y = np.atleast_2d(y)
+        if labels is None:
+            labels = [f"y[{i}]" for i in range(len(y))]
+        fig, ax = plt.subplots(figsize=(10, 5))
+        for component, label in zip(y, labels):
+            ax.plot(t, component, label=label)
+        ax.set_xlabel("Time (s)")
+        ax.legend()
+        ax.grid(True)
+        if title is not None:
+            ax.set_title(title)
+        return fig
+
+    @staticmethod
+    def show():
+        import matplotlib.pyplot as plt
+        plt.show()
@@ -0,0 +1,206 @@
+"""
+流式频谱分析: 积分器一块一块地输出, 分析器一块一块地吃进去, 逐段给出 STFT 谱图, 同时累加 Welch 平均功率谱
+内存只和段长有关, 几个小时的模拟也不用先把整条 theta_list 存下来
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+def _window(name, n):
+    if name in ('hann', 'hanning'):
+        # Periodic Hann, as used for spectral analysis (scipy.signal.get_window default)
+        return 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n) / n)
+    if name in ('boxcar', 'rect', None):
+        return np.ones(n)
+    raise ValueError(f"unknown window {name!r}")
+
+
+class StreamingSpectrum:
+    """
+    STFT / Welch analysis of a real signal that arrives in blocks.
+
+        analyzer = StreamingSpectrum(fs=1000, nperseg=4096)
+        for block in blocks:
+            rows = analyzer.feed(block)   # (k, n_freqs) new spectrogram rows, k may be 0
+        freqs, psd = analyzer.welch()
+
+    Segments of `nperseg` samples overlap by `overlap` (a fraction), get the mean removed,
+    the window applied and go through rfft; only a leftover shorter than one segment is kept
+    between blocks. Rows are one-sided power spectral densities like scipy.signal.welch.
+    """
+
+    def __init__(self, fs, nperseg=1024, overlap=0.5, window='hann'):
+        if not 0 <= overlap < 1:
+            raise ValueError("overlap must be in [0, 1)")
+        self.fs = fs
+        self.nperseg = nperseg
+        self.hop = max(1, int(round(nperseg * (1 - overlap))))
+        # Window, frequency axis and PSD scaling are computed once and reused for every segment
+        self.window = _window(window, nperseg)
+        self.freqs = np.fft.rfftfreq(nperseg, 1.0 / fs)
+        self._scale = np.full(len(self.freqs), 2.0 / (fs * np.sum(self.window**2)))
+        self._scale[0] /= 2
+        if nperseg % 2 == 0:
+            self._scale[-1] /= 2
+
+        self._leftover = np.empty(0)
+        self._psd_sum = np.zeros(len(self.freqs))
+        self.n_segments = 0
+        self.n_samples = 0
+
+    @property
+    def times(self):
+        """
+        Centre time of every segment produced so far.
+        """
+        return (np.arange(self.n_segments) * self.hop + self.nperseg / 2) / self.fs
+
+    def feed(self, block):
+        """
+        Consumes the next block of samples, returns the new spectrogram rows (k, n_freqs).
+        """
+        block = np.asarray(block, dtype=float).ravel()
+        self.n_samples += len(block)
+        data = np.concatenate([self._leftover, block]) if len(self._leftover) else block
+        n_new = 0 if len(data) < self.nperseg else (len(data) - self.nperseg) // self.hop + 1
+        if n_new == 0:
+            self._leftover = data.copy()
+            return np.empty((0, len(self.freqs)))
+
+        segments = np.lib.stride_tricks.sliding_window_view(data, self.nperseg)[::self.hop][:n_new]
+        segments = segments - segments.mean(axis=1, keepdims=True)
+        segments *= self.window
+        spectrum = np.fft.rfft(segments, axis=1)
+        rows = (spectrum.real**2 + spectrum.imag**2) * self._scale
+
+        self._psd_sum += rows.sum(axis=0)
+        self.n_segments += n_new
+        self._leftover = data[n_new * self.hop:].copy()
+        return rows
+
+    def welch(self):
+        """
+        Average of all segments so far: (freqs, psd).
+        """
+        if self.n_segments == 0:
+            raise ValueError("not enough samples for a single segment yet")
+        return self.freqs, self._psd_sum / self.n_segments
+
+
+@lru_cache(maxsize=32)
+def _plan(n, window):
+    # Window, amplitude gain and frequency bins (per unit sample rate) for one signal length;
+    # sweeps analyse many runs of the same length, so this is built once per length
+    w = _window(window, n)
+    w.flags.writeable = False
+    freqs = np.fft.rfftfreq(n)
+    freqs.flags.writeable = False
+    return w, 2.0 / w.sum(), freqs
+
+
+def _parabolic(magnitude, k):
+    # Quadratic fit through log |X| at bins k-1, k, k+1: (bin offset in [-0.5, 0.5], peak magnitude)
+    rows = np.arange(magnitude.shape[0])[:, None]
+    log = np.log(np.maximum(magnitude, 1e-300))
+    a, b, c = log[rows, k - 1], log[rows, k], log[rows, k + 1]
+    denom = a - 2 * b + c
+    offset = np.where(denom < 0, 0.5 * (a - c) / np.where(denom < 0, denom, 1.0), 0.0)
+    return offset, np.exp(b - 0.25 * (a - c) * offset)
+
+
+def _half_power_width(magnitude, k, level):
+    # Width in bins where |X| stays above `level`, with linear interpolation at both crossings
+    n = len(magnitude)
+    lo = k
+    while lo > 0 and magnitude[lo] > level:
+        lo -= 1
+    hi = k
+    while hi < n - 1 and magnitude[hi] > level:
+        hi += 1
+    if magnitude[lo] > level or magnitude[hi] > level:
+        return np.nan
+    left = lo + (level - magnitude[lo]) / (magnitude[lo + 1] - magnitude[lo])
+    right = hi - (level - magnitude[hi]) / (magnitude[hi - 1] - magnitude[hi])
+    return right - left
+
+
+def peak_table(signals, fs, n_peaks=3, n_harmonics=4, window='hann', params=None, fmin=0.0):
+    """
+    Resonance peaks of many equally long runs, e.g. the rows of an omega_drive sweep.
+
+    signals is (N, T) (or one (T,) signal), fs the sample rate in Hz. All rows go through one
+    rfft; the window is cached per length. Returns a structured array with one record per run:
+
+        param      the sweep value of that run (when `params` is given)
+        freq       (n_peaks,) strongest peak frequencies in Hz, strongest first
+        amplitude  (n_peaks,) their sine amplitudes, in the units of the signal
+        q          (n_peaks,) quality factor f / half-power bandwidth; nan when the peak is
+                   not resolved (narrower than two bins, i.e. about the window's main lobe)
+        harmonics  (n_harmonics,) amplitudes at 1, 2, ... times the strongest peak
+
+    Peak frequency and amplitude come from a parabolic fit of log |X| around the maximum bin.
+    Q of a free decay (ring-down) needs window='boxcar', the Hann taper narrows the peak.
+    """
+    signals = np.atleast_2d(np.asarray(signals, dtype=float))
+    n_runs, n = signals.shape
+    w, gain, unit_freqs = _plan(n, window)
+    df = fs / n
+    magnitude = np.abs(np.fft.rfft((signals - signals.mean(axis=1, keepdims=True)) * w, axis=1)) * gain
+    n_bins = magnitude.shape[1]
+
+    # Local maxima away from the edges, above fmin
+    inner = magnitude[:, 1:-1]
+    is_peak = (inner > magnitude[:, :-2]) & (inner >= magnitude[:, 2:])
+    is_peak &= unit_freqs[1:-1] * fs >= fmin
+    score = np.where(is_peak, inner, -1.0)
+    k = np.argsort(-score, axis=1)[:, :n_peaks] + 1
+    found = np.take_along_axis(score, k - 1, axis=1) >= 0
+
+    offset, amplitude = _parabolic(magnitude, k)
+    freq = (k + offset) * df
+    q = np.full(k.shape, np.nan)
+    for i, j in zip(*np.nonzero(found)):
+        width = _half_power_width(magnitude[i], k[i, j], magnitude[i, k[i, j]] / np.sqrt(2))
+        if width > 2.0:
+            q[i, j] = freq[i, j] / (width * df)
+    freq[~found] = np.nan
+    amplitude[~found] = np.nan
+
+    # Harmonics of the strongest peak: largest bin next to h * f0, refined the same way
+    h = np.arange(1, n_harmonics + 1)
+    target = np.rint(freq[:, :1] / df * h)
+    valid = np.isfinite(target) & (target >= 1) & (target <= n_bins - 2)
+    target = np.where(valid, target, 1).astype(int)
+    near = np.stack([target - 1, target, target + 1], axis=-1).clip(1, n_bins - 2)
+    rows = np.arange(n_runs)[:, None, None]
+    best = np.take_along_axis(near, magnitude[rows, near].argmax(axis=-1)[..., None], axis=-1)[..., 0]
+    harmonics = np.where(valid, _parabolic(magnitude, best)[1], np.nan)
+
+    fields = [('freq', float, (n_peaks,)), ('amplitude', float, (n_peaks,)), ('q', float, (n_peaks,)),
+              ('harmonics', float, (n_harmonics,))]
+    if params is not None:
+        fields.insert(0, ('param', float))
+    table = np.empty(n_runs, dtype=fields)
+    if params is not None:
+        table['param'] = params
+    table['freq'], table['amplitude'], table['q'], table['harmonics'] = freq, amplitude, q, harmonics
+    return table
+
+
+def format_peak_table(table, param_name='param'):
+    """
+    One line per run: sweep value, strongest peak (f, amplitude, Q) and harmonic amplitudes.
+    """
+    n_harmonics = table['harmonics'].shape[1]
+    header = ([f"{param_name:>10s}"] if 'param' in table.dtype.names else []) + \
+             [f"{'f (Hz)':>10s}", f"{'amplitude':>10s}", f"{'Q':>8s}"] + \
+             [f"{'H' + str(h):>10s}" for h in range(1, n_harmonics + 1)]
+    lines = [" ".join(header)]
+    for row in table:
+        cells = ([f"{row['param']:10.4g}"] if 'param' in table.dtype.names else []) + \
+                [f"{row['freq'][0]:10.4f}", f"{row['amplitude'][0]:10.4g}", f"{row['q'][0]:8.3g}"] + \
+                [f"{a:10.3g}" for a in row['harmonics']]
+        lines.append(" ".join(cells))
+    return "\n".join(lines)
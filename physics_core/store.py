@@ -0,0 +1,265 @@
+"""
+轨迹存储: 一个目录, 每个变量 (t, theta1, ..., 碗的水面 u) 按时间切成块, 每块一个文件, 可以压缩
+积分器边算边写, 之后只读需要的时间窗口, 重新画图 / 做频谱不用重新模拟
+
+    run.traj/
+        meta.json          变量的形状, dtype, 块长, 每块的起止时间, 模型参数
+        t/0.npy, t/1.npy   (compression=None, 读的时候 memory-map)
+        u/0.zlib, ...      (compression='zlib', 只解压用到的块)
+"""
+
+import json
+import os
+import shutil
+import zlib
+
+import numpy as np
+
+CODECS = (None, 'zlib')
+_META = 'meta.json'
+
+
+def _jsonable(value):
+    # numpy scalars / arrays in attrs (e.g. model parameters)
+    return value.tolist() if hasattr(value, 'tolist') else str(value)
+
+
+def _encode(chunk, level, shuffle):
+    data = np.ascontiguousarray(chunk)
+    if shuffle and data.dtype.itemsize > 1:
+        # Byte shuffle: the exponent bytes of neighbouring floats end up next to each other
+        data = data.view(np.uint8).reshape(-1, data.dtype.itemsize).T
+    return zlib.compress(np.ascontiguousarray(data).tobytes(), level)
+
+
+def _decode(raw, dtype, shape, shuffle):
+    dtype = np.dtype(dtype)
+    data = np.frombuffer(zlib.decompress(raw), dtype=np.uint8)
+    if shuffle and dtype.itemsize > 1:
+        data = data.reshape(dtype.itemsize, -1).T.copy()
+    return data.view(dtype).reshape(shape)
+
+
+class TrajectoryStore:
+    """
+    Chunked store of time series that share one time axis.
+
+        with TrajectoryStore.create("run.traj", attrs={'model': 'lato_pivot'}) as store:
+            for t, q, p in integrate_blocks(...):
+                store.append(t=t, theta1=q[:, 0], theta2=q[:, 1])
+
+        store = TrajectoryStore("run.traj")
+        t, theta1 = store.window('theta1', 100.0, 160.0)   # only the chunks covering 100-160 s
+
+    Variables are (T, ...) arrays; their shapes and dtypes are fixed by the first append.
+    Every `chunk_len` rows become one file per variable. Uncompressed chunks are .npy files read
+    with np.load(mmap_mode='r'); zlib chunks (with byte shuffle) are decompressed one by one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._writable = False
+        with open(os.path.join(path, _META)) as f:
+            self._load_meta(json.load(f))
+
+    @classmethod
+    def create(cls, path, chunk_len=4096, compression='zlib', level=1, shuffle=True, time='t',
+               attrs=None, overwrite=False):
+        """
+        Starts a new store at `path` (a directory). `time` names the variable holding the time axis.
+        """
+        if compression not in CODECS:
+            raise ValueError(f"unknown compression {compression!r}, choose from {CODECS}")
+        if os.path.exists(path):
+            if not overwrite:
+                raise FileExistsError(path)
+            shutil.rmtree(path)
+        os.makedirs(path)
+        store = cls.__new__(cls)
+        store.path = path
+        store._writable = True
+        store._load_meta({
+            'chunk_len': int(chunk_len), 'compression': compression, 'level': int(level),
+            'shuffle': bool(shuffle), 'time': time, 'length': 0, 'variables': {},
+            'time_bounds': [], 'attrs': attrs or {},
+        })
+        store._buffers = None
+        store._filled = 0
+        return store
+
+    def _load_meta(self, meta):
+        self.meta = meta
+        self.chunk_len = meta['chunk_len']
+        self.compression = meta['compression']
+        self.attrs = meta['attrs']
+        self._chunk_cache = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.meta['length'] + (self._filled if self._writable else 0)
+
+    @property
+    def variables(self):
+        return list(self.meta['variables'])
+
+    def shape(self, name):
+        return (self.meta['length'],) + tuple(self.meta['variables'][name]['shape'])
+
+    # Writing
+
+    def append(self, **blocks):
+        """
+        Appends the same number of rows to every variable, e.g. append(t=t_block, y=y_block.T).
+        """
+        if not self._writable:
+            raise ValueError("store is open for reading")
+        blocks = {name: np.asarray(block) for name, block in blocks.items()}
+        if self._buffers is None:
+            self._start(blocks)
+        if set(blocks) != set(self._buffers):
+            raise ValueError(f"append needs exactly the variables {sorted(self._buffers)}")
+        n = {len(block) for block in blocks.values()}
+        if len(n) != 1:
+            raise ValueError("all variables need the same number of rows")
+        n = n.pop()
+
+        done = 0
+        while done < n:
+            take = min(n - done, self.chunk_len - self._filled)
+            for name, block in blocks.items():
+                self._buffers[name][self._filled:self._filled + take] = block[done:done + take]
+            self._filled += take
+            done += take
+            if self._filled == self.chunk_len:
+                self._flush_chunk()
+
+    def _start(self, blocks):
+        time = self.meta['time']
+        if time not in blocks:
+            raise ValueError(f"the first append must include the time variable {time!r}")
+        for name, block in blocks.items():
+            self.meta['variables'][name] = {'shape': list(block.shape[1:]), 'dtype': block.dtype.str}
+            os.makedirs(os.path.join(self.path, name), exist_ok=True)
+        self._buffers = {name: np.empty((self.chunk_len,) + block.shape[1:], dtype=block.dtype)
+                         for name, block in blocks.items()}
+
+    def _flush_chunk(self):
+        if self._filled == 0:
+            return
+        index = len(self.meta['time_bounds'])
+        for name, buffer in self._buffers.items():
+            chunk = buffer[:self._filled]
+            if self.compression is None:
+                np.save(os.path.join(self.path, name, f"{index}.npy"), chunk)
+            else:
+                raw = _encode(chunk, self.meta['level'], self.meta['shuffle'])
+                with open(os.path.join(self.path, name, f"{index}.zlib"), 'wb') as f:
+                    f.write(raw)
+        times = self._buffers[self.meta['time']]
+        self.meta['time_bounds'].append([float(times[0]), float(times[self._filled - 1])])
+        self.meta['length'] += self._filled
+        self._filled = 0
+        self._write_meta()
+
+    def _write_meta(self):
+        # Written after every chunk, so a store from an interrupted run can still be read
+        tmp = os.path.join(self.path, _META + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.meta, f, indent=1, default=_jsonable)
+        os.replace(tmp, os.path.join(self.path, _META))
+
+    def close(self):
+        """
+        Writes the last, partial chunk. Reading is possible afterwards.
+        """
+        if self._writable:
+            self._flush_chunk()
+            self._write_meta()
+            self._writable = False
+            self._buffers = None
+
+    # Reading
+
+    def _chunk(self, name, index):
+        if self.compression is None:
+            return np.load(os.path.join(self.path, name, f"{index}.npy"), mmap_mode='r')
+        key = (name, index)
+        if key not in self._chunk_cache:
+            info = self.meta['variables'][name]
+            rows = min(self.chunk_len, self.meta['length'] - index * self.chunk_len)
+            with open(os.path.join(self.path, name, f"{index}.zlib"), 'rb') as f:
+                raw = f.read()
+            # Only the last decoded chunk is kept, enough for consecutive windows
+            self._chunk_cache = {key: _decode(raw, info['dtype'], (rows,) + tuple(info['shape']),
+                                              self.meta['shuffle'])}
+        return self._chunk_cache[key]
+
+    def read(self, name, start=0, stop=None):
+        """
+        Rows [start, stop) of one variable; only the chunks overlapping them are touched.
+        A window inside a single uncompressed chunk is returned as a read-only memory map.
+        """
+        if self._writable:
+            raise ValueError("close() the store before reading")
+        if name not in self.meta['variables']:
+            raise KeyError(name)
+        start, stop, _ = slice(start, stop).indices(self.meta['length'])
+        stop = max(start, stop)
+        first, last = start // self.chunk_len, max(start, stop - 1) // self.chunk_len
+        parts = []
+        for index in range(first, last + 1):
+            offset = index * self.chunk_len
+            parts.append(self._chunk(name, index)[max(start - offset, 0):stop - offset])
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def iter_rows(self, name):
+        """
+        Rows of one variable, one chunk in memory at a time (e.g. to re-render a stored surface).
+        """
+        for start in range(0, self.meta['length'], self.chunk_len):
+            yield from self.read(name, start, start + self.chunk_len)
+
+    def __getitem__(self, name):
+        return self.read(name)
+
+    def index_range(self, t_start, t_end):
+        """
+        Row range [start, stop) with t_start <= t <= t_end, found from the per-chunk time bounds
+        and the time values of at most two chunks.
+        """
+        bounds = np.array(self.meta['time_bounds']).reshape(-1, 2)
+        time = self.meta['time']
+
+        def locate(value, side):
+            index = int(np.searchsorted(bounds[:, 1], value, side='left' if side == 'left' else 'right'))
+            if index >= len(bounds):
+                return self.meta['length']
+            times = self._chunk(time, index)
+            return index * self.chunk_len + int(np.searchsorted(times, value, side=side))
+
+        return locate(t_start, 'left'), locate(t_end, 'right')
+
+    def window(self, name, t_start, t_end):
+        """
+        (t, values) of one variable for t_start <= t <= t_end.
+        """
+        start, stop = self.index_range(t_start, t_end)
+        return self.read(self.meta['time'], start, stop), self.read(name, start, stop)
+
+
+def save_solution(path, model, t, y, **kwargs):
+    """
+    Stores a solve_ivp / CollisionHandler result (y is (n_state, T), like sol.y) with one
+    variable per state component, named after model.state_names, and the model parameters as attrs.
+    """
+    attrs = {'model': model.name, 'params': model.params, **kwargs.pop('attrs', {})}
+    with TrajectoryStore.create(path, attrs=attrs, **kwargs) as store:
+        store.append(t=np.asarray(t), **dict(zip(model.state_names, np.asarray(y))))
+    return TrajectoryStore(path)
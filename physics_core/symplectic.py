@@ -0,0 +1,140 @@
+"""
+定步长辛积分器 (velocity Verlet, 四阶 Yoshida), 用于长时间的单摆运行
+输出数组事先分配好, 每 decimate 步记录一次; 装了 numba 时整个循环是编译后的
+能量不会像 FFT_solid.py / prac_lato.py 里的显式欧拉那样漂移
+"""
+
+import numpy as np
+
+from .kernels import compiled, njit
+
+# Yoshida's 4th order composition of the leapfrog
+_CBRT2 = 2.0 ** (1.0 / 3.0)
+_W1 = 1.0 / (2.0 - _CBRT2)
+_W0 = -_CBRT2 * _W1
+YOSHIDA_C = np.array([_W1 / 2, (_W0 + _W1) / 2, (_W0 + _W1) / 2, _W1 / 2])  # drifts
+YOSHIDA_D = np.array([_W1, _W0, _W1])  # kicks
+
+
+@njit(cache=True)
+def _verlet_loop(accel, params, q, p, t0, dt, n_steps, decimate, t_out, q_out, p_out):
+    # Kick-drift-kick; the acceleration at the end of a step is reused at the start of the next
+    n = q.shape[0]
+    a = np.empty(n)
+    accel(t0, q, a, *params)
+    t_out[0] = t0
+    q_out[0] = q
+    p_out[0] = p
+    k = 0
+    for i in range(n_steps):
+        for j in range(n):
+            p[j] += 0.5 * dt * a[j]
+            q[j] += dt * p[j]
+        t = t0 + (i + 1) * dt
+        accel(t, q, a, *params)
+        for j in range(n):
+            p[j] += 0.5 * dt * a[j]
+        if (i + 1) % decimate == 0:
+            k += 1
+            t_out[k] = t
+            q_out[k] = q
+            p_out[k] = p
+
+
+@njit(cache=True)
+def _yoshida4_loop(accel, params, q, p, t0, dt, n_steps, decimate, t_out, q_out, p_out, c, d):
+    n = q.shape[0]
+    a = np.empty(n)
+    t_out[0] = t0
+    q_out[0] = q
+    p_out[0] = p
+    k = 0
+    for i in range(n_steps):
+        t = t0 + i * dt
+        for stage in range(4):
+            for j in range(n):
+                q[j] += c[stage] * dt * p[j]
+            t += c[stage] * dt
+            if stage < 3:
+                accel(t, q, a, *params)
+                for j in range(n):
+                    p[j] += d[stage] * dt * a[j]
+        if (i + 1) % decimate == 0:
+            k += 1
+            t_out[k] = t0 + (i + 1) * dt
+            q_out[k] = q
+            p_out[k] = p
+
+
+METHODS = ('verlet', 'yoshida4')
+
+
+def integrate(accel, params, q0, p0, dt, n_steps, method='verlet', decimate=1, t0=0.0):
+    """
+    Integrates q'' = accel(t, q) for a separable Hamiltonian H = p^2 / 2 + V(q, t).
+    accel(t, q, out, *params) is one of the acceleration kernels in kernels.py;
+    q0, p0 are angles and angular velocities (one entry per ball).
+    Every `decimate`-th step is stored: returns t (M,), q (M, n), p (M, n), M = n_steps // decimate + 1.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}, choose from {', '.join(METHODS)}")
+    q = np.array(np.atleast_1d(q0), dtype=np.float64)
+    p = np.array(np.atleast_1d(p0), dtype=np.float64)
+    params = tuple(float(x) for x in params)
+    accel = compiled(accel)
+    n_out = n_steps // decimate + 1
+    t_out = np.empty(n_out)
+    q_out = np.empty((n_out, len(q)))
+    p_out = np.empty((n_out, len(p)))
+    if method == 'verlet':
+        _verlet_loop(accel, params, q, p, float(t0), float(dt), int(n_steps), int(decimate), t_out, q_out, p_out)
+    else:
+        _yoshida4_loop(accel, params, q, p, float(t0), float(dt), int(n_steps), int(decimate), t_out, q_out, p_out,
+                       YOSHIDA_C, YOSHIDA_D)
+    return t_out, q_out, p_out
+
+
+def integrate_blocks(accel, params, q0, p0, dt, n_steps, block_steps, method='verlet', decimate=1, t0=0.0):
+    """
+    Same as integrate(), but yields (t, q, p) blocks of `block_steps` steps (a multiple of
+    decimate) so very long runs can be consumed piece by piece in constant memory.
+    Each block starts after the last stored sample of the previous one.
+    """
+    if block_steps % decimate:
+        raise ValueError("block_steps must be a multiple of decimate")
+    q, p, t = q0, p0, t0
+    done = 0
+    while done < n_steps:
+        steps = min(block_steps, n_steps - done)
+        t_block, q_block, p_block = integrate(accel, params, q, p, dt, steps, method=method,
+                                              decimate=decimate, t0=t)
+        # Row 0 repeats the previous block's last sample
+        yield t_block[1:], q_block[1:], p_block[1:]
+        q, p = q_block[-1], p_block[-1]
+        t = t0 + (done + steps) * dt
+        done += steps
+
+
+def integrate_model(model, dt, n_steps, y0=None, method='verlet', decimate=1, t0=0.0):
+    """
+    Symplectic run of a model with an accel_kernel (e.g. LatoPivotModel).
+    Returns (t, y) with y laid out like solve_ivp's sol.y: (theta1, z1, theta2, z2, ...) x M.
+    """
+    if model.accel_kernel is None:
+        raise NotImplementedError(f"{type(model).__name__} is not a separable pendulum Hamiltonian")
+    if y0 is None:
+        y0 = model.y0()
+    y0 = np.asarray(y0, dtype=float)
+    t, q, p = integrate(model.accel_kernel, model._args, y0[0::2], y0[1::2], dt, n_steps,
+                        method=method, decimate=decimate, t0=t0)
+    y = np.empty((len(y0), len(t)))
+    y[0::2] = q.T
+    y[1::2] = p.T
+    return t, y
+
+
+def pendulum_energy(q, p, g=9.81, L=1.0):
+    """
+    Energy per unit m L^2 of free pendulums: p^2 / 2 + (g / L) (1 - cos q).
+    """
+    return 0.5 * p**2 + (g / L) * (1.0 - np.cos(q))
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The repository is not installed as a package; make physics_core importable from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Nothing in the tests may open a window
+os.environ.setdefault('MPLBACKEND', 'Agg')
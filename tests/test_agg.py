@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from physics_core import Integrator, LatoPivotModel, Renderer, render_agg
+
+SCENE = dict(figsize=(2, 2), dpi=40)
+
+
+@pytest.fixture(scope='module')
+def scene():
+    model = LatoPivotModel()
+    t = np.linspace(0, 2, 30)
+    y = Integrator().solve(model, (0, 2), t_eval=t).y
+    anchors, balls = model.positions(t, y)
+    return model, t, y, anchors, balls
+
+
+def test_frames_are_rgb_in_order(scene):
+    model, _, _, anchors, balls = scene
+    frames = list(render_agg(anchors, balls, model.extent(), workers=1, **SCENE))
+    assert len(frames) == 30
+    assert frames[0].shape == (80, 80, 3) and frames[0].dtype == np.uint8
+    # The balls move, so consecutive frames differ
+    assert all(np.any(a != b) for a, b in zip(frames, frames[1:]))
+
+
+@pytest.mark.parametrize('quantize', [False, True])
+def test_process_pool_gives_the_same_frames(scene, quantize):
+    model, _, _, anchors, balls = scene
+    serial = list(render_agg(anchors, balls, model.extent(), workers=1, quantize=quantize, **SCENE))
+    pooled = list(render_agg(anchors, balls, model.extent(), workers=2, chunk_size=4, quantize=quantize, **SCENE))
+    assert len(serial) == len(pooled)
+    for a, b in zip(serial, pooled):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_quantized_frames_follow_the_palette(scene):
+    model, _, _, anchors, balls = scene
+    frames = render_agg(anchors, balls, model.extent(), workers=1, quantize=True, **SCENE)
+    palette = next(frames)
+    assert palette.shape == (256, 3) and palette.dtype == np.uint8
+    indexed = list(frames)
+    assert len(indexed) == 30 and indexed[0].shape == (80, 80)
+    rgb = list(render_agg(anchors, balls, model.extent(), workers=1, **SCENE))
+    # Nearest palette colours stay close to the true ones
+    error = np.abs(palette[indexed[10]].astype(int) - rgb[10]).mean()
+    assert error < 4
+
+
+def test_export_agg_writes_a_gif(scene, tmp_path):
+    from PIL import Image
+
+    model, t, y, _, _ = scene
+    filename = str(tmp_path / 'agg.gif')
+    Renderer(model, figsize=(2, 2)).export_agg(t, y, filename, dpi=40, workers=2, chunk_size=8)
+    with Image.open(filename) as image:
+        assert image.size == (80, 80)
+        assert image.n_frames == 30
@@ -0,0 +1,141 @@
+import io
+import json
+import types
+
+import pytest
+
+from benchmarks import run as bench
+
+
+def _module(**attributes):
+    module = types.ModuleType('benchmarks.bench_fake')
+    for name, value in attributes.items():
+        if isinstance(value, type):
+            value.__module__ = module.__name__
+        setattr(module, name, value)
+    return module
+
+
+def test_param_grid_expansion():
+    class Single:
+        params = ['a', 'b']
+        param_names = ['model']
+
+    class Product:
+        params = ([1, 2], ['x', 'y', 'z'])
+        param_names = ['n', 'kind']
+
+    class Unnamed:
+        params = ([1], [2, 3])
+
+    class Plain:
+        pass
+
+    assert bench._param_grid(Single) == (['model'], [('a',), ('b',)])
+    names, grid = bench._param_grid(Product)
+    assert names == ['n', 'kind'] and len(grid) == 6 and grid[1] == (1, 'y')
+    assert bench._param_grid(Unnamed) == (['param1', 'param2'], [(1, 2), (1, 3)])
+    assert bench._param_grid(Plain) == ([], [()])
+
+
+def test_discover_finds_every_case():
+    cases = bench.discover()
+    names = [case.name for case in cases]
+    assert len(names) == len(set(names))
+    assert 'bench_models.ModelRHS.time_rhs[lato_pivot]' in names
+    assert 'bench_models.BatchRHS.time_batch_rhs[lato_rigid-10000]' in names
+    assert 'bench_models.time_solve_batch_100_runs' in names
+    assert 'bench_models.VSpringOdeint.time_odeint' in names
+    assert all(case.name.startswith('bench_') for case in cases)
+    assert [case.name for case in bench.discover('BatchRHS')] == [name for name in names if 'BatchRHS' in name]
+
+
+def test_measure_groups_calls():
+    calls = []
+    timings, number = bench.measure(lambda: calls.append(None), 0.001, 3, 1.0)
+    assert len(timings) == 3 and number > 1
+    # Warm-up and the calibration rounds come on top of the timed calls
+    assert len(calls) > 3 * number
+    assert all(t >= 0 for t in timings)
+
+
+def test_run_records_results_errors_and_skips():
+    class Works:
+        params = [1, 2]
+        param_names = ['n']
+
+        def setup(self, n):
+            self.n = n
+            self.torn_down = False
+
+        def time_it(self, n):
+            sum(range(10 * n))
+
+    class Skipped:
+        def setup(self):
+            raise NotImplementedError
+
+        def time_never(self):
+            pass
+
+    class Broken:
+        def setup(self):
+            raise RuntimeError("no")
+
+        def time_broken(self):
+            pass
+
+    def time_fails():
+        raise ZeroDivisionError
+
+    module = _module(Works=Works, Skipped=Skipped, Broken=Broken, time_fails=time_fails)
+    cases = [bench.Case(module, Works, 'time_it', (n,), ['n']) for n in (1, 2)]
+    cases += [bench.Case(module, Skipped, 'time_never', (), []), bench.Case(module, Broken, 'time_broken', (), []),
+              bench.Case(module, None, 'time_fails', (), [])]
+    results = bench.run(cases, 'quick', stream=io.StringIO())
+    assert [record['name'] for record in results] == ['bench_fake.Works.time_it[1]', 'bench_fake.Works.time_it[2]',
+                                                      'bench_fake.Broken.time_broken', 'bench_fake.time_fails']
+    assert results[0]['params'] == {'n': 1}
+    assert results[0]['min'] <= results[0]['median'] and results[0]['repeat'] >= 2
+    assert 'RuntimeError' in results[2]['error'] and 'ZeroDivisionError' in results[3]['error']
+
+
+def _entry(commit, node, medians):
+    return {'commit': commit, 'dirty': False, 'date': '2026-01-01T00:00:00+00:00', 'machine': {'node': node},
+            'results': [{'name': name, 'median': median} for name, median in medians.items()]}
+
+
+def test_baseline_and_compare():
+    old = _entry('aaa111', 'box', {'a': 1.0, 'b': 1.0, 'c': 1.0})
+    other = _entry('bbb222', 'laptop', {'a': 1.0})
+    new = _entry('ccc333', 'box', {'a': 1.5, 'b': 0.5, 'c': 1.1, 'd': 1.0})
+    history = [old, other, new]
+    assert bench.find_baseline(history, new) is old
+    assert bench.find_baseline(history, new, 'bbb') is other
+    assert bench.find_baseline(history, new, 'fff') is None
+    out = io.StringIO()
+    assert bench.compare(old, new, threshold=1.2, stream=out) == ['a']
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith('baseline aaa111')
+    assert lines[1].endswith('slower') and lines[2].endswith('faster') and len(lines) == 4
+
+
+def test_main_compares_stored_runs(tmp_path):
+    history = tmp_path / 'history.jsonl'
+    with pytest.raises(SystemExit):
+        bench.main(['--no-run', '--compare', '--history', str(history)])
+    for entry in (_entry('aaa111', 'box', {'a': 1.0}), _entry('ccc333', 'box', {'a': 2.0})):
+        bench.append_history(entry, str(history))
+    assert [entry['commit'] for entry in bench.load_history(str(history))] == ['aaa111', 'ccc333']
+    assert bench.main(['--no-run', '--compare', '--history', str(history)]) == 0
+    assert bench.main(['--no-run', '--compare', '--strict', '--history', str(history)]) == 1
+
+
+def test_quick_run_appends_to_the_history(tmp_path):
+    history = tmp_path / 'history.jsonl'
+    assert bench.main(['-k', 'FullFFT.time_rfft[16384]', '--quick', '--history', str(history)]) == 0
+    entry, = bench.load_history(str(history))
+    assert entry['mode'] == 'quick' and 'machine' in entry and 'commit' in entry
+    record, = entry['results']
+    assert record['name'] == 'bench_spectrum.FullFFT.time_rfft[16384]' and record['median'] > 0
+    json.dumps(entry)
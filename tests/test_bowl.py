@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from physics_core import BowlGrid, WaveSolver
+
+
+@pytest.fixture(scope='module')
+def grid():
+    return BowlGrid(grid_points=81)
+
+
+def test_dt_above_the_cfl_limit_is_rejected(grid):
+    with pytest.raises(ValueError):
+        WaveSolver(grid, dt=1.0)
+
+
+def test_still_water_without_forcing_stays_still(grid):
+    solver = WaveSolver(grid, forcing_amplitude=0.0, dtype=np.float64)
+    solver.step(50)
+    assert not solver.u.any()
+
+
+def test_water_outside_the_bowl_stays_zero(grid):
+    solver = WaveSolver(grid, dtype=np.float64)
+    solver.step(200)
+    assert np.abs(solver.u).max() > 0
+    assert not solver.u[~grid.mask].any()
+
+
+def test_symmetric_forcing_gives_a_symmetric_surface(grid):
+    solver = WaveSolver(grid, dtype=np.float64)
+    solver.step(300)
+    np.testing.assert_allclose(solver.u, solver.u[:, ::-1], atol=1e-12)
+    np.testing.assert_allclose(solver.u, solver.u[::-1, :], atol=1e-12)
+
+
+def test_uniform_displacement_oscillates_at_omega0(grid):
+    # A flat surface is not bent, so it only feels the restoring term; the wall must not leak.
+    # Leapfrog oscillates at the discrete frequency cos(w dt) = 1 - (omega0 dt)^2 / 2
+    omega0 = 2 * np.pi
+    solver = WaveSolver(grid, damping=0.0, nonlinearity=0.0, forcing_amplitude=0.0, omega0=omega0,
+                        dtype=np.float64)
+    w = np.arccos(1 - (omega0 * solver.dt)**2 / 2) / solver.dt
+    assert w == pytest.approx(omega0, rel=1e-3)
+    solver.u[...] = grid.mask
+    solver.u_prev[...] = np.cos(w * solver.dt) * grid.mask
+    solver.advance_to(0.8)
+    np.testing.assert_allclose(solver.u[grid.mask], np.cos(w * solver.t), atol=1e-10)
+    assert not solver.u[~grid.mask].any()
+
+
+def test_damping_takes_energy_out(grid):
+    amplitudes = []
+    for damping in (0.0, 2.0):
+        solver = WaveSolver(grid, damping=damping, forcing_amplitude=0.0, dtype=np.float64)
+        solver.u[...] = solver.u_prev[...] = grid.mask
+        solver.advance_to(2.0)
+        amplitudes.append(np.abs(solver.u).max())
+    assert amplitudes[1] < 0.5 * amplitudes[0]
+
+
+def test_frames_are_spaced_by_frame_dt(grid):
+    solver = WaveSolver(grid, dtype=np.float64)
+    times = [t for t, _ in solver.frames(6, 0.01)]
+    np.testing.assert_allclose(times, 0.01 * np.arange(6))
+    assert abs(solver.t - 0.05) <= solver.dt / 2
+
+
+def test_surface_frames_stream_the_same_fields_as_stepping(grid):
+    from physics_core.bowl import bowl_vibration, surface_frames
+
+    streamed = WaveSolver(grid, dtype=np.float64)
+    stepped = WaveSolver(grid, dtype=np.float64)
+    buffers = set()
+    for k, surface in enumerate(surface_frames(streamed, 5, 0.02)):
+        buffers.add(id(surface))
+        displacement = stepped.advance_to(0.02 * k).copy()
+        np.testing.assert_allclose(surface, bowl_vibration(grid, 0.02 * k) + displacement, atol=1e-12)
+    assert len(buffers) == 1
+
+
+@pytest.mark.parametrize('t', [0.0, 0.013, 0.4])
+def test_bowl_vibration_matches_the_original_formula(grid, t):
+    from physics_core.bowl import bowl_vibration
+
+    X, Y = np.meshgrid(grid.x, grid.y)
+    expected = (np.sin(2 * np.pi * 3 * t) + 0.5 * np.sin(2 * np.pi * 5 * t)) * np.exp(-(X**2 + Y**2))
+    np.testing.assert_allclose(bowl_vibration(grid, t), expected, atol=1e-6)
+
+
+def test_envelopes_are_cached_per_grid(grid):
+    assert grid.envelope('gaussian', width=0.5) is grid.envelope('gaussian', width=0.5)
+    assert grid.envelope('gaussian', width=0.5) is not grid.envelope('gaussian', width=0.6)
+    with pytest.raises(ValueError):
+        grid.envelope('square')
+
+
+def test_sources_add_into_out_with_a_given_scratch(grid):
+    from physics_core import FieldSource, FieldSources
+
+    sources = FieldSources(grid, [FieldSource(2.0, 1.0), FieldSource(3.0, 0.5, envelope='radial', k=1),
+                                  FieldSource(4.0, 0.25, envelope='radial', k=1)], dtype=np.float64)
+    assert len(sources._groups) == 2  # the two radial sources share one envelope
+    t = 0.07
+    expected = sum(source.coefficient(t) * grid.envelope(source.envelope, dtype=np.float64,
+                                                         **source.envelope_params)
+                   for source in sources.sources)
+    out = np.ones(grid.shape)
+    scratch = np.empty(grid.shape)
+    sources.evaluate(t, out=out, scale=2.0, add=True, scratch=scratch)
+    np.testing.assert_allclose(out, 1.0 + 2.0 * expected, atol=1e-12)
+    assert sources._scratch is None
+    np.testing.assert_allclose(sources.evaluate(t), expected, atol=1e-12)
@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pytest
+
+from physics_core import CollisionHandler, Integrator, LatoPivotModel, ResultCache, VSpringModel
+
+
+def test_second_solve_is_a_hit(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    model = VSpringModel(F0=10.0)
+    t_eval = np.linspace(0, 2, 201)
+    t, y = cache.solve(Integrator(), model, (0, 2), t_eval=t_eval)
+    assert (cache.hits, cache.misses) == (0, 1)
+    t2, y2 = cache.solve(Integrator(), VSpringModel(F0=10.0), (0, 2), t_eval=t_eval)
+    assert (cache.hits, cache.misses) == (1, 1)
+    np.testing.assert_array_equal(t2, t)
+    np.testing.assert_array_equal(y2, y)
+    sol = Integrator().solve(model, (0, 2), t_eval=t_eval)
+    np.testing.assert_array_equal(y, sol.y)
+    assert len(cache.entries()) == 1
+
+
+@pytest.mark.parametrize('change', [
+    lambda args: args.update(model=VSpringModel(F0=11.0)),
+    lambda args: args.update(integrator=Integrator(rtol=1e-6)),
+    lambda args: args.update(t_span=(0, 2.5)),
+    lambda args: args.update(y0=[0.1, -1.0, 0.0, 0.0]),
+    lambda args: args.update(t_eval=np.linspace(0, 2, 202)),
+])
+def test_any_change_is_a_miss(tmp_path, change):
+    cache = ResultCache(str(tmp_path))
+    args = dict(integrator=Integrator(), model=VSpringModel(F0=10.0), t_span=(0, 2), y0=None,
+                t_eval=np.linspace(0, 2, 201))
+    cache.solve(**args)
+    change(args)
+    cache.solve(**args)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_callable_arguments_are_refused(tmp_path):
+    with pytest.raises(TypeError):
+        ResultCache(str(tmp_path)).solve(Integrator(), VSpringModel(), (0, 1), events=lambda t, y: y[0])
+
+
+def test_cached_collisions(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    handler = CollisionHandler(LatoPivotModel(e=0.9))
+    integrator = Integrator(rtol=1e-8, atol=1e-10)
+    t_eval = np.linspace(0, 3, 301)
+    t, y, hits = cache.simulate(handler, integrator, (0, 3), t_eval=t_eval)
+    t2, y2, hits2 = cache.simulate(handler, integrator, (0, 3), t_eval=t_eval)
+    assert cache.hits == 1
+    np.testing.assert_array_equal(y2, y)
+    np.testing.assert_array_equal(hits2, hits)
+    np.testing.assert_array_equal(hits, handler.simulate(integrator, (0, 3), t_eval=t_eval)[2])
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    t = np.arange(1000.0)
+    paths = []
+    for i in range(3):
+        key = cache.key('solve', VSpringModel(k=float(i + 1)), (0, 1), np.zeros(4), None, {})
+        paths.append(cache.put(key, t, np.zeros((4, 1000))).path)
+        os.utime(paths[-1], (i, i))
+    entry = cache.entries()[0][1]
+    # Using the oldest entry makes the second one the least recently used
+    assert cache.get(os.path.basename(paths[0])) is not None
+    cache.max_bytes = 2 * entry
+    cache.evict()
+    assert [os.path.exists(path) for path in paths] == [True, False, True]
+    cache.clear()
+    assert cache.entries() == [] and cache.size() == 0
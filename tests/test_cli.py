@@ -0,0 +1,126 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from physics_core import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _python(*args):
+    env = {**os.environ, 'PYTHONPATH': ROOT}
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, timeout=300)
+
+
+def test_import_loads_no_heavy_modules():
+    done = _python('-c', "import sys, physics_core; physics_core.__all__; "
+                         "print(' '.join(m for m in ('numpy', 'scipy', 'matplotlib', 'numba') if m in sys.modules))")
+    assert done.returncode == 0, done.stderr
+    assert done.stdout.strip() == ''
+
+
+def test_fixed_step_run_needs_neither_scipy_nor_matplotlib():
+    done = _python('-m', 'physics_core', 'lato_rigid', '--t-end', '1', '--no-jit')
+    assert done.returncode == 0, done.stderr
+    assert '101 samples' in done.stdout
+    assert 'loaded' not in done.stderr
+
+
+def test_streamed_bowl_run_matches_the_stored_one():
+    params = {'grid_points': 60}
+    stored = cli.simulate('bowl', params, t_end=0.05, keep_frames=True)
+    streamed = cli.simulate('bowl', params, t_end=0.05, keep_frames=False)
+    assert 'u' not in streamed and np.all(np.isnan(streamed['centre']))
+    # surface_frames reuses one buffer
+    frames = [frame.copy() for frame in streamed['frames']]
+    np.testing.assert_array_equal(np.array(frames), stored['u'])
+    np.testing.assert_array_equal(streamed['centre'], stored['centre'])
+    assert float(streamed['max_abs']) == float(stored['max_abs']) > 0
+    np.testing.assert_array_equal(np.array([frame.copy() for frame in streamed['replay']()]), stored['u'])
+
+
+def test_unconsumed_stream_is_finished_for_the_summary():
+    result = cli.simulate('bowl', {'grid_points': 60}, t_end=0.02, keep_frames=False)
+    cli._finish(result)
+    assert 'frames' not in result and np.all(np.isfinite(result['centre']))
+    assert 'max |u|' in cli.summary(result)
+
+
+def test_parse_params():
+    assert cli.parse_params(['k=10', 'F0 = 1.5', 'name=x']) == {'k': 10, 'F0': 1.5, 'name': 'x'}
+    with pytest.raises(ValueError):
+        cli.parse_params(['k'])
+
+
+def test_config_runs_merge_defaults(tmp_path):
+    config = tmp_path / 'batch.toml'
+    config.write_text('[defaults]\nmodel = "lato_rigid"\nt_end = 2\nparams = {A_drive = 0.1}\n'
+                      f'outputs = ["{tmp_path}/{{name}}.npz"]\n\n'
+                      '[[runs]]\nname = "slow"\nparams = {omega_drive = 2.0}\n\n'
+                      '[[runs]]\nname = "fast"\nparams = {omega_drive = 4.0}\noutputs = []\n')
+    runs = cli.load_config(str(config))
+    assert [run['params'] for run in runs] == [{'A_drive': 0.1, 'omega_drive': 2.0},
+                                               {'A_drive': 0.1, 'omega_drive': 4.0}]
+    assert runs[1]['outputs'] == []
+    assert cli.main(['--config', str(config), '--dt', '0.02']) == 0
+    with np.load(tmp_path / 'slow.npz') as data:
+        assert data['y'].shape == (4, 101)
+        direct = cli.simulate('lato_rigid', {'A_drive': 0.1, 'omega_drive': 2.0}, t_end=2, dt=0.02)
+        np.testing.assert_array_equal(data['y'], direct['y'])
+
+
+def test_peak_tables_as_text_and_csv(tmp_path):
+    import csv
+
+    out = str(tmp_path / 'peaks')
+    assert cli.main(['v_spring', '--t-end', '20', '-p', 'F0=1', '-o', out + '.csv', '-o', out + '.txt']) == 0
+    with open(out + '.csv', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:4] == ['component', 'freq1', 'freq2', 'freq3']
+    assert [row[0] for row in rows[1:]] == ['x', 'y', 'vx', 'vy']
+    assert all(len(row) == len(rows[0]) for row in rows)
+    float(rows[2][1])
+    with open(out + '.txt') as f:
+        text = f.read().splitlines()
+    assert text[0].startswith('# v_spring-0: v_spring') and len(text) == 3 + 4
+
+
+def test_failed_run_does_not_stop_the_batch(tmp_path, capsys):
+    blocker = tmp_path / 'not_a_directory'
+    blocker.write_text('')
+    config = tmp_path / 'batch.json'
+    config.write_text('{"defaults": {"model": "lato_pivot", "t_end": 0.5}, "runs": ['
+                      f'{{"name": "bad", "outputs": ["{blocker}/bad.npz"]}}, '
+                      f'{{"name": "good", "outputs": ["{tmp_path}/good.npz"]}}]}}')
+    assert cli.main(['--config', str(config)]) == 1
+    assert 'bad: error' in capsys.readouterr().err
+    assert (tmp_path / 'good.npz').exists()
+
+
+def test_bad_settings_exit_before_running(tmp_path, capsys):
+    assert cli.main(['lato_pivot', '-o', str(tmp_path / 'out.xyz')]) == 2
+    config = tmp_path / 'batch.json'
+    config.write_text('{"model": "lato_pivot", "colour": "red"}')
+    assert cli.main(['--config', str(config)]) == 2
+    assert cli.main(['--config', str(tmp_path / 'missing.json')]) == 2
+    assert 'startup' not in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['lato_rigid', '--collisions'], "collisions need the model lato_pivot"),
+    (['lato_pivot', '--dt', '0'], "dt must be positive"),
+    (['v_spring', '--t-end', '0.001', '-o', 'x.png'], "t_end must be at least"),
+    (['bowl', '--t-end', '0.005'], "t_end must be at least"),
+])
+def test_impossible_runs_are_rejected_up_front(argv, message, capsys):
+    assert cli.main(argv) == 2
+    assert message in capsys.readouterr().err
+
+
+def test_collisions_on_lato_pivot_and_through_the_alias(capsys):
+    assert cli.main(['lato_pivot', '--collisions', '--t-end', '1']) == 0
+    assert cli.main(['lato_collisions', '--t-end', '1']) == 0
+    assert capsys.readouterr().out.count('collisions') == 2
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from physics_core import CollisionHandler, Integrator, LatoPivotModel
+
+
+def _run(t_eval=None, **params):
+    handler = CollisionHandler(LatoPivotModel(**params))
+    return handler, handler.simulate(Integrator(rtol=1e-10, atol=1e-12), (0, 5), t_eval=t_eval)
+
+
+def test_gap_is_zero_at_every_contact():
+    handler, (_, _, t_collisions) = _run()
+    assert len(t_collisions) > 1
+    # Replay segment by segment: every segment must end on touching surfaces at the reported time
+    integrator = Integrator(rtol=1e-10, atol=1e-12)
+    state, t_start = handler.model.y0(), 0.0
+    for t_hit in t_collisions:
+        sol = integrator.solve(handler.model, (t_start, 5), state, events=handler.event)
+        assert sol.t_events[0][0] == pytest.approx(t_hit, abs=1e-9)
+        assert abs(handler.gap(t_hit, sol.y_events[0][0])) < 1e-9
+        state, t_start = handler.apply_impulse(sol.y_events[0][0]), t_hit
+
+
+def test_balls_never_overlap():
+    handler, (t, y, _) = _run(t_eval=np.linspace(0, 5, 2001))
+    gaps = np.array([handler.gap(ti, y[:, i]) for i, ti in enumerate(t)])
+    assert gaps.min() > -1e-8
+
+
+@pytest.mark.parametrize('e', [1.0, 0.7])
+def test_impulse_keeps_momentum_and_loses_the_right_energy(e):
+    handler = CollisionHandler(LatoPivotModel(e=e))
+    y = np.array([0.05, 1.3, -0.05, -0.4])
+    after = handler.apply_impulse(y)
+    np.testing.assert_array_equal(after[[0, 2]], y[[0, 2]])
+    assert after[1] + after[3] == pytest.approx(y[1] + y[3])
+    # Relative velocity reverses, scaled by e
+    assert after[3] - after[1] == pytest.approx(-e * (y[3] - y[1]))
+
+
+def test_sparse_output_grid_finds_the_same_contacts():
+    _, (_, _, dense_hits) = _run(t_eval=np.linspace(0, 5, 2001))
+    _, (t, y, sparse_hits) = _run(t_eval=np.linspace(0, 5, 5))
+    np.testing.assert_allclose(sparse_hits, dense_hits, atol=1e-8)
+    assert y.shape == (4, len(t))
+
+
+def test_contacts_between_output_points():
+    # Several impacts between two output samples: solve_ivp then returns empty lists
+    handler = CollisionHandler(LatoPivotModel(e=0.9, A=0.2))
+    t, y, t_collisions = handler.simulate(Integrator(rtol=1e-8, atol=1e-10), (0, 10), t_eval=np.linspace(0, 10, 5))
+    assert len(t_collisions) > 4
+    np.testing.assert_allclose(t, np.linspace(0, 10, 5))
+    assert y.shape == (4, 5)
@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+
+from physics_core import PendulumChain, sweep_and_prune
+from physics_core.contacts import independent_pairs
+
+
+def _brute_force_1d(x, reach):
+    return {(min(a, b), max(a, b)) for a in range(len(x)) for b in range(a + 1, len(x)) if abs(x[a] - x[b]) < reach}
+
+
+def _pairs(i, j):
+    return {(min(a, b), max(a, b)) for a, b in zip(i.tolist(), j.tolist())}
+
+
+def test_sweep_and_prune_matches_brute_force():
+    rng = np.random.default_rng(3)
+    x = rng.uniform(0, 10, 300)
+    order = None
+    for _ in range(5):
+        i, j, order = sweep_and_prune(x, 0.1, order)
+        assert len(i) == len(_pairs(i, j))
+        assert _pairs(i, j) == _brute_force_1d(x, 0.1)
+        # Reusing the order of the previous call after a small move
+        x = x + rng.normal(scale=0.05, size=len(x))
+
+
+def test_sweep_and_prune_edge_cases():
+    i, j, _ = sweep_and_prune(np.array([0.0, 1.0, 1.0]), 0.5)
+    assert _pairs(i, j) == {(1, 2)}
+    i, j, _ = sweep_and_prune(np.array([0.0, 0.5]), 0.5)
+    assert len(i) == 0
+    i, j, _ = sweep_and_prune(np.array([0.0]), 1.0)
+    assert len(i) == 0
+
+
+def test_independent_pairs_use_each_ball_once():
+    i = np.array([0, 1, 2, 3, 5])
+    j = np.array([1, 2, 3, 4, 6])
+    # A pair is kept when it is the first one of both its balls; later passes pick up the rest
+    np.testing.assert_array_equal(independent_pairs(i, j, 7), [True, False, False, False, True])
+    keep = independent_pairs(i, j, 7)
+    balls = np.concatenate([i[keep], j[keep]])
+    assert len(balls) == len(set(balls.tolist()))
+
+
+def test_newtons_cradle_passes_the_swing_to_the_last_ball():
+    chain = PendulumChain(n_balls=5, e=1.0)
+    theta0 = np.zeros(5)
+    theta0[0] = -0.3
+    # First contact after about a quarter period; the last ball swings out and back for half a period
+    t, theta, z = chain.run(1.4, dt=1e-4, theta0=theta0)
+    assert chain.n_impulses >= 4
+    after = t > 0.6
+    assert np.abs(theta[after, :4]).max() < 1e-3
+    assert theta[after, 4].max() == pytest.approx(0.3, rel=1e-3)
+
+
+def test_chain_energy_with_elastic_contacts():
+    chain = PendulumChain(n_balls=4, e=1.0, m=[0.1, 0.2, 0.1, 0.3])
+    t, theta, z = chain.run(3.0, dt=1e-4, theta0=[-0.4, 0.0, 0.1, 0.3])
+    energy = (chain.m * (0.5 * chain.L**2 * z**2 + chain.g * chain.L * (1 - np.cos(theta)))).sum(axis=1)
+    assert chain.n_impulses > 0
+    np.testing.assert_allclose(energy, energy[0], rtol=1e-3)
+    # Balls never pass through each other
+    bx = chain.pivot_x + chain.L * np.sin(theta)
+    assert np.all(np.diff(bx, axis=1) > 2 * chain.r_ball * 0.9)
+
+
+def test_inelastic_chain_loses_energy():
+    chain = PendulumChain(n_balls=3, e=0.5)
+    t, theta, z = chain.run(2.0, dt=1e-4, theta0=[-0.3, 0.0, 0.0])
+    energy = (0.5 * chain.L**2 * z**2 + chain.g * chain.L * (1 - np.cos(theta))).sum(axis=1)
+    assert energy[-1] < 0.9 * energy[0]
+
+
+def _impulse_reference(p1, p2, v1, v2, m1, m2, e, contact):
+    # One pair at a time, straight from the restitution law along the line of centres
+    n = p2 - p1
+    dist = np.linalg.norm(n)
+    n = n / dist
+    vn = np.dot(v2 - v1, n)
+    if dist >= contact or vn >= 0:
+        return v1, v2, False
+    J = -(1 + e) * vn / (1 / m1 + 1 / m2)
+    return v1 - J / m1 * n, v2 + J / m2 * n, True
+
+
+def test_impulse_solver_matches_per_pair_reference():
+    from physics_core import ImpulseSolver2D
+
+    rng = np.random.default_rng(5)
+    n = 500
+    m1, m2, e = rng.uniform(0.05, 0.5, n), rng.uniform(0.05, 0.5, n), rng.uniform(0.3, 1.0, n)
+    x1, y1 = rng.uniform(-1, 1, n), rng.uniform(-1, 1, n)
+    angle = rng.uniform(0, 2 * np.pi, n)
+    gap = rng.uniform(0.05, 0.15, n)
+    x2, y2 = x1 + gap * np.cos(angle), y1 + gap * np.sin(angle)
+    v = rng.normal(size=(4, n))
+    solver = ImpulseSolver2D(capacity=n + 10, m1=np.r_[m1, np.ones(10)], m2=np.r_[m2, np.ones(10)],
+                             e=np.r_[e, np.ones(10)], radius=0.05)
+    vx1, vy1, vx2, vy2 = (row.copy() for row in v)
+    hits = solver.resolve(x1, y1, vx1, vy1, x2, y2, vx2, vy2)
+
+    expected_hits = 0
+    for k in range(n):
+        w1, w2, hit = _impulse_reference(np.array([x1[k], y1[k]]), np.array([x2[k], y2[k]]), v[0:2, k], v[2:4, k],
+                                         m1[k], m2[k], e[k], 0.1)
+        expected_hits += hit
+        np.testing.assert_allclose([vx1[k], vy1[k]], w1, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose([vx2[k], vy2[k]], w2, rtol=1e-12, atol=1e-12)
+    assert hits == expected_hits > 0
+    # Momentum is conserved pair by pair
+    np.testing.assert_allclose(m1 * vx1 + m2 * vx2, m1 * v[0] + m2 * v[2], atol=1e-12)
+    np.testing.assert_allclose(m1 * vy1 + m2 * vy2, m1 * v[1] + m2 * v[3], atol=1e-12)
+
+
+def test_impulse_solver_capacity():
+    from physics_core import ImpulseSolver2D
+
+    solver = ImpulseSolver2D(capacity=2)
+    with pytest.raises(ValueError):
+        solver.resolve(*np.zeros((8, 3)))
+    assert solver.resolve(*np.zeros((8, 0))) == 0
+
+
+def _brute_force_2d(x, y, reach):
+    d2 = (x[:, None] - x[None]) ** 2 + (y[:, None] - y[None]) ** 2
+    a, b = np.nonzero(np.triu(d2 < reach**2, k=1))
+    return _pairs(a, b)
+
+
+def test_spatial_hash_matches_brute_force_over_repeated_calls():
+    from physics_core import SpatialHash
+
+    rng = np.random.default_rng(7)
+    grid = SpatialHash(0.1)
+    x, y = rng.uniform(-3, 2, 800), rng.uniform(-1, 4, 800)
+    for step in range(6):
+        i, j = grid.pairs(x, y)
+        assert np.all(i != j)
+        assert len(i) == len(_pairs(i, j))
+        assert _pairs(i, j) == _brute_force_2d(x, y, 0.1)
+        assert grid.n_candidates >= len(i)
+        x = x + rng.normal(scale=0.03, size=len(x))
+        y = y + rng.normal(scale=0.03, size=len(y))
+        if step == 3:
+            # A different number of points starts the order afresh
+            x, y = x[:500], y[:500]
+
+
+def test_spatial_hash_clusters_and_tiny_inputs():
+    from physics_core import SpatialHash
+
+    grid = SpatialHash(1.0)
+    x = np.array([0.0, 0.0, 0.5, 10.0, 10.9, 0.99])
+    y = np.array([0.0, 0.0, 0.5, 10.0, 10.9, -0.05])
+    assert _pairs(*grid.pairs(x, y)) == _brute_force_2d(x, y, 1.0)
+    assert len(grid.pairs(x[:1], y[:1])[0]) == 0
+
+
+def _cloud():
+    from physics_core import PendulumCloud
+
+    rng = np.random.default_rng(11)
+    # Pivots close enough together that neighbours of different length meet at an angle
+    px, py = np.meshgrid(np.arange(4) * 0.12, np.arange(3) * 0.05)
+    pivots = np.column_stack([px.ravel(), py.ravel()])
+    L = 0.8 + 0.1 * np.arange(len(pivots))
+    cloud = PendulumCloud(pivots, L=L, m=rng.uniform(0.05, 0.2, len(pivots)), r_ball=0.04, e=1.0)
+    return cloud, rng.uniform(-0.4, 0.4, len(pivots))
+
+
+def _cloud_energy(cloud, theta, z):
+    return (cloud.m * (0.5 * cloud.L**2 * z**2 + cloud.g * cloud.L * (1 - np.cos(theta)))).sum(axis=1)
+
+
+def test_pendulum_cloud_keeps_energy_with_elastic_contacts():
+    cloud, theta0 = _cloud()
+    t, theta, z = cloud.run(2.0, dt=1e-4, theta0=theta0)
+    energy = _cloud_energy(cloud, theta, z)
+    assert cloud.n_impulses > 0
+    np.testing.assert_allclose(energy, energy[0], rtol=2e-3)
+    # The same contacts with e < 1 do take energy out
+    cloud.e = 0.3
+    t, theta, z = cloud.run(2.0, dt=1e-4, theta0=theta0)
+    energy = _cloud_energy(cloud, theta, z)
+    assert energy[-1] < 0.97 * energy[0]
+
+
+def test_pendulum_cloud_positions():
+    cloud, theta0 = _cloud()
+    anchors, balls = cloud.positions(np.array([0.0, 1.0]), np.stack([theta0, theta0]))
+    assert anchors.shape == balls.shape == (2, len(theta0), 2)
+    np.testing.assert_allclose(np.hypot(*(balls - anchors).transpose(2, 0, 1)), np.broadcast_to(cloud.L, (2, 12)))
+    xmin, xmax, ymin, ymax = cloud.extent()
+    assert xmax - xmin == pytest.approx(ymax - ymin)
+    assert xmin <= balls[..., 0].min() and balls[..., 0].max() <= xmax
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from physics_core import CollisionHandler, DenseTrajectory, Integrator, LatoPivotModel, VSpringModel
+
+
+@pytest.mark.parametrize('method', ['RK23', 'RK45', 'DOP853', 'Radau', 'BDF', 'LSODA'])
+def test_table_reproduces_the_solver_interpolant(method):
+    model = VSpringModel(F0=10.0)
+    sol = Integrator(method=method, rtol=1e-6, atol=1e-8).solve(model, (0, 5), dense_output=True)
+    traj = DenseTrajectory.from_solution(sol)
+    assert traj.n_steps == len(sol.t) - 1 and traj.n_state == 4
+    t = np.random.default_rng(0).uniform(0, 5, 2000)
+    expected = sol.sol(t)
+    np.testing.assert_allclose(traj(t), expected, rtol=0, atol=1e-9 * np.abs(expected).max())
+    np.testing.assert_allclose(traj(sol.t), sol.y, rtol=0, atol=1e-9 * np.abs(sol.y).max())
+
+
+def test_scalar_times_resample_and_float32():
+    sol = Integrator().solve(VSpringModel(), (0, 4), dense_output=True)
+    traj = DenseTrajectory.from_solution(sol)
+    assert traj(1.5).shape == (4,)
+    np.testing.assert_allclose(traj(1.5), sol.sol(1.5), atol=1e-9)
+    t, y = traj.resample(0.1)
+    assert len(t) == 41 and t[-1] == pytest.approx(4.0) and y.shape == (4, 41)
+    t, _ = traj.resample(0.25, 1.0, 2.0)
+    np.testing.assert_allclose(t, [1.0, 1.25, 1.5, 1.75, 2.0])
+    small = DenseTrajectory.from_solution(sol.sol, dtype=np.float32)
+    assert small.nbytes < traj.nbytes
+    np.testing.assert_allclose(small(t), traj(t), rtol=1e-5, atol=1e-5)
+    with pytest.raises(ValueError):
+        DenseTrajectory.from_solution(Integrator().solve(VSpringModel(), (0, 1)))
+
+
+def test_save_and_load(tmp_path):
+    sol = Integrator(method='DOP853').solve(LatoPivotModel(), (0, 3), dense_output=True)
+    traj = DenseTrajectory.from_solution(sol)
+    path = str(tmp_path / 'dense.traj')
+    traj.save(path, attrs={'model': 'lato_pivot'})
+    loaded = DenseTrajectory.load(path)
+    np.testing.assert_array_equal(loaded.breaks, traj.breaks)
+    np.testing.assert_array_equal(loaded.coef, traj.coef)
+    with pytest.raises(FileExistsError):
+        traj.save(path)
+    traj.save(path, overwrite=True)
+
+
+def test_collision_run_matches_sampled_simulate():
+    handler = CollisionHandler(LatoPivotModel(e=0.9))
+    integrator = Integrator(rtol=1e-8, atol=1e-10)
+    t_eval = np.linspace(0, 4, 801)
+    t, y, hits = handler.simulate(integrator, (0, 4), t_eval=t_eval)
+    traj, dense_hits = handler.simulate_dense(integrator, (0, 4))
+    assert len(hits) > 0
+    np.testing.assert_array_equal(dense_hits, hits)
+    np.testing.assert_allclose(traj(t), y, atol=1e-8)
+    # At the contact time itself the table gives the post-impact velocities
+    before, after = traj(hits[0] - 1e-9), traj(hits[0])
+    assert np.sign(after[1] - after[3]) != np.sign(before[1] - before[3])
+
+
+def test_concatenate_needs_a_step():
+    with pytest.raises(ValueError, match="nothing to concatenate"):
+        DenseTrajectory.concatenate([])
+    empty = DenseTrajectory([1.0], np.zeros((0, 4, 3)))
+    with pytest.raises(ValueError, match="nothing to concatenate"):
+        DenseTrajectory.concatenate([empty, empty])
+    sol = Integrator().solve(VSpringModel(), (0, 1), dense_output=True)
+    traj = DenseTrajectory.from_solution(sol)
+    joined = DenseTrajectory.concatenate([empty, traj])
+    np.testing.assert_array_equal(joined.coef, traj.coef)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from physics_core import VSpringModel, frequency_response, run_ensemble
+
+PARAMS = np.array([
+    [10.0, 1.0, 1.0, 0.0, -1.0],
+    [10.0, 1.0, 3.0, 0.1, -1.0],
+    [20.0, 5.0, 2.0, 0.0, -0.8],
+])
+
+
+def _reference(row, t):
+    from scipy.integrate import odeint
+
+    k, F0, omega, x0, y0 = row
+    model = VSpringModel(k=k, F0=F0, omega=omega)
+    return odeint(model.rhs, [x0, y0, 0.0, 0.0], t, tfirst=True, rtol=1e-10, atol=1e-12)
+
+
+def test_members_match_direct_odeint():
+    t = np.linspace(0, 5, 501)
+    result = run_ensemble(PARAMS, t, workers=1, rtol=1e-10, atol=1e-12)
+    try:
+        assert len(result) == 3
+        assert result.states.shape == (3, len(t), 4)
+        for i, row in enumerate(PARAMS):
+            np.testing.assert_allclose(result.states[i], _reference(row, t), atol=1e-6)
+    finally:
+        result.close()
+    assert result.states is None
+
+
+def test_process_pool_gives_the_same_states():
+    t = np.linspace(0, 2, 201)
+    serial = run_ensemble(PARAMS, t, workers=1, chunk_size=1)
+    pooled = run_ensemble(PARAMS, t, workers=2, chunk_size=2)
+    try:
+        np.testing.assert_array_equal(serial.states, pooled.states)
+    finally:
+        serial.close()
+        pooled.close()
+
+
+def test_rejects_wrong_columns():
+    with pytest.raises(ValueError):
+        run_ensemble(np.zeros((2, 4)), np.linspace(0, 1, 11), workers=1)
+
+
+def test_amplitude_of_steady_state():
+    t = np.linspace(0, 10, 1001)
+    result = run_ensemble(PARAMS[:1], t, workers=1)
+    try:
+        result.states[0, :, 1] = 0.3 * np.sin(2 * np.pi * t)
+        np.testing.assert_allclose(result.amplitude(component=1), [0.3], rtol=1e-3)
+    finally:
+        result.close()
+
+
+def test_frequency_response_shape_and_values():
+    omegas = np.array([0.5, 1.5])
+    single = frequency_response(omegas, k=10.0, F0=1.0, t_max=4.0, dt=0.02, workers=1)
+    assert single.shape == (2,)
+    sweep = frequency_response(omegas, k=[10.0, 20.0], F0=1.0, t_max=4.0, dt=0.02, workers=1)
+    assert sweep.shape == (2, 2)
+    np.testing.assert_allclose(sweep[0], single)
+    assert np.all(sweep > 0)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from physics_core import MODELS, Integrator, VSpringModel, get_model
+from physics_core.integrators import _finite_difference_jacobian
+
+WITH_JACOBIAN = [name for name, cls in MODELS.items() if cls.jac_kernel is not None]
+
+
+@pytest.mark.parametrize('name', WITH_JACOBIAN)
+def test_analytic_jacobian_matches_finite_differences(name):
+    rng = np.random.default_rng(1)
+    model = get_model(name)
+    for _ in range(3):
+        y = model.y0() + rng.normal(scale=0.2, size=model.n_state)
+        np.testing.assert_allclose(model.jacobian(0.4, y), _finite_difference_jacobian(model, 0.4, y),
+                                   rtol=1e-5, atol=1e-5)
+
+
+def test_damped_v_spring_jacobian():
+    model = VSpringModel(k=50.0, c=3.0)
+    y = np.array([0.2, -0.9, 0.5, -0.3])
+    J = model.jacobian(1.0, y)
+    np.testing.assert_allclose(J, _finite_difference_jacobian(model, 1.0, y), rtol=1e-5, atol=1e-5)
+    np.testing.assert_allclose(np.diag(J)[2:], -3.0)
+
+
+def test_models_without_jacobian_report_it():
+    model = get_model('lato_polar')
+    assert not model.has_jacobian
+    with pytest.raises(NotImplementedError):
+        model.jacobian(0.0, model.y0())
+
+
+def test_auto_keeps_rk45_for_undamped_stiff_springs():
+    # Large k only makes the oscillation faster, eigenvalues stay imaginary
+    model = VSpringModel(k=1e4)
+    t = np.arange(0, 1, 0.01)
+    assert Integrator().choose_method(model, (0, 1), model.y0(), t) == 'RK45'
+
+
+def test_auto_switches_to_stiff_method_for_heavy_damping():
+    model = VSpringModel(k=1e4, c=1e5)
+    t = np.arange(0, 2, 0.01)
+    integrator = Integrator()
+    assert integrator.choose_method(model, (0, 2), model.y0(), t) == 'Radau'
+    assert Integrator(stiff_method='BDF').choose_method(model, (0, 2), model.y0(), t) == 'BDF'
+    sol = integrator.solve(model, (0, 2), t_eval=t)
+    assert sol.success
+    assert sol.nfev < 5000
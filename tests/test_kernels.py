@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from physics_core import kernels
+
+STATES = [np.array([0.1, 0.0, -0.1, 0.0]), np.array([0.7, -1.2, 0.3, 2.1]), np.array([-2.5, 0.4, 1.9, -0.6])]
+T = (0.0, 0.37, 12.5)
+
+
+@pytest.mark.parametrize('t', T)
+@pytest.mark.parametrize('y', STATES)
+def test_lato_pivot_kernel_matches_reference(t, y):
+    np.testing.assert_allclose(kernels.lato_pivot_rhs()(t, y), kernels._lato_pivot_reference(t, y), rtol=1e-13)
+
+
+@pytest.mark.parametrize('t', T)
+@pytest.mark.parametrize('y', STATES)
+def test_lato_polar_kernel_matches_reference(t, y):
+    y = y.copy()
+    y[0] = abs(y[0]) + 0.5  # r > 0
+    np.testing.assert_allclose(kernels.lato_polar_rhs()(t, y), kernels._lato_polar_reference(t, y), rtol=1e-13)
+
+
+@pytest.mark.parametrize('t', T)
+@pytest.mark.parametrize('y', STATES)
+def test_v_spring_kernel_matches_reference(t, y):
+    np.testing.assert_allclose(kernels.v_spring_rhs()(t, y), kernels._v_spring_reference(t, y), rtol=1e-13)
+
+
+def test_lato_rigid_kernel_matches_vectorized_form():
+    from physics_core import LatoRigidModel
+
+    model = LatoRigidModel(A_drive=0.3, omega_drive=2.7)
+    Y = np.stack(STATES, axis=1)
+    expected = model.batch_rhs()(0.9, Y, np.empty_like(Y))
+    for i, y in enumerate(STATES):
+        np.testing.assert_allclose(kernels.lato_rigid_rhs(A_drive=0.3, omega_drive=2.7)(0.9, y), expected[:, i],
+                                   rtol=1e-13)
+
+
+def test_reuse_out_writes_into_one_array():
+    rhs = kernels.v_spring_rhs(reuse_out=True)
+    first = rhs(0.0, STATES[1])
+    second = rhs(1.0, STATES[2])
+    assert first is second
+    fresh = kernels.v_spring_rhs()
+    assert fresh(0.0, STATES[1]) is not fresh(0.0, STATES[1])
+
+
+@pytest.mark.parametrize('kernel', [kernels.lato_pivot_kernel, kernels.v_spring_kernel])
+def test_compiled_and_python_kernels_agree(kernel):
+    n_params = {kernels.lato_pivot_kernel: 4, kernels.v_spring_kernel: 7}[kernel]
+    params = np.linspace(0.5, 2.0, n_params)
+    y = STATES[1]
+    compiled = kernels.compiled(kernel)(0.3, y, np.empty(4), *params)
+    python = kernel.py_func(0.3, y, np.empty(4), *params)
+    np.testing.assert_allclose(compiled, python, rtol=1e-14)
@@ -0,0 +1,147 @@
+import time
+
+import numpy as np
+import pytest
+
+from physics_core import LatoPivotModel, LiveSimulation, LiveViewer, StateRing, VSpringModel
+from physics_core.live import model_stepper
+
+
+def test_ring_latest_and_since_across_wrap_around():
+    ring = StateRing(2, capacity=8)
+    assert ring.latest() is None
+    assert ring.since(0)[0] == 0 and len(ring.since(0)[1]) == 0
+    for k in range(5):
+        ring.push(0.1 * k, [k, -k])
+    count, t, values = ring.latest()
+    assert count == 5 and t == pytest.approx(0.4)
+    np.testing.assert_array_equal(values, [4, -4])
+    count, t, values = ring.since(2)
+    assert count == 5
+    np.testing.assert_allclose(t, [0.2, 0.3, 0.4])
+    np.testing.assert_array_equal(values[:, 0], [2, 3, 4])
+
+    for k in range(5, 20):
+        ring.push(0.1 * k, [k, -k])
+    assert ring.latest()[0] == 20
+    np.testing.assert_array_equal(ring.latest()[2], [19, -19])
+    # A reader far behind only gets the newest capacity - 1 rows
+    count, t, values = ring.since(3)
+    assert count == 20
+    np.testing.assert_array_equal(values[:, 0], np.arange(13, 20))
+    assert len(ring.since(20)[1]) == 0
+
+
+def test_shared_ring_is_visible_under_its_name():
+    ring = StateRing(3, capacity=4, shared=True)
+    try:
+        reader = StateRing(3, capacity=4, name=ring.name)
+        assert reader.latest() is None
+        ring.push(1.5, [1.0, 2.0, 3.0])
+        count, t, values = reader.latest()
+        assert (count, t) == (1, 1.5)
+        np.testing.assert_array_equal(values, [1.0, 2.0, 3.0])
+        reader.close()
+    finally:
+        ring.close()
+    assert StateRing(3).name is None
+
+
+def test_model_stepper_is_fourth_order():
+    model = VSpringModel(F0=10.0)
+
+    def final(dt):
+        step, y = model_stepper(model), model.y0()
+        for k in range(int(round(1.0 / dt))):
+            y = step(k * dt, y, dt)
+        return y
+
+    reference = final(1e-4)
+    ratio = np.abs(final(0.02) - reference).max() / np.abs(final(0.01) - reference).max()
+    assert 12 < ratio < 20
+
+
+def test_model_stepper_updates_in_place():
+    model = VSpringModel(F0=10.0)
+    y = model.y0()
+    k1 = model.rhs(0.5, y)
+    k2 = model.rhs(0.55, y + 0.05 * k1)
+    k3 = model.rhs(0.55, y + 0.05 * k2)
+    k4 = model.rhs(0.6, y + 0.1 * k3)
+    expected = y + 0.1 / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    assert model_stepper(model)(0.5, y, 0.1) is y
+    np.testing.assert_allclose(y, expected, rtol=1e-14)
+
+
+def _wait_for(ring, count, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while ring.count < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return ring.count >= count
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process'])
+def test_simulation_publishes_until_stopped(mode):
+    model = LatoPivotModel()
+    ring = StateRing(model.n_state, shared=mode == 'process')
+    try:
+        sim = LiveSimulation(model_stepper(model), model.y0(), ring, dt=1e-3, publish_every=5, speed=None, mode=mode)
+        with sim:
+            assert _wait_for(ring, 50)
+        stopped = ring.count
+        time.sleep(0.05)
+        assert ring.count == stopped
+        count, t, values = ring.latest()
+        assert t == pytest.approx(5e-3 * (count - 1))
+        assert np.all(np.isfinite(values))
+        # The final state is visible in this process in both modes
+        np.testing.assert_array_equal(sim.state, values)
+    finally:
+        ring.close()
+
+
+def test_real_time_pacing():
+    ring = StateRing(1)
+    sim = LiveSimulation(lambda t, y, dt: y + dt, np.zeros(1), ring, dt=0.01, publish_every=1, speed=1.0)
+    with sim:
+        time.sleep(0.2)
+    # About 0.2 s simulated, never far ahead of the clock
+    assert 0.05 < ring.latest()[1] < 0.35
+
+
+def test_bad_modes():
+    with pytest.raises(ValueError):
+        LiveSimulation(None, None, StateRing(1), 0.1, mode='fiber')
+    with pytest.raises(ValueError):
+        LiveSimulation(None, None, StateRing(1), 0.1, mode='process')
+
+
+def test_viewer_draws_only_new_states():
+    model = LatoPivotModel()
+    ring = StateRing(model.n_state)
+    ring.push(0.0, model.y0())
+    viewer = LiveViewer(model, ring)
+    viewer._setup()
+    viewer.canvas.draw()
+    assert len(viewer.lines) == 2
+    viewer.update()
+    viewer.update()
+    assert viewer.frames == 1
+    for k in range(1, 4):
+        ring.push(0.01 * k, model.y0())
+    viewer.update()
+    assert (viewer.frames, viewer.skipped) == (2, 2)
+    assert viewer.clock.get_text() == "t = 0.03 s"
+
+
+def test_process_mode_keeps_state_when_publishing_a_part():
+    ring = StateRing(1, shared=True)
+    try:
+        state = np.zeros(2)
+        sim = LiveSimulation(lambda t, y, dt: y + dt, state, ring, dt=0.01, publish_every=1, speed=None,
+                             publish=lambda y: y[:1], mode='process')
+        with sim:
+            assert _wait_for(ring, 5)
+        assert sim.state is state
+    finally:
+        ring.close()
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from physics_core import MODELS, Integrator, LatoPivotModel, VSpringModel, get_model, kernels
+
+
+def test_get_model_by_name_with_parameters():
+    model = get_model('v_spring', F0=10.0)
+    assert isinstance(model, VSpringModel)
+    assert model.F0 == 10.0
+    assert model.k == VSpringModel.defaults['k']
+
+
+def test_unknown_model_and_parameter():
+    with pytest.raises(ValueError):
+        get_model('no_such_model')
+    with pytest.raises(TypeError):
+        LatoPivotModel(mass=1.0)
+    with pytest.raises(AttributeError):
+        LatoPivotModel().not_a_constant
+
+
+def test_y0_is_a_fresh_array():
+    model = LatoPivotModel()
+    y0 = model.y0()
+    y0[0] = 99.0
+    assert model.y0()[0] == LatoPivotModel.initial_state[0]
+
+
+@pytest.mark.parametrize('name', list(MODELS))
+def test_rhs_and_rhs_into_agree(name):
+    model = get_model(name)
+    y = model.y0() + 0.1
+    out = np.empty(model.n_state)
+    assert model.rhs_into(0.4, y, out) is out
+    np.testing.assert_array_equal(out, model.rhs(0.4, y))
+
+
+@pytest.mark.parametrize('name', list(MODELS))
+def test_positions_have_renderer_shape(name):
+    model = get_model(name)
+    t = np.linspace(0, 1, 6)
+    y = np.repeat(model.y0()[:, None], len(t), axis=1)
+    anchors, balls = model.positions(t, y)
+    assert anchors.shape == balls.shape
+    assert anchors.shape[0] == len(t) and anchors.shape[2] == 2
+    xmin, xmax, ymin, ymax = model.extent()
+    assert xmin <= balls[..., 0].min() and balls[..., 0].max() <= xmax
+    assert ymin <= balls[..., 1].min() and balls[..., 1].max() <= ymax
+
+
+def test_pivot_model_balls_hang_at_string_length():
+    model = LatoPivotModel(L=0.8)
+    t = np.linspace(0, 3, 50)
+    y = np.vstack([np.sin(t), np.zeros_like(t), -np.cos(t), np.zeros_like(t)])
+    anchors, balls = model.positions(t, y)
+    np.testing.assert_allclose(np.linalg.norm(balls - anchors, axis=-1), 0.8)
+
+
+def test_solve_matches_odeint_of_the_original_script():
+    from scipy.integrate import odeint
+
+    t = np.arange(0, 5, 0.01)
+    model = VSpringModel()
+    sol = Integrator(method='RK45', rtol=1e-10, atol=1e-12).solve(model, (0, t[-1]), t_eval=t)
+    reference = odeint(kernels._v_spring_reference, model.y0(), t, tfirst=True, rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(sol.y.T, reference, atol=1e-6)
+
+
+def test_explicit_method_is_kept():
+    model = VSpringModel()
+    assert Integrator(method='DOP853').choose_method(model, (0, 1), model.y0()) == 'DOP853'
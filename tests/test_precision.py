@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+import physics_core
+from physics_core import BowlGrid, Integrator, LatoRigidModel, WaveSolver, get_dtype, set_precision, using_precision
+
+
+def test_precision_module_is_not_shadowed():
+    import physics_core.precision as module
+
+    assert module.__name__ == 'physics_core.precision'
+    assert physics_core.using_precision is module.using_precision
+
+
+def test_using_precision_restores_the_previous_setting():
+    assert get_dtype() is np.float64
+    with using_precision('float32'):
+        assert get_dtype() is np.float32
+        with pytest.raises(RuntimeError):
+            with using_precision(np.float64):
+                assert get_dtype() is np.float64
+                raise RuntimeError
+        assert get_dtype() is np.float32
+    assert get_dtype() is np.float64
+
+
+def test_unsupported_precision():
+    with pytest.raises(ValueError):
+        set_precision('float16')
+    assert get_dtype() is np.float64
+
+
+def test_engines_follow_the_global_precision():
+    with using_precision('float32'):
+        assert WaveSolver(BowlGrid(grid_points=20)).u.dtype == np.float32
+        traj = Integrator().solve_batch(LatoRigidModel(), np.linspace(0, 1, 11), omega_drive=[1.0, 2.0])
+        assert traj.dtype == np.float32
+    assert WaveSolver(BowlGrid(grid_points=20), dtype=np.float32).u.dtype == np.float32
+
+
+def test_float32_drift_stays_small():
+    from physics_core.precision import compare
+
+    def sweep():
+        return Integrator().solve_batch(LatoRigidModel(), np.linspace(0, 5, 501), omega_drive=np.linspace(1, 3, 8))
+
+    report = compare(sweep)
+    assert report['bytes_float32'] * 2 == report['bytes_float64']
+    assert report['max_rel_error'] < 1e-4
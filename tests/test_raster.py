@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from physics_core.raster import (ANCHOR, BACKGROUND, SCENE_PALETTE, STRING, FrameRasterizer, field_to_indices,
+                                 render_frames, save_gif)
+
+EXTENT = (-2.0, 2.0, -2.0, 2.0)
+
+
+def _scene(n_frames=20):
+    t = np.linspace(0, 2 * np.pi, n_frames)
+    anchors = np.zeros((n_frames, 2, 2))
+    anchors[:, 1, 0] = 0.5
+    balls = anchors + np.stack([np.sin(t), -np.cos(t)], axis=-1)[:, None, :]
+    return anchors, balls
+
+
+def test_pixels_of_anchor_string_and_ball():
+    rasterizer = FrameRasterizer(EXTENT, size=101, ball_radius=0.1)
+    anchors = np.array([[0.0, 1.0]])
+    balls = np.array([[0.0, -1.0]])
+    frame = rasterizer.draw(anchors, balls)
+    row, col = rasterizer.to_pixel(balls[0])
+    assert frame[row, col] == 3  # first ball color
+    row, col = rasterizer.to_pixel(anchors[0])
+    assert frame[row, col] == ANCHOR
+    row, col = rasterizer.to_pixel(np.array([0.0, 0.0]))
+    assert frame[row, col] == STRING
+    assert frame[0, 0] == BACKGROUND
+
+
+def test_to_pixel_maps_the_extent_corners():
+    rasterizer = FrameRasterizer(EXTENT, size=400)
+    rows, cols = rasterizer.to_pixel(np.array([[-2.0, 2.0], [2.0, -2.0]]))
+    np.testing.assert_array_equal(rows, [0, 399])
+    np.testing.assert_array_equal(cols, [0, 399])
+
+
+def test_positions_outside_the_frame_are_clipped():
+    rasterizer = FrameRasterizer(EXTENT, size=50)
+    frame = rasterizer.draw(np.array([[0.0, 0.0]]), np.array([[10.0, -10.0]]))
+    assert frame.shape == (50, 50)
+
+
+def test_process_pool_gives_the_same_frames():
+    anchors, balls = _scene(40)
+    rasterizer = FrameRasterizer(EXTENT, size=64)
+    serial = render_frames(rasterizer, anchors, balls, workers=1)
+    parallel = render_frames(rasterizer, anchors, balls, workers=2, chunk_size=8)
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_gif_round_trip(tmp_path):
+    from PIL import Image
+
+    anchors, balls = _scene(12)
+    frames = FrameRasterizer(EXTENT, size=64).render(anchors, balls)
+    filename = tmp_path / 'scene.gif'
+    save_gif(iter(frames), str(filename), fps=25)
+    with Image.open(filename) as image:
+        assert image.n_frames == len(frames)
+        image.seek(5)
+        np.testing.assert_array_equal(np.asarray(image.convert('RGB')), SCENE_PALETTE[frames[5]])
+
+
+@pytest.mark.parametrize('value, index', [(-1.0, 0), (1.0, 255), (-5.0, 0), (5.0, 255), (0.0, 127)])
+def test_field_to_indices(value, index):
+    assert field_to_indices(np.full((2, 2), value))[0, 0] == index
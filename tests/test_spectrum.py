@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from physics_core import StreamingSpectrum
+
+
+def _signal(n, fs=1000.0):
+    t = np.arange(n) / fs
+    rng = np.random.default_rng(0)
+    return 2.0 + np.sin(2 * np.pi * 3.0 * t) + 0.3 * np.sin(2 * np.pi * 75.0 * t) + 0.05 * rng.normal(size=n)
+
+
+@pytest.mark.parametrize('window', ['hann', 'boxcar'])
+def test_welch_matches_scipy(window):
+    from scipy.signal import welch
+
+    x = _signal(20000)
+    analyzer = StreamingSpectrum(fs=1000.0, nperseg=1024, window=window)
+    analyzer.feed(x)
+    freqs, psd = analyzer.welch()
+    ref_freqs, ref_psd = welch(x, fs=1000.0, window=window, nperseg=1024, noverlap=512)
+    np.testing.assert_allclose(freqs, ref_freqs)
+    np.testing.assert_allclose(psd, ref_psd, rtol=1e-9, atol=1e-15)
+
+
+@pytest.mark.parametrize('block', [1, 333, 1000, 7000])
+def test_result_does_not_depend_on_block_size(block):
+    x = _signal(10000)
+    whole = StreamingSpectrum(fs=1000.0, nperseg=512)
+    expected = whole.feed(x)
+    analyzer = StreamingSpectrum(fs=1000.0, nperseg=512)
+    rows = [analyzer.feed(x[i:i + block]) for i in range(0, len(x), block)]
+    np.testing.assert_allclose(np.concatenate(rows), expected, rtol=1e-12, atol=1e-18)
+    np.testing.assert_allclose(analyzer.welch()[1], whole.welch()[1], rtol=1e-12, atol=1e-18)
+    assert analyzer.n_segments == whole.n_segments == len(expected)
+    assert analyzer.n_samples == len(x)
+    np.testing.assert_allclose(analyzer.times, (np.arange(len(expected)) * 256 + 256) / 1000.0)
+
+
+def test_strongest_bin_is_the_drive():
+    analyzer = StreamingSpectrum(fs=1000.0, nperseg=4096)
+    analyzer.feed(_signal(50000))
+    freqs, psd = analyzer.welch()
+    assert abs(freqs[psd.argmax()] - 3.0) <= freqs[1]
+
+
+def test_needs_one_full_segment():
+    analyzer = StreamingSpectrum(fs=100.0, nperseg=64)
+    assert analyzer.feed(np.zeros(63)).shape == (0, 33)
+    with pytest.raises(ValueError):
+        analyzer.welch()
+    assert analyzer.feed(np.zeros(1)).shape == (1, 33)
+
+
+def test_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        StreamingSpectrum(fs=100.0, overlap=1.0)
+    with pytest.raises(ValueError):
+        StreamingSpectrum(fs=100.0, window='kaiser')
+
+
+def test_peak_table_recovers_sines():
+    from physics_core import peak_table
+
+    fs, n = 200.0, 8000
+    t = np.arange(n) / fs
+    freqs = np.array([1.37, 2.9, 4.05])
+    signals = np.stack([1.5 * np.sin(2 * np.pi * f * t) + 0.4 * np.sin(2 * np.pi * 3 * f * t + 0.3) for f in freqs])
+    table = peak_table(signals, fs, n_peaks=2, n_harmonics=3, params=[10.0, 20.0, 30.0])
+    # Parabolic interpolation on a Hann window gets amplitudes to within a few percent
+    np.testing.assert_array_equal(table['param'], [10.0, 20.0, 30.0])
+    np.testing.assert_allclose(table['freq'][:, 0], freqs, atol=2e-3)
+    np.testing.assert_allclose(table['freq'][:, 1], 3 * freqs, atol=2e-3)
+    np.testing.assert_allclose(table['amplitude'][:, 0], 1.5, rtol=0.03)
+    np.testing.assert_allclose(table['amplitude'][:, 1], 0.4, rtol=0.03)
+    np.testing.assert_allclose(table['harmonics'][:, [0, 2]], [[1.5, 0.4]] * 3, rtol=0.03)
+    assert np.all(table['harmonics'][:, 1] < 0.01)
+    # Plain sines under a Hann window are not resolved
+    assert np.all(np.isnan(table['q']))
+
+
+def test_peak_table_q_of_a_ring_down():
+    from physics_core import peak_table
+
+    fs, f0, tau = 100.0, 5.0, 4.0
+    t = np.arange(20000) / fs
+    table = peak_table(np.exp(-t / tau) * np.sin(2 * np.pi * f0 * t), fs, window='boxcar')
+    assert table.shape == (1,)
+    np.testing.assert_allclose(table['freq'][0, 0], f0, atol=1e-2)
+    np.testing.assert_allclose(table['q'][0, 0], np.pi * f0 * tau, rtol=0.05)
+
+
+def test_peak_table_fmin_and_missing_peaks():
+    from physics_core import format_peak_table, peak_table
+
+    fs = 100.0
+    t = np.arange(4000) / fs
+    x = np.sin(2 * np.pi * 0.5 * t) + 0.2 * np.sin(2 * np.pi * 10.0 * t)
+    table = peak_table(x, fs, n_peaks=1, fmin=2.0)
+    np.testing.assert_allclose(table['freq'][0, 0], 10.0, atol=1e-2)
+    empty = peak_table(np.zeros((2, 256)), fs)
+    assert np.all(np.isnan(empty['freq'])) and np.all(np.isnan(empty['harmonics']))
+    lines = format_peak_table(peak_table(np.stack([x, x]), fs, params=[1.0, 2.0]), 'omega').splitlines()
+    assert len(lines) == 3 and lines[0].split()[0] == 'omega'
@@ -0,0 +1,93 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from physics_core import TrajectoryStore, VSpringModel, save_solution
+
+
+def _write(path, blocks, **kwargs):
+    t = np.arange(1000) * 0.01
+    u = np.random.default_rng(0).normal(size=(1000, 3, 2)).astype(np.float32)
+    with TrajectoryStore.create(path, chunk_len=128, **kwargs) as store:
+        for i in range(0, 1000, blocks):
+            store.append(t=t[i:i + blocks], u=u[i:i + blocks])
+        assert len(store) == 1000
+    return t, u
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+@pytest.mark.parametrize('blocks', [1, 100, 1000])
+def test_round_trip(tmp_path, compression, blocks):
+    path = str(tmp_path / 'run.traj')
+    t, u = _write(path, blocks, compression=compression, attrs={'k': np.float64(10.0)})
+    store = TrajectoryStore(path)
+    assert len(store) == 1000
+    assert sorted(store.variables) == ['t', 'u']
+    assert store.shape('u') == (1000, 3, 2)
+    assert store.attrs == {'k': 10.0}
+    np.testing.assert_array_equal(store['t'], t)
+    np.testing.assert_array_equal(store['u'], u)
+    assert store['u'].dtype == np.float32
+    np.testing.assert_array_equal(store.read('u', 120, 400), u[120:400])
+    np.testing.assert_array_equal(np.array(list(store.iter_rows('u'))), u)
+
+
+def test_window_by_time(tmp_path):
+    path = str(tmp_path / 'run.traj')
+    t, u = _write(path, 300)
+    store = TrajectoryStore(path)
+    assert store.index_range(1.275, 2.56) == (128, 257)
+    t_window, u_window = store.window('u', 1.275, 2.56)
+    np.testing.assert_array_equal(t_window, t[128:257])
+    np.testing.assert_array_equal(u_window, u[128:257])
+    assert store.index_range(20.0, 30.0) == (1000, 1000)
+    assert store.index_range(-1.0, 0.0) == (0, 1)
+
+
+def test_uncompressed_window_in_one_chunk_is_memory_mapped(tmp_path):
+    path = str(tmp_path / 'run.traj')
+    _write(path, 1000, compression=None)
+    assert isinstance(TrajectoryStore(path).read('u', 10, 20), np.memmap)
+
+
+def test_interrupted_run_keeps_full_chunks(tmp_path):
+    path = str(tmp_path / 'run.traj')
+    store = TrajectoryStore.create(path, chunk_len=100)
+    store.append(t=np.arange(250.0), y=np.arange(250.0))
+    # No close(): the partial last chunk is lost, the two full ones are readable
+    np.testing.assert_array_equal(TrajectoryStore(path)['y'], np.arange(200.0))
+
+
+def test_misuse(tmp_path):
+    path = str(tmp_path / 'run.traj')
+    with pytest.raises(ValueError):
+        TrajectoryStore.create(path, compression='lz4')
+    store = TrajectoryStore.create(path)
+    with pytest.raises(ValueError):
+        store.append(y=np.zeros(3))
+    store.append(t=np.zeros(3), y=np.zeros(3))
+    with pytest.raises(ValueError):
+        store.append(t=np.zeros(3))
+    with pytest.raises(ValueError):
+        store.append(t=np.zeros(3), y=np.zeros(2))
+    with pytest.raises(ValueError):
+        store.read('y')
+    store.close()
+    with pytest.raises(KeyError):
+        TrajectoryStore(path).read('z')
+    with pytest.raises(FileExistsError):
+        TrajectoryStore.create(path)
+    TrajectoryStore.create(path, overwrite=True).close()
+
+
+def test_save_solution(tmp_path):
+    model = VSpringModel(F0=10.0)
+    sol = model.y0()[:, None] * np.ones(5)
+    store = save_solution(str(tmp_path / 'v.traj'), model, np.arange(5.0), sol, attrs={'note': 'x'})
+    assert store.variables == ['t', 'x', 'y', 'vx', 'vy']
+    np.testing.assert_array_equal(store['y'], sol[1])
+    with open(os.path.join(str(tmp_path / 'v.traj'), 'meta.json')) as f:
+        attrs = json.load(f)['attrs']
+    assert attrs['model'] == 'v_spring' and attrs['params']['F0'] == 10.0 and attrs['note'] == 'x'
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from physics_core import Integrator, LatoPivotModel, VSpringModel, kernels
+from physics_core.symplectic import integrate, integrate_blocks, integrate_model, pendulum_energy
+
+FREE = (9.81, 1.0, 0.0, 0.0)  # driven_pendulum_accel with no drive
+
+
+@pytest.mark.parametrize('method, bound', [('verlet', 1e-3), ('yoshida4', 1e-6)])
+def test_free_pendulum_energy_stays_bounded(method, bound):
+    t, q, p = integrate(kernels.driven_pendulum_accel, FREE, [1.0, 0.3], [0.0, 0.5], 0.01, 20000,
+                        method=method, decimate=10)
+    assert q.shape == (2001, 2)
+    np.testing.assert_allclose(t, np.arange(2001) * 0.1, atol=1e-9)
+    energy = pendulum_energy(q, p)
+    drift = np.abs(energy - energy[0]).max(axis=0) / energy[0]
+    assert np.all(drift < bound)
+
+
+def test_yoshida_converges_at_fourth_order():
+    def final(dt):
+        _, q, _ = integrate(kernels.driven_pendulum_accel, (9.81, 1.0, 0.5, 2.0), [1.0], [0.0], dt,
+                            int(round(2.0 / dt)), method='yoshida4')
+        return q[-1, 0]
+
+    reference = final(1e-4)
+    ratio = abs(final(0.02) - reference) / abs(final(0.01) - reference)
+    assert 12 < ratio < 20
+
+
+def test_blocks_join_up_to_the_whole_run():
+    args = (kernels.driven_pendulum_accel, (9.81, 1.0, 0.5, 2.0), [1.0], [0.0], 0.01, 1000)
+    t, q, p = integrate(*args, method='yoshida4', decimate=5)
+    blocks = list(integrate_blocks(*args, block_steps=300, method='yoshida4', decimate=5))
+    assert [len(block[0]) for block in blocks] == [60, 60, 60, 20]
+    np.testing.assert_allclose(np.concatenate([b[0] for b in blocks]), t[1:], atol=1e-12)
+    np.testing.assert_allclose(np.concatenate([b[1] for b in blocks]), q[1:], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(np.concatenate([b[2] for b in blocks]), p[1:], rtol=1e-12, atol=1e-12)
+    with pytest.raises(ValueError):
+        next(integrate_blocks(*args, block_steps=301, decimate=5))
+
+
+def test_integrate_model_matches_solve_ivp():
+    model = LatoPivotModel()
+    t, y = integrate_model(model, 1e-3, 2000, method='yoshida4', decimate=100)
+    sol = Integrator(rtol=1e-10, atol=1e-12).solve(model, (0, 2), t_eval=t)
+    np.testing.assert_allclose(y, sol.y, atol=1e-7)
+
+
+def test_integrate_model_needs_a_separable_model():
+    with pytest.raises(NotImplementedError):
+        integrate_model(VSpringModel(), 0.01, 10)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        integrate(kernels.driven_pendulum_accel, FREE, [0.1], [0.0], 0.01, 10, method='euler')